@@ -0,0 +1,53 @@
+import json
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+
+from common.scrape_jobs import BackfillJob, ScrapeJobManagerDependency
+from schemas.backfill_schema import BackfillSchema
+
+backfill_router = APIRouter(prefix="/backfill", tags=["backfill"])
+
+
+@backfill_router.post(
+    "/",
+    status_code=202,
+    summary="Submit re-extraction of scraped product data from stored HTML snapshots",
+)
+async def backfill(
+    scrape_job_manager: ScrapeJobManagerDependency, backfill: BackfillSchema
+):
+    return scrape_job_manager.submit(BackfillJob(backfill)).schema()
+
+
+@backfill_router.get("/jobs", summary="Get all backfill jobs")
+async def get_backfill_jobs(scrape_job_manager: ScrapeJobManagerDependency):
+    return [job.schema() for job in scrape_job_manager.get_all(BackfillJob)]
+
+
+@backfill_router.get("/jobs/{job_id}", summary="Get backfill job status by id")
+async def get_backfill_job(scrape_job_manager: ScrapeJobManagerDependency, job_id: str):
+    job = scrape_job_manager.get(job_id, BackfillJob)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Backfill job {job_id} not found")
+    return job.schema()
+
+
+@backfill_router.get("/jobs/{job_id}/events", summary="Stream backfill job progress")
+async def stream_backfill_job_events(
+    scrape_job_manager: ScrapeJobManagerDependency, job_id: str
+):
+    job = scrape_job_manager.get(job_id, BackfillJob)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Backfill job {job_id} not found")
+
+    async def event_stream():
+        async for event in job.stream():
+            data = json.dumps(event, ensure_ascii=False, default=str)
+            yield f"event: {event['event']}\ndata: {data}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
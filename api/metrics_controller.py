@@ -0,0 +1,62 @@
+import asyncio
+
+from fastapi import APIRouter
+
+from common.browser_pool import BrowserPoolDependency
+from common.domain_limiter import DomainLimiterDependency
+from common.genai_cache import GenaiCacheDependency
+from common.genai_parse_stats import GenaiParseStatsDependency
+from common.http_fetcher import HttpFetcherDependency
+from common.process_pool import ProcessPoolDependency
+from common.rate_limiter import GenaiRateLimiterDependency
+from common.replay_store import ReplayStoreDependency
+from common.snapshot_store import SnapshotStoreDependency
+
+metrics_router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@metrics_router.get("/browser-pool", summary="Get browser pool occupancy")
+async def get_browser_pool_metrics(browser_pool: BrowserPoolDependency):
+    return browser_pool.stats()
+
+
+@metrics_router.get("/genai", summary="Get Gemini rate limiter state")
+async def get_genai_metrics(rate_limiter: GenaiRateLimiterDependency):
+    return rate_limiter.stats()
+
+
+@metrics_router.get(
+    "/genai-parse", summary="Get Gemini structured output parse failures per prompt"
+)
+async def get_genai_parse_metrics(parse_stats: GenaiParseStatsDependency):
+    return parse_stats.stats()
+
+
+@metrics_router.get("/genai-cache", summary="Get Gemini response cache usage")
+async def get_genai_cache_metrics(genai_cache: GenaiCacheDependency):
+    return await asyncio.to_thread(genai_cache.stats)
+
+
+@metrics_router.get("/snapshots", summary="Get HTML snapshot store usage")
+async def get_snapshot_metrics(snapshot_store: SnapshotStoreDependency):
+    return await asyncio.to_thread(snapshot_store.stats)
+
+
+@metrics_router.get("/process-pool", summary="Get HTML parsing process pool usage")
+async def get_process_pool_metrics(process_pool: ProcessPoolDependency):
+    return process_pool.stats()
+
+
+@metrics_router.get("/domains", summary="Get current per-domain request limits")
+async def get_domain_metrics(domain_limiter: DomainLimiterDependency):
+    return domain_limiter.stats()
+
+
+@metrics_router.get("/http", summary="Get HTTP fast path fetch counters")
+async def get_http_metrics(http_fetcher: HttpFetcherDependency):
+    return http_fetcher.stats()
+
+
+@metrics_router.get("/replay", summary="Get record/replay mode counters")
+async def get_replay_metrics(replay_store: ReplayStoreDependency):
+    return replay_store.stats()
@@ -0,0 +1,33 @@
+from fastapi import APIRouter
+from crud.platform_selectors_repository import PlatformSelectorsRepositoryDependency
+
+platform_selectors_router = APIRouter(
+    prefix="/platform-selectors", tags=["platform selectors"]
+)
+
+
+@platform_selectors_router.get("", summary="Get all cached platform selectors")
+async def get_platform_selectors(
+    platform_selectors_repository: PlatformSelectorsRepositoryDependency,
+):
+    return await platform_selectors_repository.get_platform_selectors()
+
+
+@platform_selectors_router.get(
+    "/{platform_id}", summary="Get cached selectors by platform id"
+)
+async def get_platform_selectors_by_platform_id(
+    platform_selectors_repository: PlatformSelectorsRepositoryDependency,
+    platform_id: int,
+):
+    return await platform_selectors_repository.get_by_platform_id(platform_id)
+
+
+@platform_selectors_router.delete(
+    "/{platform_id}", summary="Drop cached selectors to force rediscovery"
+)
+async def delete_platform_selectors_by_platform_id(
+    platform_selectors_repository: PlatformSelectorsRepositoryDependency,
+    platform_id: int,
+):
+    return await platform_selectors_repository.delete_platform_selectors(platform_id)
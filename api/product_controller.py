@@ -1,4 +1,7 @@
 from fastapi import APIRouter
+from crud.product_characteristics_repository import (
+    ProductCharacteristicsRepositoryDependency,
+)
 from crud.product_repository import ProductRepositoryDependency
 from schemas.product_schema import ProductSchema
 
@@ -28,6 +31,17 @@ async def get_product_by_id(
     return await product_repository.get_by_id(product_id)
 
 
+@product_router.get(
+    "/{product_id}/characteristics",
+    summary="Get characteristics extracted from product pages",
+)
+async def get_product_characteristics(
+    product_characteristics_repository: ProductCharacteristicsRepositoryDependency,
+    product_id: int,
+):
+    return await product_characteristics_repository.get_by_product_id(product_id)
+
+
 @product_router.put("/{product_id}", summary="Update product by id")
 async def update_product_by_id(
     product_repository: ProductRepositoryDependency,
@@ -1,8 +1,10 @@
-from fastapi import APIRouter
+import json
 
-from common.services.scrape_service import ScrapeServiceDependency
-from schemas.scrape_schema import ScrapeSchema
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
+from common.scrape_jobs import ScrapeJob, ScrapeJobManagerDependency
+from schemas.scrape_schema import ScrapeSchema
 
 scrape_router = APIRouter(
     prefix="/scrape",
@@ -10,6 +12,39 @@ scrape_router = APIRouter(
 )
 
 
-@scrape_router.post("/")
-async def scrape(scrape_service: ScrapeServiceDependency, scrape: ScrapeSchema):
-    return await scrape_service.scrape(scrape.product_id, scrape.platforms_ids)
+@scrape_router.post("/", status_code=202, summary="Submit new scrape job")
+async def scrape(scrape_job_manager: ScrapeJobManagerDependency, scrape: ScrapeSchema):
+    return scrape_job_manager.submit(ScrapeJob(scrape)).schema()
+
+
+@scrape_router.get("/jobs", summary="Get all scrape jobs")
+async def get_scrape_jobs(scrape_job_manager: ScrapeJobManagerDependency):
+    return [job.schema() for job in scrape_job_manager.get_all(ScrapeJob)]
+
+
+@scrape_router.get("/jobs/{job_id}", summary="Get scrape job status by id")
+async def get_scrape_job(scrape_job_manager: ScrapeJobManagerDependency, job_id: str):
+    job = scrape_job_manager.get(job_id, ScrapeJob)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Scrape job {job_id} not found")
+    return job.schema()
+
+
+@scrape_router.get("/jobs/{job_id}/events", summary="Stream scrape job progress")
+async def stream_scrape_job_events(
+    scrape_job_manager: ScrapeJobManagerDependency, job_id: str
+):
+    job = scrape_job_manager.get(job_id, ScrapeJob)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Scrape job {job_id} not found")
+
+    async def event_stream():
+        async for event in job.stream():
+            data = json.dumps(event, ensure_ascii=False, default=str)
+            yield f"event: {event['event']}\ndata: {data}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,64 @@
+from fastapi import APIRouter
+from common.scrape_scheduler import ScrapeSchedulerDependency, utcnow
+from crud.scrape_schedule_repository import ScrapeScheduleRepositoryDependency
+from schemas.scrape_schedule_schema import ScrapeScheduleSchema
+
+scrape_schedule_router = APIRouter(
+    prefix="/scrape-schedules", tags=["scrape schedules"]
+)
+
+
+@scrape_schedule_router.post("", summary="Create new scrape schedule")
+async def create_scrape_schedule(
+    scrape_schedule_repository: ScrapeScheduleRepositoryDependency,
+    scrape_schedule: ScrapeScheduleSchema,
+):
+    return await scrape_schedule_repository.create_scrape_schedule(
+        product_id=scrape_schedule.product_id,
+        platform_id=scrape_schedule.platform_id,
+        interval_minutes=scrape_schedule.interval_minutes,
+        enabled=scrape_schedule.enabled,
+        next_run_at=scrape_schedule.next_run_at or utcnow(),
+    )
+
+
+@scrape_schedule_router.get("", summary="Get all scrape schedules")
+async def get_scrape_schedules(
+    scrape_schedule_repository: ScrapeScheduleRepositoryDependency,
+):
+    return await scrape_schedule_repository.get_scrape_schedules()
+
+
+@scrape_schedule_router.get("/status", summary="Get scrape scheduler status")
+async def get_scrape_scheduler_status(scrape_scheduler: ScrapeSchedulerDependency):
+    return scrape_scheduler.stats()
+
+
+@scrape_schedule_router.get("/{schedule_id}", summary="Get scrape schedule by id")
+async def get_scrape_schedule_by_id(
+    scrape_schedule_repository: ScrapeScheduleRepositoryDependency,
+    schedule_id: int,
+):
+    return await scrape_schedule_repository.get_by_id(schedule_id)
+
+
+@scrape_schedule_router.put("/{schedule_id}", summary="Update scrape schedule by id")
+async def update_scrape_schedule_by_id(
+    scrape_schedule_repository: ScrapeScheduleRepositoryDependency,
+    schedule_id: int,
+    scrape_schedule: ScrapeScheduleSchema,
+):
+    return await scrape_schedule_repository.update_scrape_schedule(
+        schedule_id,
+        interval_minutes=scrape_schedule.interval_minutes,
+        enabled=scrape_schedule.enabled,
+        next_run_at=scrape_schedule.next_run_at,
+    )
+
+
+@scrape_schedule_router.delete("/{schedule_id}", summary="Delete scrape schedule by id")
+async def delete_scrape_schedule_by_id(
+    scrape_schedule_repository: ScrapeScheduleRepositoryDependency,
+    schedule_id: int,
+):
+    return await scrape_schedule_repository.delete_scrape_schedule(schedule_id)
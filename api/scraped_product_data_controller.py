@@ -1,4 +1,5 @@
 from fastapi import APIRouter
+from crud.page_observation_repository import PageObservationRepositoryDependency
 from crud.scraped_product_data_repository import ScrapedProductDataRepositoryDependency
 from schemas.scraped_product_data_schema import ScrapedProductDataSchema
 
@@ -73,3 +74,14 @@ async def delete_scraped_product_data_by_id(
     data_id: int,
 ):
     return await scraped_product_data_repository.delete_scraped_product_data(data_id)
+
+
+@scraped_product_data_router.get(
+    "/{data_id}/observations",
+    summary="Get later runs that saw the same unchanged page",
+)
+async def get_scraped_product_data_observations(
+    page_observation_repository: PageObservationRepositoryDependency,
+    data_id: int,
+):
+    return await page_observation_repository.get_by_scraped_product_data_id(data_id)
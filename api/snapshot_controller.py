@@ -0,0 +1,29 @@
+import asyncio
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import HTMLResponse
+
+from common.snapshot_store import SnapshotStoreDependency
+
+snapshot_router = APIRouter(prefix="/snapshots", tags=["snapshots"])
+
+
+@snapshot_router.post("/prune", summary="Apply snapshot retention policy now")
+async def prune_snapshots(snapshot_store: SnapshotStoreDependency):
+    removed = await asyncio.to_thread(snapshot_store.prune)
+    return {"removed": removed}
+
+
+@snapshot_router.get(
+    "/{snapshot_hash}", summary="Get stored HTML snapshot", response_class=HTMLResponse
+)
+async def get_snapshot(snapshot_store: SnapshotStoreDependency, snapshot_hash: str):
+    try:
+        html = await asyncio.to_thread(snapshot_store.get, snapshot_hash)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if html is None:
+        raise HTTPException(
+            status_code=404, detail=f"Snapshot {snapshot_hash} not found"
+        )
+    return HTMLResponse(html)
@@ -0,0 +1,59 @@
+"""
+Повторне вилучення даних товарів зі збережених HTML-знімків.
+
+    python backfill.py 3 --selectors selectors.json --since 2025-05-01
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import logging
+
+from common.process_pool import process_pool
+from common.services.backfill_service import create_backfill_service
+from db import SessionLocal
+from schemas.backfill_schema import BackfillSchema
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("platform_id", type=int)
+    parser.add_argument(
+        "--selectors",
+        help="JSON file with product selectors (defaults to the cached ones)",
+    )
+    parser.add_argument("--product-id", type=int)
+    parser.add_argument("--since", type=datetime.datetime.fromisoformat)
+    parser.add_argument("--until", type=datetime.datetime.fromisoformat)
+    parser.add_argument("--mode", choices=("update", "insert"), default="update")
+    parser.add_argument("--dry-run", action="store_true")
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace) -> None:
+    selectors = None
+    if args.selectors:
+        with open(args.selectors, encoding="utf-8") as file:
+            selectors = json.load(file)
+
+    request = BackfillSchema(
+        platform_id=args.platform_id,
+        selectors=selectors,
+        product_id=args.product_id,
+        since=args.since,
+        until=args.until,
+        mode=args.mode,
+        dry_run=args.dry_run,
+    )
+    try:
+        async with SessionLocal() as session:
+            result = await create_backfill_service(session).backfill(request)
+    finally:
+        process_pool.stop()
+    print(result.model_dump_json(indent=2))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main(parse_args()))
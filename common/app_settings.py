@@ -1,5 +1,5 @@
 from pydantic import Field
-from typing import Annotated
+from typing import Annotated, List, Literal, Optional
 from fastapi import Depends
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -8,6 +8,159 @@ class AppSettings(BaseSettings):
     DB_CONNECTION_STRING: str = Field(alias="DB_CONNECTION_STRING", min_length=1)
     GEMINI_API_KEY: str = Field(alias="GEMINI_API_KEY", min_length=1)
 
+    BROWSER_POOL_SIZE: int = Field(default=2, alias="BROWSER_POOL_SIZE", ge=1)
+    BROWSER_CONTEXTS_PER_BROWSER: int = Field(
+        default=4, alias="BROWSER_CONTEXTS_PER_BROWSER", ge=1
+    )
+    BROWSER_MAX_PAGES_PER_BROWSER: int = Field(
+        default=200, alias="BROWSER_MAX_PAGES_PER_BROWSER", ge=1
+    )
+    BROWSER_BLOCKED_RESOURCE_TYPES: List[str] = Field(
+        default=["image", "media", "font"], alias="BROWSER_BLOCKED_RESOURCE_TYPES"
+    )
+    BROWSER_BLOCKED_DOMAINS: List[str] = Field(
+        default=[
+            "google-analytics.com",
+            "googletagmanager.com",
+            "doubleclick.net",
+            "googlesyndication.com",
+            "facebook.net",
+            "connect.facebook.net",
+            "hotjar.com",
+            "criteo.com",
+            "criteo.net",
+        ],
+        alias="BROWSER_BLOCKED_DOMAINS",
+    )
+    BROWSER_SELECTOR_WAIT_TIMEOUT_MS: int = Field(
+        default=10_000, alias="BROWSER_SELECTOR_WAIT_TIMEOUT_MS", ge=0
+    )
+
+    DOMAIN_MAX_CONCURRENCY: int = Field(default=4, alias="DOMAIN_MAX_CONCURRENCY", ge=1)
+    DOMAIN_MIN_CONCURRENCY: int = Field(default=1, alias="DOMAIN_MIN_CONCURRENCY", ge=1)
+    DOMAIN_MAX_REQUESTS_PER_SECOND: float = Field(
+        default=2.0, alias="DOMAIN_MAX_REQUESTS_PER_SECOND", gt=0
+    )
+    DOMAIN_MIN_REQUESTS_PER_SECOND: float = Field(
+        default=0.1, alias="DOMAIN_MIN_REQUESTS_PER_SECOND", gt=0
+    )
+    DOMAIN_SLOW_RESPONSE_SECONDS: float = Field(
+        default=15.0, alias="DOMAIN_SLOW_RESPONSE_SECONDS", gt=0
+    )
+    DOMAIN_BACKOFF_FACTOR: float = Field(
+        default=0.5, alias="DOMAIN_BACKOFF_FACTOR", gt=0, lt=1
+    )
+
+    HTTP_FAST_PATH_ENABLED: bool = Field(default=True, alias="HTTP_FAST_PATH_ENABLED")
+    HTTP_TIMEOUT_SECONDS: float = Field(
+        default=15.0, alias="HTTP_TIMEOUT_SECONDS", gt=0
+    )
+    HTTP_MAX_CONNECTIONS: int = Field(default=50, alias="HTTP_MAX_CONNECTIONS", ge=1)
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = Field(
+        default=20, alias="HTTP_MAX_KEEPALIVE_CONNECTIONS", ge=0
+    )
+    HTTP_MIN_PAGES: int = Field(default=3, alias="HTTP_MIN_PAGES", ge=1)
+    HTTP_MIN_SUCCESS_RATE: float = Field(
+        default=0.8, alias="HTTP_MIN_SUCCESS_RATE", ge=0, le=1
+    )
+    HTTP_RECHECK_HOURS: int = Field(default=72, alias="HTTP_RECHECK_HOURS", ge=1)
+
+    SCRAPE_PAGE_CONCURRENCY: int = Field(
+        default=4, alias="SCRAPE_PAGE_CONCURRENCY", ge=1
+    )
+    SCRAPE_PLATFORM_CONCURRENCY: int = Field(
+        default=3, alias="SCRAPE_PLATFORM_CONCURRENCY", ge=1
+    )
+    SCRAPE_PERSIST_CHUNK_SIZE: int = Field(
+        default=25, alias="SCRAPE_PERSIST_CHUNK_SIZE", ge=1
+    )
+
+    SCRAPE_CHARACTERISTICS_ENABLED: bool = Field(
+        default=False, alias="SCRAPE_CHARACTERISTICS_ENABLED"
+    )
+    SCRAPE_CHARACTERISTICS_CONCURRENCY: int = Field(
+        default=2, alias="SCRAPE_CHARACTERISTICS_CONCURRENCY", ge=1
+    )
+    CHARACTERISTICS_MAX_AGE_DAYS: int = Field(
+        default=30, alias="CHARACTERISTICS_MAX_AGE_DAYS", ge=1
+    )
+
+    SCRAPE_JOB_WORKERS: int = Field(default=2, alias="SCRAPE_JOB_WORKERS", ge=1)
+    SCRAPE_JOB_QUEUE_SIZE: int = Field(default=20, alias="SCRAPE_JOB_QUEUE_SIZE", ge=1)
+    SCRAPE_JOB_RETENTION: int = Field(default=200, alias="SCRAPE_JOB_RETENTION", ge=1)
+
+    SCHEDULER_ENABLED: bool = Field(default=True, alias="SCHEDULER_ENABLED")
+    SCHEDULER_POLL_INTERVAL_SECONDS: int = Field(
+        default=30, alias="SCHEDULER_POLL_INTERVAL_SECONDS", ge=1
+    )
+    SCHEDULER_BATCH_SIZE: int = Field(default=20, alias="SCHEDULER_BATCH_SIZE", ge=1)
+    SCHEDULER_JITTER: float = Field(default=0.1, alias="SCHEDULER_JITTER", ge=0, le=0.5)
+    SCHEDULER_STARTUP_SPREAD_MINUTES: int = Field(
+        default=30, alias="SCHEDULER_STARTUP_SPREAD_MINUTES", ge=0
+    )
+
+    SEARCH_MIN_LINKS: int = Field(default=3, alias="SEARCH_MIN_LINKS", ge=1)
+    SEARCH_MAX_PAGES: int = Field(default=5, alias="SEARCH_MAX_PAGES", ge=1)
+    SEARCH_MAX_POSITIONS: int = Field(default=60, alias="SEARCH_MAX_POSITIONS", ge=1)
+    SELECTOR_MIN_FILL_RATE: float = Field(
+        default=0.7, alias="SELECTOR_MIN_FILL_RATE", ge=0, le=1
+    )
+
+    GENAI_MAX_PROMPT_TOKENS: int = Field(
+        default=100_000, alias="GENAI_MAX_PROMPT_TOKENS", ge=1_000
+    )
+    GENAI_MAX_CONCURRENCY: int = Field(default=4, alias="GENAI_MAX_CONCURRENCY", ge=1)
+    GENAI_REQUESTS_PER_MINUTE: int = Field(
+        default=30, alias="GENAI_REQUESTS_PER_MINUTE", ge=1
+    )
+    GENAI_TOKENS_PER_MINUTE: int = Field(
+        default=1_000_000, alias="GENAI_TOKENS_PER_MINUTE", ge=1_000
+    )
+    GENAI_MAX_RETRIES: int = Field(default=3, alias="GENAI_MAX_RETRIES", ge=0)
+    GENAI_MAX_PARSE_RETRIES: int = Field(
+        default=2, alias="GENAI_MAX_PARSE_RETRIES", ge=0
+    )
+    GENAI_STREAM_SEARCH_RESULTS: bool = Field(
+        default=True, alias="GENAI_STREAM_SEARCH_RESULTS"
+    )
+    GENAI_CACHE_ENABLED: bool = Field(default=True, alias="GENAI_CACHE_ENABLED")
+    GENAI_CACHE_DIR: str = Field(default="genai_cache", alias="GENAI_CACHE_DIR")
+    GENAI_CACHE_MAX_BYTES: int = Field(
+        default=512 * 1024**2, alias="GENAI_CACHE_MAX_BYTES", ge=0
+    )
+    GENAI_CACHE_TTL_HOURS: int = Field(
+        default=7 * 24, alias="GENAI_CACHE_TTL_HOURS", ge=1
+    )
+    GENAI_CACHE_PRUNE_INTERVAL_MINUTES: int = Field(
+        default=60, alias="GENAI_CACHE_PRUNE_INTERVAL_MINUTES", ge=1
+    )
+
+    SNAPSHOT_ENABLED: bool = Field(default=True, alias="SNAPSHOT_ENABLED")
+    SNAPSHOT_DIR: str = Field(default="snapshots", alias="SNAPSHOT_DIR")
+    SNAPSHOT_MAX_BYTES: int = Field(
+        default=5 * 1024**3, alias="SNAPSHOT_MAX_BYTES", ge=0
+    )
+    SNAPSHOT_MAX_AGE_DAYS: int = Field(default=90, alias="SNAPSHOT_MAX_AGE_DAYS", ge=1)
+    SNAPSHOT_PRUNE_INTERVAL_MINUTES: int = Field(
+        default=60, alias="SNAPSHOT_PRUNE_INTERVAL_MINUTES", ge=1
+    )
+
+    PARSER_BACKEND: Optional[str] = Field(default=None, alias="PARSER_BACKEND")
+
+    PROCESS_POOL_WORKERS: Optional[int] = Field(
+        default=None, alias="PROCESS_POOL_WORKERS", ge=1
+    )
+    PROCESS_POOL_MODE: Literal["process", "thread", "inline"] = Field(
+        default="process", alias="PROCESS_POOL_MODE"
+    )
+    REPLAY_MODE: Literal["off", "record", "replay"] = Field(
+        default="off", alias="REPLAY_MODE"
+    )
+    REPLAY_DIR: str = Field(default="recordings", alias="REPLAY_DIR")
+
+    BACKFILL_BATCH_SIZE: int = Field(default=200, alias="BACKFILL_BATCH_SIZE", ge=1)
+    BACKFILL_TASK_SIZE: int = Field(default=20, alias="BACKFILL_TASK_SIZE", ge=1)
+
     model_config = SettingsConfigDict(env_file=".env")
 
 
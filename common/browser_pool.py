@@ -0,0 +1,353 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Annotated, AsyncIterator, List, Optional
+from urllib.parse import urlparse
+
+from fastapi import Depends
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Page,
+    Playwright,
+    Response,
+    Route,
+    async_playwright,
+)
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from common.app_settings import settings
+from common.domain_limiter import DomainLimiter, domain_limiter
+from common.replay_store import ReplayStore, replay_store
+
+logger = logging.getLogger(__name__)
+
+BROWSER_ARGS = [
+    "--disable-extensions",
+    "--proxy-server='direct://'",
+    "--proxy-bypass-list=*",
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-web-security",
+]
+
+
+class PooledBrowser:
+    def __init__(self, browser: Browser):
+        self.browser = browser
+        self.active_contexts = 0
+        self.pages_served = 0
+        self.launched_at = time.monotonic()
+
+    def pages_per_minute(self) -> float:
+        minutes = (time.monotonic() - self.launched_at) / 60
+        return self.pages_served / minutes if minutes > 0 else 0.0
+
+
+class BrowserPool:
+    """
+    Пул довгоживучих браузерів Chromium, спільний для всіх запитів.
+    Кожна сторінка видається в окремому (ізольованому) контексті, а браузер
+    перезапускається після `max_pages_per_browser` сторінок або після збою.
+    Запити до заблокованих типів ресурсів і доменів відхиляються ще до завантаження.
+    Переходи на сторінки проходять через спільний `DomainLimiter`.
+    У режимах запису/відтворення `ReplayStore` усі дозволені запити
+    записуються на диск або віддаються з нього без мережі.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        contexts_per_browser: int,
+        max_pages_per_browser: int,
+        blocked_resource_types: List[str],
+        blocked_domains: List[str],
+        selector_wait_timeout_ms: int,
+        domain_limiter: DomainLimiter,
+        replay_store: ReplayStore,
+    ):
+        self.size = size
+        self.capacity = size * contexts_per_browser
+        self.max_pages_per_browser = max_pages_per_browser
+        self.blocked_resource_types = set(blocked_resource_types)
+        self.blocked_domains = tuple(blocked_domains)
+        self.selector_wait_timeout_ms = selector_wait_timeout_ms
+        self.domain_limiter = domain_limiter
+        self.replay_store = replay_store
+
+        self._playwright: Optional[Playwright] = None
+        self._browsers: List[PooledBrowser] = []
+        self._draining: List[PooledBrowser] = []
+        self._lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(self.capacity)
+
+        self._in_use = 0
+        self._waiting = 0
+        self._acquired_total = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+        self._recycled_total = 0
+        self._crashed_total = 0
+        self._blocked_requests_total = 0
+        self._selector_waits_total = 0
+        self._networkidle_waits_total = 0
+
+    @property
+    def started(self) -> bool:
+        return self._playwright is not None
+
+    async def start(self) -> None:
+        async with self._lock:
+            if self.started:
+                return
+            self._playwright = await async_playwright().start()
+            self._browsers = [
+                PooledBrowser(await self._launch()) for _ in range(self.size)
+            ]
+
+    async def stop(self) -> None:
+        async with self._lock:
+            for pooled in self._browsers + self._draining:
+                await self._close_browser(pooled.browser)
+            self._browsers = []
+            self._draining = []
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        if not self.started:
+            await self.start()
+
+        started_at = time.perf_counter()
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+        self._record_wait(time.perf_counter() - started_at)
+
+        pooled = None
+        context = None
+        self._in_use += 1
+        try:
+            pooled = await self._checkout()
+            context = await pooled.browser.new_context()
+            await self._route_requests(context)
+            yield await context.new_page()
+        finally:
+            if context is not None:
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+            if pooled is not None:
+                await self._checkin(pooled)
+            self._in_use -= 1
+            self._semaphore.release()
+
+    async def goto(
+        self, page: Page, url: str, wait_selectors: Optional[List[str]] = None
+    ) -> Optional[Response]:
+        """
+        Відкриває сторінку і чекає появи `wait_selectors` у DOM.
+        Якщо селекторів немає або вони не з'явились, чекає на networkidle.
+        """
+        async with self.domain_limiter.slot(url) as slot:
+            try:
+                response = await page.goto(
+                    url, timeout=60_000, wait_until="domcontentloaded"
+                )
+            except PlaywrightTimeoutError:
+                slot.record_timeout()
+                raise
+            slot.record(
+                response.status if response else None,
+                response.headers.get("retry-after") if response else None,
+            )
+
+            if wait_selectors:
+                try:
+                    for selector in wait_selectors:
+                        await page.wait_for_selector(
+                            selector,
+                            state="attached",
+                            timeout=self.selector_wait_timeout_ms,
+                        )
+                    self._selector_waits_total += 1
+                    return response
+                except Exception as e:
+                    logger.info(
+                        "Selectors not found on %s, waiting for networkidle: %s",
+                        url,
+                        e,
+                    )
+
+            self._networkidle_waits_total += 1
+            try:
+                await page.wait_for_load_state("networkidle")
+            except PlaywrightTimeoutError:
+                logger.info("Page %s did not reach networkidle, using current DOM", url)
+            return response
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size,
+            "capacity": self.capacity,
+            "in_use": self._in_use,
+            "waiting": self._waiting,
+            "acquired_total": self._acquired_total,
+            "wait_seconds_avg": (
+                self._wait_seconds_total / self._acquired_total
+                if self._acquired_total
+                else 0.0
+            ),
+            "wait_seconds_max": self._wait_seconds_max,
+            "recycled_total": self._recycled_total,
+            "crashed_total": self._crashed_total,
+            "blocked_requests_total": self._blocked_requests_total,
+            "selector_waits_total": self._selector_waits_total,
+            "networkidle_waits_total": self._networkidle_waits_total,
+            "browsers": [
+                {
+                    "active_contexts": pooled.active_contexts,
+                    "pages_served": pooled.pages_served,
+                    "pages_per_minute": pooled.pages_per_minute(),
+                    "connected": pooled.browser.is_connected(),
+                }
+                for pooled in self._browsers
+            ],
+        }
+
+    async def _launch(self) -> Browser:
+        assert self._playwright is not None
+        return await self._playwright.chromium.launch(headless=True, args=BROWSER_ARGS)
+
+    async def _checkout(self) -> PooledBrowser:
+        async with self._lock:
+            for index, pooled in enumerate(self._browsers):
+                if not pooled.browser.is_connected():
+                    self._crashed_total += 1
+                    self._browsers[index] = PooledBrowser(await self._launch())
+
+            pooled = min(self._browsers, key=lambda item: item.active_contexts)
+            pooled.active_contexts += 1
+            return pooled
+
+    async def _checkin(self, pooled: PooledBrowser) -> None:
+        async with self._lock:
+            pooled.active_contexts -= 1
+            pooled.pages_served += 1
+
+            if pooled in self._browsers and (
+                pooled.pages_served >= self.max_pages_per_browser
+                or not pooled.browser.is_connected()
+            ):
+                if pooled.browser.is_connected():
+                    self._recycled_total += 1
+                else:
+                    self._crashed_total += 1
+                index = self._browsers.index(pooled)
+                self._browsers[index] = PooledBrowser(await self._launch())
+                self._draining.append(pooled)
+
+            for drained in [d for d in self._draining if d.active_contexts == 0]:
+                self._draining.remove(drained)
+                await self._close_browser(drained.browser)
+
+    async def _route_requests(self, context: BrowserContext) -> None:
+        if (
+            self.blocked_resource_types
+            or self.blocked_domains
+            or self.replay_store.recording
+            or self.replay_store.replaying
+        ):
+            await context.route("**/*", self._handle_route)
+
+    async def _handle_route(self, route: Route) -> None:
+        request = route.request
+        if (
+            request.resource_type in self.blocked_resource_types
+            or self._is_blocked_domain(request.url)
+        ):
+            self._blocked_requests_total += 1
+            await route.abort()
+        elif self.replay_store.replaying:
+            await self._replay_route(route)
+        elif self.replay_store.recording:
+            await self._record_route(route)
+        else:
+            await route.continue_()
+
+    async def _record_route(self, route: Route) -> None:
+        request = route.request
+        try:
+            response = await route.fetch()
+            body = await response.body()
+        except Exception as e:
+            logger.info("Failed to record %s %s: %s", request.method, request.url, e)
+            await route.abort()
+            return
+        await asyncio.to_thread(
+            self.replay_store.save_response,
+            request.method,
+            request.url,
+            request.post_data_buffer,
+            response.status,
+            response.headers,
+            body,
+        )
+        await route.fulfill(response=response, body=body)
+
+    async def _replay_route(self, route: Route) -> None:
+        request = route.request
+        recorded = await asyncio.to_thread(
+            self.replay_store.load_response,
+            request.method,
+            request.url,
+            request.post_data_buffer,
+        )
+        if recorded is None:
+            logger.info("No recorded response for %s %s", request.method, request.url)
+            await route.abort("internetdisconnected")
+            return
+        await route.fulfill(
+            status=recorded.status, headers=recorded.headers, body=recorded.body
+        )
+
+    def _is_blocked_domain(self, url: str) -> bool:
+        host = urlparse(url).hostname or ""
+        return any(
+            host == domain or host.endswith(f".{domain}")
+            for domain in self.blocked_domains
+        )
+
+    async def _close_browser(self, browser: Browser) -> None:
+        try:
+            await browser.close()
+        except Exception:
+            pass
+
+    def _record_wait(self, seconds: float) -> None:
+        self._acquired_total += 1
+        self._wait_seconds_total += seconds
+        self._wait_seconds_max = max(self._wait_seconds_max, seconds)
+
+
+browser_pool = BrowserPool(
+    size=settings.BROWSER_POOL_SIZE,
+    contexts_per_browser=settings.BROWSER_CONTEXTS_PER_BROWSER,
+    max_pages_per_browser=settings.BROWSER_MAX_PAGES_PER_BROWSER,
+    blocked_resource_types=settings.BROWSER_BLOCKED_RESOURCE_TYPES,
+    blocked_domains=settings.BROWSER_BLOCKED_DOMAINS,
+    selector_wait_timeout_ms=settings.BROWSER_SELECTOR_WAIT_TIMEOUT_MS,
+    domain_limiter=domain_limiter,
+    replay_store=replay_store,
+)
+
+
+BrowserPoolDependency = Annotated[BrowserPool, Depends(lambda: browser_pool)]
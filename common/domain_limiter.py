@@ -0,0 +1,244 @@
+import asyncio
+import email.utils
+import time
+from contextlib import asynccontextmanager
+from typing import Annotated, AsyncIterator, Dict, Optional
+from urllib.parse import urlparse
+
+from fastapi import Depends
+
+from common.app_settings import settings
+from common.rate_limiter import TokenBucket
+
+THROTTLE_STATUS_CODES = {429, 503}
+LATENCY_SMOOTHING = 0.2
+
+
+def domain_of(url: str) -> str:
+    host = (urlparse(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    if value.strip().isdigit():
+        return float(value.strip())
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class DomainSlot:
+    """
+    Дозвіл на один запит до домену. Викликач повідомляє результат через
+    `record`/`record_timeout`, і ліміти домену підлаштовуються під нього.
+    """
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.elapsed: Optional[float] = None
+        self.status: Optional[int] = None
+        self.retry_after: Optional[float] = None
+        self.timed_out = False
+
+    def record(self, status: Optional[int], retry_after: Optional[str] = None) -> None:
+        self.elapsed = time.perf_counter() - self.started_at
+        self.status = status
+        self.retry_after = parse_retry_after(retry_after)
+
+    def record_timeout(self) -> None:
+        self.elapsed = time.perf_counter() - self.started_at
+        self.timed_out = True
+
+
+class DomainState:
+    def __init__(self, domain: str, concurrency: float, requests_per_second: float):
+        self.domain = domain
+        self.concurrency = concurrency
+        self.requests_per_second = requests_per_second
+        self.bucket = TokenBucket(requests_per_second * 60, capacity=1)
+        self.condition = asyncio.Condition()
+        self.in_flight = 0
+        self.waiting = 0
+        self.backoff_until = 0.0
+        self.latency_seconds: Optional[float] = None
+
+        self.requests_total = 0
+        self.throttled_total = 0
+        self.slow_total = 0
+        self.timeouts_total = 0
+        self.errors_total = 0
+
+    @property
+    def concurrency_limit(self) -> int:
+        return max(1, int(self.concurrency))
+
+
+class DomainLimiter:
+    """
+    Ввічливе обмеження запитів до кожного домену окремо: кількість одночасних
+    з'єднань і запитів на секунду. Ліміти адаптивні (AIMD): на 429/503, тайм-аут
+    або повільну відповідь вони зменшуються у `backoff_factor` разів, а на
+    здорові відповіді поступово ростуть до максимуму.
+    Вимкнений лімітер (`enabled=False`, відтворення записів без мережі) лише
+    видає дозволи без очікування.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        min_concurrency: int,
+        max_requests_per_second: float,
+        min_requests_per_second: float,
+        slow_response_seconds: float,
+        backoff_factor: float,
+        enabled: bool = True,
+    ):
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.max_requests_per_second = max_requests_per_second
+        self.min_requests_per_second = min_requests_per_second
+        self.slow_response_seconds = slow_response_seconds
+        self.backoff_factor = backoff_factor
+        self.enabled = enabled
+        self._domains: Dict[str, DomainState] = {}
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[DomainSlot]:
+        if not self.enabled:
+            yield DomainSlot()
+            return
+
+        state = self._state(domain_of(url))
+        state.waiting += 1
+        try:
+            async with state.condition:
+                await state.condition.wait_for(
+                    lambda: state.in_flight < state.concurrency_limit
+                )
+                state.in_flight += 1
+        finally:
+            state.waiting -= 1
+
+        try:
+            delay = state.backoff_until - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await state.bucket.acquire()
+
+            state.requests_total += 1
+            slot = DomainSlot()
+            try:
+                yield slot
+            finally:
+                self._adapt(state, slot)
+        finally:
+            async with state.condition:
+                state.in_flight -= 1
+                state.condition.notify_all()
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        return {
+            state.domain: {
+                "concurrency_limit": state.concurrency_limit,
+                "requests_per_second": round(state.requests_per_second, 3),
+                "in_flight": state.in_flight,
+                "waiting": state.waiting,
+                "latency_seconds": state.latency_seconds,
+                "backoff_seconds": max(0.0, state.backoff_until - now),
+                "requests_total": state.requests_total,
+                "throttled_total": state.throttled_total,
+                "slow_total": state.slow_total,
+                "timeouts_total": state.timeouts_total,
+                "errors_total": state.errors_total,
+            }
+            for state in self._domains.values()
+        }
+
+    def _state(self, domain: str) -> DomainState:
+        state = self._domains.get(domain)
+        if state is None:
+            state = DomainState(
+                domain, self.max_concurrency, self.max_requests_per_second
+            )
+            self._domains[domain] = state
+        return state
+
+    def _adapt(self, state: DomainState, slot: DomainSlot) -> None:
+        if slot.elapsed is None:
+            state.errors_total += 1
+            return
+
+        state.latency_seconds = (
+            slot.elapsed
+            if state.latency_seconds is None
+            else (1 - LATENCY_SMOOTHING) * state.latency_seconds
+            + LATENCY_SMOOTHING * slot.elapsed
+        )
+
+        throttled = slot.status in THROTTLE_STATUS_CODES
+        slow = slot.elapsed > self.slow_response_seconds
+        if slot.timed_out:
+            state.timeouts_total += 1
+        elif throttled:
+            state.throttled_total += 1
+        elif slow:
+            state.slow_total += 1
+
+        if slot.timed_out or throttled or slow:
+            self._decrease(state)
+            if slot.retry_after:
+                state.backoff_until = max(
+                    state.backoff_until, time.monotonic() + slot.retry_after
+                )
+        else:
+            self._increase(state)
+
+    def _decrease(self, state: DomainState) -> None:
+        state.concurrency = max(
+            self.min_concurrency, state.concurrency * self.backoff_factor
+        )
+        self._set_rate(
+            state,
+            max(
+                self.min_requests_per_second,
+                state.requests_per_second * self.backoff_factor,
+            ),
+        )
+
+    def _increase(self, state: DomainState) -> None:
+        # Адитивне зростання: приблизно +1 з'єднання за "вікно" успішних запитів.
+        state.concurrency = min(
+            self.max_concurrency, state.concurrency + 1 / state.concurrency_limit
+        )
+        self._set_rate(
+            state,
+            min(
+                self.max_requests_per_second,
+                state.requests_per_second
+                + self.max_requests_per_second / (10 * state.concurrency_limit),
+            ),
+        )
+
+    def _set_rate(self, state: DomainState, requests_per_second: float) -> None:
+        if requests_per_second != state.requests_per_second:
+            state.requests_per_second = requests_per_second
+            state.bucket.set_rate(requests_per_second * 60)
+
+
+domain_limiter = DomainLimiter(
+    max_concurrency=settings.DOMAIN_MAX_CONCURRENCY,
+    min_concurrency=settings.DOMAIN_MIN_CONCURRENCY,
+    max_requests_per_second=settings.DOMAIN_MAX_REQUESTS_PER_SECOND,
+    min_requests_per_second=settings.DOMAIN_MIN_REQUESTS_PER_SECOND,
+    slow_response_seconds=settings.DOMAIN_SLOW_RESPONSE_SECONDS,
+    backoff_factor=settings.DOMAIN_BACKOFF_FACTOR,
+    enabled=settings.REPLAY_MODE != "replay",
+)
+
+
+DomainLimiterDependency = Annotated[DomainLimiter, Depends(lambda: domain_limiter)]
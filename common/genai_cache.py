@@ -0,0 +1,177 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Annotated, Iterator, List, Optional, Tuple
+
+from fastapi import Depends
+
+from common.app_settings import settings
+
+logger = logging.getLogger(__name__)
+
+CACHE_SUFFIX = ".json.gz"
+
+
+class GenaiCache:
+    """
+    Кеш відповідей Gemini на диску. Ключ — модель, шаблон запиту та хеш
+    (вже зменшеного) вмісту сторінки, тож однакові запити до однакових сторінок
+    не потрапляють в API повторно. Записи живуть `ttl_hours`; коли загальний
+    розмір перевищує ліміт, першими видаляються ті, що найдовше не читались.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        max_bytes: int,
+        ttl_hours: int,
+        prune_interval_minutes: int,
+    ):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_hours * 60 * 60
+        self.prune_interval_seconds = prune_interval_minutes * 60
+
+        self._task: Optional[asyncio.Task] = None
+        self._hits_total = 0
+        self._misses_total = 0
+        self._expired_total = 0
+        self._writes_total = 0
+        self._evicted_total = 0
+
+    @staticmethod
+    def key(model: str, prompt_template: str, content: str) -> str:
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return hashlib.sha256(
+            f"{model}\n{prompt_template}\n{content_hash}".encode("utf-8")
+        ).hexdigest()
+
+    def get(self, model: str, prompt_template: str, content: str) -> Optional[str]:
+        path = self._path(self.key(model, prompt_template, content))
+        try:
+            entry = json.loads(gzip.decompress(path.read_bytes()))
+        except FileNotFoundError:
+            self._misses_total += 1
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Broken Gemini cache entry %s: %s", path.name, e)
+            path.unlink(missing_ok=True)
+            self._misses_total += 1
+            return None
+
+        if time.time() - entry["created_at"] > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            self._expired_total += 1
+            self._misses_total += 1
+            return None
+
+        # Час модифікації файлу — час останнього читання для LRU-видалення.
+        os.utime(path)
+        self._hits_total += 1
+        return entry["text"]
+
+    def put(self, model: str, prompt_template: str, content: str, text: str) -> None:
+        path = self._path(self.key(model, prompt_template, content))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = gzip.compress(
+            json.dumps(
+                {"model": model, "created_at": time.time(), "text": text},
+                ensure_ascii=False,
+            ).encode("utf-8")
+        )
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+        self._writes_total += 1
+
+    def prune(self) -> int:
+        now = time.time()
+        entries: List[Tuple[float, int, Path]] = []
+        removed = 0
+        for path, stat in self._iter_entries():
+            # Запис, який не читали довше за TTL, точно застарів.
+            if now - stat.st_mtime > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+                removed += 1
+            else:
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_bytes -= size
+            removed += 1
+
+        self._evicted_total += removed
+        return removed
+
+    def stats(self) -> dict:
+        count = 0
+        total_bytes = 0
+        for _, stat in self._iter_entries():
+            count += 1
+            total_bytes += stat.st_size
+        lookups = self._hits_total + self._misses_total
+        return {
+            "root": str(self.root),
+            "entries": count,
+            "bytes": total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits_total": self._hits_total,
+            "misses_total": self._misses_total,
+            "hit_rate": self._hits_total / lookups if lookups else 0.0,
+            "expired_total": self._expired_total,
+            "writes_total": self._writes_total,
+            "evicted_total": self._evicted_total,
+        }
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._prune_periodically())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _prune_periodically(self) -> None:
+        while True:
+            try:
+                removed = await asyncio.to_thread(self.prune)
+                if removed:
+                    logger.info("Evicted %d Gemini cache entries", removed)
+            except Exception as e:
+                logger.warning("Failed to prune Gemini cache: %s", e)
+            await asyncio.sleep(self.prune_interval_seconds)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}{CACHE_SUFFIX}"
+
+    def _iter_entries(self) -> Iterator[Tuple[Path, os.stat_result]]:
+        if not self.root.exists():
+            return
+        for path in self.root.glob(f"*/*{CACHE_SUFFIX}"):
+            try:
+                yield path, path.stat()
+            except FileNotFoundError:
+                continue
+
+
+genai_cache = GenaiCache(
+    root=settings.GENAI_CACHE_DIR,
+    max_bytes=settings.GENAI_CACHE_MAX_BYTES,
+    ttl_hours=settings.GENAI_CACHE_TTL_HOURS,
+    prune_interval_minutes=settings.GENAI_CACHE_PRUNE_INTERVAL_MINUTES,
+)
+
+
+GenaiCacheDependency = Annotated[GenaiCache, Depends(lambda: genai_cache)]
@@ -0,0 +1,63 @@
+from typing import Annotated, Dict
+
+from fastapi import Depends
+
+
+class PromptParseStats:
+    def __init__(self):
+        self.calls_total = 0
+        self.attempts_total = 0
+        self.parse_failures_total = 0
+        self.exhausted_total = 0
+
+
+class GenaiParseStats:
+    """
+    Лічильники розбору структурованих відповідей Gemini окремо для кожного
+    запиту: скільки відповідей не пройшли валідацію і скільки викликів
+    вичерпали ліміт повторів.
+    """
+
+    def __init__(self):
+        self._prompts: Dict[str, PromptParseStats] = {}
+
+    def record_attempt(self, prompt: str, parsed: bool) -> None:
+        stats = self._stats(prompt)
+        stats.attempts_total += 1
+        if not parsed:
+            stats.parse_failures_total += 1
+
+    def record_call(self, prompt: str, exhausted: bool) -> None:
+        stats = self._stats(prompt)
+        stats.calls_total += 1
+        if exhausted:
+            stats.exhausted_total += 1
+
+    def stats(self) -> dict:
+        return {
+            prompt: {
+                "calls_total": stats.calls_total,
+                "attempts_total": stats.attempts_total,
+                "parse_failures_total": stats.parse_failures_total,
+                "parse_failure_rate": (
+                    stats.parse_failures_total / stats.attempts_total
+                    if stats.attempts_total
+                    else 0.0
+                ),
+                "exhausted_total": stats.exhausted_total,
+            }
+            for prompt, stats in self._prompts.items()
+        }
+
+    def _stats(self, prompt: str) -> PromptParseStats:
+        if prompt not in self._prompts:
+            self._prompts[prompt] = PromptParseStats()
+        return self._prompts[prompt]
+
+
+genai_parse_stats = GenaiParseStats()
+
+
+GenaiParseStatsDependency = Annotated[
+    GenaiParseStats, Depends(lambda: genai_parse_stats)
+]
@@ -0,0 +1,185 @@
+import asyncio
+import logging
+from typing import Annotated, Dict, NamedTuple, Optional
+
+import httpx
+from fastapi import Depends
+
+from common.app_settings import settings
+from common.domain_limiter import DomainLimiter, domain_limiter
+from common.replay_store import ReplayStore, replay_store
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "uk-UA,uk;q=0.9,en;q=0.8",
+}
+
+
+class HttpPage(NamedTuple):
+    html: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+    @property
+    def not_modified(self) -> bool:
+        return self.html is None
+
+
+class HttpFetcher:
+    """
+    Легкий шлях завантаження сторінок без браузера: один спільний
+    `httpx.AsyncClient` з пулом keep-alive з'єднань. Запити проходять через
+    той самий `DomainLimiter`, що й переходи в Playwright. У режимі
+    відтворення клієнт замість мережі отримує відповіді з `ReplayStore`.
+    """
+
+    def __init__(
+        self,
+        timeout_seconds: float,
+        max_connections: int,
+        max_keepalive_connections: int,
+        domain_limiter: DomainLimiter,
+        replay_store: ReplayStore,
+    ):
+        self.timeout_seconds = timeout_seconds
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.domain_limiter = domain_limiter
+        self.replay_store = replay_store
+        self._client: Optional[httpx.AsyncClient] = None
+
+        self._requests_total = 0
+        self._failed_total = 0
+        self._not_modified_total = 0
+        self._bytes_total = 0
+
+    async def start(self) -> None:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=DEFAULT_HEADERS,
+                timeout=self.timeout_seconds,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                ),
+                transport=(
+                    httpx.MockTransport(self._replay)
+                    if self.replay_store.replaying
+                    else None
+                ),
+            )
+
+    async def stop(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def fetch(
+        self,
+        url: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> Optional[HttpPage]:
+        """
+        Повертає сторінку або None, якщо її не вдалося отримати без браузера
+        (помилка мережі, не 200/304 або не HTML). Якщо передано `etag` чи
+        `last_modified`, запит умовний, і на 304 повертається сторінка без HTML.
+        """
+        await self.start()
+        assert self._client is not None
+
+        headers: Dict[str, str] = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        self._requests_total += 1
+        async with self.domain_limiter.slot(url) as slot:
+            try:
+                response = await self._client.get(url, headers=headers)
+            except httpx.TimeoutException:
+                slot.record_timeout()
+                self._failed_total += 1
+                return None
+            except httpx.HTTPError as e:
+                logger.info("HTTP fetch of %s failed: %s", url, e)
+                slot.record(None)
+                self._failed_total += 1
+                return None
+            slot.record(response.status_code, response.headers.get("retry-after"))
+
+        if self.replay_store.recording and response.status_code != 304:
+            await asyncio.to_thread(
+                self.replay_store.save_response,
+                "GET",
+                url,
+                None,
+                response.status_code,
+                dict(response.headers),
+                response.content,
+            )
+
+        if response.status_code == 304 and headers:
+            self._not_modified_total += 1
+            return HttpPage(None, etag, last_modified)
+
+        content_type = response.headers.get("content-type", "")
+        if response.status_code != 200 or "html" not in content_type:
+            self._failed_total += 1
+            return None
+
+        self._bytes_total += len(response.content)
+        return HttpPage(
+            response.text,
+            response.headers.get("etag"),
+            response.headers.get("last-modified"),
+        )
+
+    async def _replay(self, request: httpx.Request) -> httpx.Response:
+        recorded = await asyncio.to_thread(
+            self.replay_store.load_response, "GET", str(request.url)
+        )
+        if recorded is None:
+            raise httpx.ConnectError(
+                f"No recorded response for {request.url}", request=request
+            )
+
+        headers = {name.lower(): value for name, value in recorded.headers.items()}
+        etag = request.headers.get("if-none-match")
+        last_modified = request.headers.get("if-modified-since")
+        if (etag and etag == headers.get("etag")) or (
+            last_modified and last_modified == headers.get("last-modified")
+        ):
+            return httpx.Response(304, headers=headers, request=request)
+        return httpx.Response(
+            recorded.status, headers=headers, content=recorded.body, request=request
+        )
+
+    def stats(self) -> dict:
+        return {
+            "started": self._client is not None,
+            "requests_total": self._requests_total,
+            "failed_total": self._failed_total,
+            "not_modified_total": self._not_modified_total,
+            "bytes_total": self._bytes_total,
+        }
+
+
+http_fetcher = HttpFetcher(
+    timeout_seconds=settings.HTTP_TIMEOUT_SECONDS,
+    max_connections=settings.HTTP_MAX_CONNECTIONS,
+    max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    domain_limiter=domain_limiter,
+    replay_store=replay_store,
+)
+
+
+HttpFetcherDependency = Annotated[HttpFetcher, Depends(lambda: http_fetcher)]
@@ -0,0 +1,94 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Annotated, Any, Callable, Optional, TypeVar
+
+from fastapi import Depends
+
+from common.app_settings import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ProcessPool:
+    """
+    Спільний пул процесів для CPU-важкого парсингу HTML, щоб він не блокував
+    цикл подій і використовував усі ядра. Пул створюється при першому виклику
+    і перестворюється, якщо один з процесів аварійно завершився.
+
+    Режим `thread` виконує задачі в потоках (для парсерів, що відпускають GIL),
+    а `inline` - прямо в циклі подій, як раніше.
+    """
+
+    def __init__(self, workers: Optional[int], mode: str = "process"):
+        self.workers = workers
+        self.mode = mode
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+        self._in_flight = 0
+        self._tasks_total = 0
+        self._broken_total = 0
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        self._in_flight += 1
+        try:
+            if self.mode == "inline":
+                return fn(*args)
+            if self.mode == "thread":
+                return await asyncio.to_thread(fn, *args)
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        except BrokenProcessPool:
+            self._broken_total += 1
+            logger.warning("Process pool is broken, recreating it")
+            self._shutdown()
+            raise
+        finally:
+            self._in_flight -= 1
+            self._tasks_total += 1
+
+    def stop(self) -> None:
+        self._shutdown()
+
+    def stats(self) -> dict:
+        return {
+            "mode": self.mode,
+            "workers": (
+                self._executor._max_workers if self._executor is not None else None
+            ),
+            "started": self._executor is not None,
+            "in_flight": self._in_flight,
+            "tasks_total": self._tasks_total,
+            "broken_total": self._broken_total,
+        }
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # forkserver не успадковує потоки та стан циклу подій сервера.
+            start_method = (
+                "forkserver"
+                if "forkserver" in multiprocessing.get_all_start_methods()
+                else None
+            )
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context(start_method),
+            )
+        return self._executor
+
+    def _shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+process_pool = ProcessPool(
+    workers=settings.PROCESS_POOL_WORKERS, mode=settings.PROCESS_POOL_MODE
+)
+
+
+ProcessPoolDependency = Annotated[ProcessPool, Depends(lambda: process_pool)]
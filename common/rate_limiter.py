@@ -0,0 +1,112 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Annotated, AsyncIterator
+
+from fastapi import Depends
+
+from common.app_settings import settings
+
+
+class TokenBucket:
+    """
+    Відро токенів, що поповнюється зі швидкістю `rate_per_minute`.
+    Виклики, яким не вистачає токенів, чекають, а не завершуються помилкою.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: float):
+        self.rate_per_second = rate_per_minute / 60
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1) -> None:
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                await asyncio.sleep((amount - self._tokens) / self.rate_per_second)
+
+    def set_rate(self, rate_per_minute: float) -> None:
+        self._refill()
+        self.rate_per_second = rate_per_minute / 60
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated_at) * self.rate_per_second,
+        )
+        self._updated_at = now
+
+
+class RateLimiter:
+    """
+    Спільне обмеження кількості одночасних викликів разом із лімітами
+    запитів (RPM) та токенів (TPM) на хвилину.
+    """
+
+    def __init__(
+        self, max_concurrency: int, requests_per_minute: int, tokens_per_minute: int
+    ):
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._requests = TokenBucket(requests_per_minute, requests_per_minute)
+        self._tokens = TokenBucket(tokens_per_minute, tokens_per_minute)
+
+        self._in_flight = 0
+        self._waiting = 0
+        self._calls_total = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+
+    @asynccontextmanager
+    async def slot(self, tokens: int) -> AsyncIterator[None]:
+        started_at = time.perf_counter()
+        self._waiting += 1
+        try:
+            await self._requests.acquire()
+            await self._tokens.acquire(tokens)
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        waited = time.perf_counter() - started_at
+        self._calls_total += 1
+        self._wait_seconds_total += waited
+        self._wait_seconds_max = max(self._wait_seconds_max, waited)
+
+        self._in_flight += 1
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            self._semaphore.release()
+
+    def stats(self) -> dict:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self._in_flight,
+            "waiting": self._waiting,
+            "calls_total": self._calls_total,
+            "wait_seconds_avg": (
+                self._wait_seconds_total / self._calls_total
+                if self._calls_total
+                else 0.0
+            ),
+            "wait_seconds_max": self._wait_seconds_max,
+        }
+
+
+genai_rate_limiter = RateLimiter(
+    max_concurrency=settings.GENAI_MAX_CONCURRENCY,
+    requests_per_minute=settings.GENAI_REQUESTS_PER_MINUTE,
+    tokens_per_minute=settings.GENAI_TOKENS_PER_MINUTE,
+)
+
+
+GenaiRateLimiterDependency = Annotated[RateLimiter, Depends(lambda: genai_rate_limiter)]
@@ -0,0 +1,160 @@
+import base64
+import datetime
+import gzip
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Annotated, Dict, List, NamedTuple, Optional
+
+from fastapi import Depends
+
+from common.app_settings import settings
+
+REPLAY_MODE_OFF = "off"
+REPLAY_MODE_RECORD = "record"
+REPLAY_MODE_REPLAY = "replay"
+
+ENTRY_SUFFIX = ".json.gz"
+
+# Тіло зберігається вже розпакованим, тому ці заголовки при відтворенні
+# зламали б відповідь.
+DROPPED_HEADERS = frozenset(("content-encoding", "content-length", "transfer-encoding"))
+
+
+class RecordedResponse(NamedTuple):
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+
+class ReplayStore:
+    """
+    Записи відповідей сторінок і Gemini на диску для відтворення скрейпінгу
+    без мережі. Кожна відповідь зберігається окремим файлом у форматі запису
+    HAR (`request`/`response`), адресованим хешем запиту.
+    У режимі `record` відповіді записуються, у режимі `replay` віддаються з диска.
+    """
+
+    def __init__(self, root: str, mode: str):
+        self.root = Path(root)
+        self.mode = mode
+
+        self._recorded_total = 0
+        self._replayed_total = 0
+        self._misses_total = 0
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == REPLAY_MODE_RECORD
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == REPLAY_MODE_REPLAY
+
+    @staticmethod
+    def request_key(method: str, url: str, post_data: Optional[bytes] = None) -> str:
+        digest = hashlib.sha256(f"{method.upper()} {url}".encode("utf-8"))
+        if post_data:
+            digest.update(b"\n")
+            digest.update(post_data)
+        return digest.hexdigest()
+
+    @staticmethod
+    def prompt_key(model: str, prompt: str) -> str:
+        return hashlib.sha256(f"{model}\n{prompt}".encode("utf-8")).hexdigest()
+
+    def save_response(
+        self,
+        method: str,
+        url: str,
+        post_data: Optional[bytes],
+        status: int,
+        headers: Dict[str, str],
+        body: bytes,
+    ) -> None:
+        self._write(
+            self._path("http", self.request_key(method, url, post_data)),
+            {
+                "startedDateTime": self._now(),
+                "request": {"method": method.upper(), "url": url},
+                "response": {
+                    "status": status,
+                    "headers": [
+                        {"name": name, "value": value}
+                        for name, value in headers.items()
+                        if name.lower() not in DROPPED_HEADERS
+                    ],
+                    "content": {
+                        "size": len(body),
+                        "encoding": "base64",
+                        "text": base64.b64encode(body).decode("ascii"),
+                    },
+                },
+            },
+        )
+
+    def load_response(
+        self, method: str, url: str, post_data: Optional[bytes] = None
+    ) -> Optional[RecordedResponse]:
+        entry = self._read(self._path("http", self.request_key(method, url, post_data)))
+        if entry is None:
+            return None
+        response = entry["response"]
+        headers: List[dict] = response["headers"]
+        return RecordedResponse(
+            status=response["status"],
+            headers={header["name"]: header["value"] for header in headers},
+            body=base64.b64decode(response["content"]["text"]),
+        )
+
+    def save_genai(self, model: str, prompt: str, text: str) -> None:
+        self._write(
+            self._path("genai", self.prompt_key(model, prompt)),
+            {
+                "startedDateTime": self._now(),
+                "request": {"model": model, "prompt": prompt},
+                "response": {"text": text},
+            },
+        )
+
+    def load_genai(self, model: str, prompt: str) -> Optional[str]:
+        entry = self._read(self._path("genai", self.prompt_key(model, prompt)))
+        return entry["response"]["text"] if entry is not None else None
+
+    def stats(self) -> dict:
+        return {
+            "mode": self.mode,
+            "root": str(self.root),
+            "recorded_total": self._recorded_total,
+            "replayed_total": self._replayed_total,
+            "misses_total": self._misses_total,
+        }
+
+    def _path(self, kind: str, key: str) -> Path:
+        return self.root / kind / key[:2] / f"{key}{ENTRY_SUFFIX}"
+
+    def _write(self, path: Path, entry: dict) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = gzip.compress(json.dumps(entry, ensure_ascii=False).encode("utf-8"))
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+        self._recorded_total += 1
+
+    def _read(self, path: Path) -> Optional[dict]:
+        if not path.exists():
+            self._misses_total += 1
+            return None
+        self._replayed_total += 1
+        return json.loads(gzip.decompress(path.read_bytes()))
+
+    def _now(self) -> str:
+        return datetime.datetime.now(datetime.timezone.utc).isoformat()
+
+
+replay_store = ReplayStore(root=settings.REPLAY_DIR, mode=settings.REPLAY_MODE)
+
+
+ReplayStoreDependency = Annotated[ReplayStore, Depends(lambda: replay_store)]
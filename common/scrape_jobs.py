@@ -0,0 +1,303 @@
+import asyncio
+import datetime
+import logging
+import uuid
+from collections import OrderedDict
+from typing import (
+    Annotated,
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Type,
+    TypeVar,
+)
+
+from fastapi import Depends, HTTPException
+
+from common.app_settings import settings
+from common.services.backfill_service import create_backfill_service
+from common.services.scrape_service import create_scrape_service
+from db import SessionLocal
+from schemas.backfill_schema import (
+    BackfillJobSchema,
+    BackfillResultSchema,
+    BackfillSchema,
+)
+from schemas.scrape_schema import ScrapeJobSchema, ScrapeSchema
+
+logger = logging.getLogger(__name__)
+
+FINISHED_STATUSES = ("succeeded", "failed")
+
+JobT = TypeVar("JobT", bound="BackgroundJob")
+
+
+class BackgroundJob:
+    """
+    Фонова задача: зберігає статус та історію подій, яку отримують підписники
+    SSE-потоку. Підкласи виконують саму роботу в `run` і рахують прогрес у
+    `_count`.
+    """
+
+    def __init__(self):
+        self.id = uuid.uuid4().hex
+        self.status = "queued"
+        self.created_at = datetime.datetime.now(datetime.timezone.utc)
+        self.started_at: Optional[datetime.datetime] = None
+        self.finished_at: Optional[datetime.datetime] = None
+        self.error: Optional[str] = None
+
+        self.events: List[Dict[str, Any]] = []
+        self._subscribers: Set[asyncio.Queue] = set()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def publish(self, event: Dict[str, Any]) -> None:
+        self._count(event)
+        self.events.append(event)
+        for queue in self._subscribers:
+            queue.put_nowait(event)
+
+    async def stream(self) -> AsyncIterator[Dict[str, Any]]:
+        queue: asyncio.Queue = asyncio.Queue()
+        history = list(self.events)
+        self._subscribers.add(queue)
+        try:
+            for event in history:
+                yield event
+            if self.finished:
+                return
+            while True:
+                event = await queue.get()
+                yield event
+                if event["event"] == "job_finished":
+                    return
+        finally:
+            self._subscribers.discard(queue)
+
+    async def run(self) -> None:
+        raise NotImplementedError
+
+    def _count(self, event: Dict[str, Any]) -> None:
+        pass
+
+
+class ScrapeJob(BackgroundJob):
+    """
+    Фонова задача скрейпінгу з лічильниками прогресу по товарах і рядках.
+    """
+
+    def __init__(self, request: ScrapeSchema):
+        super().__init__()
+        self.request = request
+        self.products_total = 0
+        self.products_scraped = 0
+        self.products_failed = 0
+        self.products_unchanged = 0
+        self.persisted = 0
+        self.unchanged = 0
+        self.dropped = 0
+        self.characteristics_extracted = 0
+        self.platform_errors: List[Any] = []
+
+    async def run(self) -> None:
+        async with SessionLocal() as session:
+            scrape_service = create_scrape_service(session)
+            result = await scrape_service.scrape(
+                self.request.product_id,
+                self.request.platforms_ids,
+                self.request.page_concurrency,
+                self.request.platform_concurrency,
+                characteristics=self.request.characteristics,
+                max_positions=self.request.max_positions,
+                on_progress=self.publish,
+            )
+        self.persisted = result["persisted"]
+        self.unchanged = result["unchanged"]
+        self.dropped = result["dropped"]
+        self.platform_errors = result["platform_errors"]
+
+    def _count(self, event: Dict[str, Any]) -> None:
+        if event["event"] == "links_found":
+            self.products_total += event["products_total"]
+        elif event["event"] == "product_scraped":
+            self.products_scraped += 1
+        elif event["event"] == "product_failed":
+            self.products_failed += 1
+        elif event["event"] == "product_unchanged":
+            self.products_unchanged += 1
+        elif event["event"] == "characteristics_extracted":
+            self.characteristics_extracted += 1
+        elif event["event"] == "rows_persisted":
+            self.persisted = event["persisted"]
+            self.unchanged = event["unchanged"]
+        elif event["event"] == "rows_dropped":
+            self.dropped = event["dropped"]
+
+    def schema(self) -> ScrapeJobSchema:
+        return ScrapeJobSchema(
+            id=self.id,
+            status=self.status,  # type: ignore
+            product_id=self.request.product_id,
+            platforms_ids=self.request.platforms_ids,
+            created_at=self.created_at,
+            started_at=self.started_at,
+            finished_at=self.finished_at,
+            products_total=self.products_total,
+            products_scraped=self.products_scraped,
+            products_failed=self.products_failed,
+            products_unchanged=self.products_unchanged,
+            persisted=self.persisted,
+            unchanged=self.unchanged,
+            dropped=self.dropped,
+            characteristics_extracted=self.characteristics_extracted,
+            platform_errors=self.platform_errors,
+            error=self.error,
+        )
+
+
+class BackfillJob(BackgroundJob):
+    """
+    Фонова задача повторного розбору HTML-знімків; прогрес оновлюється після
+    кожного обробленого пакета рядків.
+    """
+
+    def __init__(self, request: BackfillSchema):
+        super().__init__()
+        self.request = request
+        self.result = BackfillResultSchema()
+
+    async def run(self) -> None:
+        async with SessionLocal() as session:
+            backfill_service = create_backfill_service(session)
+            self.result = await backfill_service.backfill(
+                self.request, on_progress=self.publish
+            )
+
+    def _count(self, event: Dict[str, Any]) -> None:
+        if event["event"] == "batch_processed":
+            self.result = self.result.model_copy(
+                update={
+                    key: event[key]
+                    for key in ("scanned", "parsed", "changed", "written", "failed")
+                }
+            )
+
+    def schema(self) -> BackfillJobSchema:
+        return BackfillJobSchema(
+            id=self.id,
+            status=self.status,  # type: ignore
+            platform_id=self.request.platform_id,
+            product_id=self.request.product_id,
+            dry_run=self.request.dry_run,
+            created_at=self.created_at,
+            started_at=self.started_at,
+            finished_at=self.finished_at,
+            result=self.result,
+            error=self.error,
+        )
+
+
+class ScrapeJobManager:
+    """
+    Пул фонових воркерів з обмеженою чергою задач скрейпінгу та backfill.
+    """
+
+    def __init__(self, workers: int, queue_size: int, retention: int):
+        self.workers = workers
+        self.retention = retention
+        self._queue: asyncio.Queue[BackgroundJob] = asyncio.Queue(maxsize=queue_size)
+        self._jobs: "OrderedDict[str, BackgroundJob]" = OrderedDict()
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._work()) for _ in range(self.workers)
+            ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, job: JobT) -> JobT:
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise HTTPException(
+                status_code=503, detail="Черга фонових задач переповнена"
+            )
+        self._jobs[job.id] = job
+        self._evict_finished()
+        return job
+
+    def get(self, job_id: str, job_type: Type[JobT]) -> Optional[JobT]:
+        job = self._jobs.get(job_id)
+        return job if isinstance(job, job_type) else None
+
+    def get_all(self, job_type: Type[JobT]) -> List[JobT]:
+        return [job for job in self._jobs.values() if isinstance(job, job_type)]
+
+    def has_active(self, product_id: int, platform_id: int) -> bool:
+        return any(
+            not job.finished
+            and isinstance(job, ScrapeJob)
+            and job.request.product_id == product_id
+            and (
+                not job.request.platforms_ids
+                or platform_id in job.request.platforms_ids
+            )
+            for job in self._jobs.values()
+        )
+
+    async def _work(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: BackgroundJob) -> None:
+        job.status = "running"
+        job.started_at = datetime.datetime.now(datetime.timezone.utc)
+        job.publish({"event": "job_started", "job_id": job.id})
+        try:
+            await job.run()
+            job.status = "succeeded"
+        except HTTPException as e:
+            job.status = "failed"
+            job.error = str(e.detail)
+        except Exception as e:
+            logger.exception("Background job %s failed", job.id)
+            job.status = "failed"
+            job.error = str(e)
+        finally:
+            job.finished_at = datetime.datetime.now(datetime.timezone.utc)
+            job.publish(
+                {"event": "job_finished", "job_id": job.id, "status": job.status}
+            )
+
+    def _evict_finished(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[: max(0, len(self._jobs) - self.retention)]:
+            del self._jobs[job_id]
+
+
+scrape_job_manager = ScrapeJobManager(
+    workers=settings.SCRAPE_JOB_WORKERS,
+    queue_size=settings.SCRAPE_JOB_QUEUE_SIZE,
+    retention=settings.SCRAPE_JOB_RETENTION,
+)
+
+
+ScrapeJobManagerDependency = Annotated[
+    ScrapeJobManager, Depends(lambda: scrape_job_manager)
+]
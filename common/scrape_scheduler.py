@@ -0,0 +1,178 @@
+import asyncio
+import datetime
+import logging
+import random
+from typing import Annotated, Dict, Optional
+
+from fastapi import Depends, HTTPException
+
+from common.app_settings import settings
+from common.scrape_jobs import ScrapeJob, ScrapeJobManager, scrape_job_manager
+from crud.scrape_schedule_repository import ScrapeScheduleRepository
+from db import SessionLocal
+from schemas.scrape_schema import ScrapeSchema
+
+logger = logging.getLogger(__name__)
+
+
+def utcnow() -> datetime.datetime:
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+class ScrapeScheduler:
+    """
+    Періодично ставить у чергу скрейпінг пар товар-платформа за їхнім розкладом.
+    Наступний запуск рахується від поточного моменту з випадковим зсувом (jitter),
+    тому пропущені запуски не накопичуються. Пара не запускається, поки її
+    попередня задача ще виконується. Після перезапуску прострочені розклади
+    розподіляються на `startup_spread_minutes`, а не стартують усі одразу.
+    """
+
+    def __init__(
+        self,
+        job_manager: ScrapeJobManager,
+        enabled: bool,
+        poll_interval_seconds: int,
+        batch_size: int,
+        jitter: float,
+        startup_spread_minutes: int,
+    ):
+        self.job_manager = job_manager
+        self.enabled = enabled
+        self.poll_interval_seconds = poll_interval_seconds
+        self.batch_size = batch_size
+        self.jitter = jitter
+        self.startup_spread_minutes = startup_spread_minutes
+
+        self._task: Optional[asyncio.Task] = None
+        self._active: Dict[int, str] = {}
+        self._last_tick_at: Optional[datetime.datetime] = None
+        self._submitted_total = 0
+        self._skipped_overlap_total = 0
+        self._skipped_queue_full_total = 0
+
+    async def start(self) -> None:
+        if not self.enabled or self._task is not None:
+            return
+        try:
+            await self._spread_overdue()
+        except Exception:
+            logger.exception("Failed to spread overdue scrape schedules")
+        self._task = asyncio.create_task(self._run_periodically())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def next_run_at(
+        self, interval_minutes: int, now: Optional[datetime.datetime] = None
+    ) -> datetime.datetime:
+        factor = 1 + random.uniform(-self.jitter, self.jitter)
+        return (now or utcnow()) + datetime.timedelta(minutes=interval_minutes * factor)
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "running": self._task is not None,
+            "last_tick_at": self._last_tick_at,
+            "active_schedules": len(self._active),
+            "submitted_total": self._submitted_total,
+            "skipped_overlap_total": self._skipped_overlap_total,
+            "skipped_queue_full_total": self._skipped_queue_full_total,
+        }
+
+    async def _run_periodically(self) -> None:
+        while True:
+            try:
+                await self._tick()
+            except Exception:
+                logger.exception("Scrape scheduler tick failed")
+            await asyncio.sleep(self.poll_interval_seconds)
+
+    async def _tick(self) -> None:
+        now = utcnow()
+        self._last_tick_at = now
+        async with SessionLocal() as session:
+            repository = ScrapeScheduleRepository(session)
+            await self._collect_finished(repository)
+
+            # Значення копіюються до commit, бо після нього об'єкти прострочуються.
+            due = [
+                (s.id, s.product_id, s.platform_id, s.interval_minutes)
+                for s in await repository.get_due(now, self.batch_size)
+            ]
+            for schedule_id, product_id, platform_id, interval_minutes in due:
+                if schedule_id in self._active or self.job_manager.has_active(
+                    product_id, platform_id
+                ):
+                    self._skipped_overlap_total += 1
+                    logger.info(
+                        "Skipping scheduled scrape of product %s on platform %s: "
+                        "previous job is still running",
+                        product_id,
+                        platform_id,
+                    )
+                    await repository.set_next_run_at(
+                        schedule_id, self.next_run_at(interval_minutes, now)
+                    )
+                    continue
+
+                try:
+                    job = self.job_manager.submit(
+                        ScrapeJob(
+                            ScrapeSchema(
+                                product_id=product_id, platforms_ids=[platform_id]
+                            )
+                        )
+                    )
+                except HTTPException:
+                    self._skipped_queue_full_total += 1
+                    logger.info("Scrape job queue is full, retrying on next tick")
+                    break
+
+                self._active[schedule_id] = job.id
+                self._submitted_total += 1
+                await repository.mark_started(
+                    schedule_id, job.id, self.next_run_at(interval_minutes, now)
+                )
+
+    async def _collect_finished(self, repository: ScrapeScheduleRepository) -> None:
+        for schedule_id, job_id in list(self._active.items()):
+            job = self.job_manager.get(job_id, ScrapeJob)
+            if job is not None and not job.finished:
+                continue
+            await repository.mark_finished(
+                schedule_id, job_id, job.status if job is not None else "unknown"
+            )
+            del self._active[schedule_id]
+
+    async def _spread_overdue(self) -> None:
+        now = utcnow()
+        async with SessionLocal() as session:
+            repository = ScrapeScheduleRepository(session)
+            overdue = [
+                (s.id, s.interval_minutes) for s in await repository.get_due(now)
+            ]
+            for schedule_id, interval_minutes in overdue:
+                spread = min(self.startup_spread_minutes, interval_minutes)
+                delay = datetime.timedelta(minutes=random.uniform(0, spread))
+                await repository.set_next_run_at(schedule_id, now + delay)
+        if overdue:
+            logger.info("Spread %d overdue scrape schedules", len(overdue))
+
+
+scrape_scheduler = ScrapeScheduler(
+    job_manager=scrape_job_manager,
+    enabled=settings.SCHEDULER_ENABLED,
+    poll_interval_seconds=settings.SCHEDULER_POLL_INTERVAL_SECONDS,
+    batch_size=settings.SCHEDULER_BATCH_SIZE,
+    jitter=settings.SCHEDULER_JITTER,
+    startup_spread_minutes=settings.SCHEDULER_STARTUP_SPREAD_MINUTES,
+)
+
+
+ScrapeSchedulerDependency = Annotated[
+    ScrapeScheduler, Depends(lambda: scrape_scheduler)
+]
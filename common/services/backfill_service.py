@@ -0,0 +1,215 @@
+import asyncio
+import logging
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.app_settings import AppSettingsDependency, settings
+from common.process_pool import ProcessPoolDependency, process_pool
+from common.snapshot_store import (
+    SnapshotStoreDependency,
+    read_snapshot,
+    snapshot_store,
+)
+from crud.platform_selectors_repository import (
+    PlatformSelectorsRepository,
+    PlatformSelectorsRepositoryDependency,
+)
+from crud.scraped_product_data_repository import (
+    ScrapedProductDataRepository,
+    ScrapedProductDataRepositoryDependency,
+)
+from models.scraped_product_data import ScrapedProductData
+from schemas.backfill_schema import (
+    BackfillErrorSchema,
+    BackfillResultSchema,
+    BackfillSchema,
+)
+from utils.bs4.extract_product_data import parse_product_data
+
+logger = logging.getLogger(__name__)
+
+MAX_REPORTED_ERRORS = 50
+
+ParsedRow = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+
+def parse_snapshot_batch(
+    root: str,
+    items: List[Tuple[int, str]],
+    selectors: dict,
+    backend: Optional[str] = None,
+) -> List[ParsedRow]:
+    """
+    Виконується в пулі процесів: сам читає знімки з диска, щоб між процесами
+    передавались лише ключі та розібрані поля, а не HTML.
+    """
+    results: List[ParsedRow] = []
+    for row_id, key in items:
+        try:
+            html = read_snapshot(Path(root), key)
+            if html is None:
+                results.append((row_id, None, f"Snapshot {key} not found"))
+            else:
+                results.append(
+                    (row_id, parse_product_data(html, selectors, backend), None)
+                )
+        except Exception as e:
+            results.append((row_id, None, str(e)))
+    return results
+
+
+class BackfillService:
+    """
+    Повторно розбирає збережені HTML-знімки з новими селекторами та оновлює
+    (або додає) рядки `scraped_product_data` без повторного скрейпінгу.
+    """
+
+    def __init__(
+        self,
+        scraped_product_data_repository: ScrapedProductDataRepositoryDependency,
+        platform_selectors_repository: PlatformSelectorsRepositoryDependency,
+        snapshot_store: SnapshotStoreDependency,
+        process_pool: ProcessPoolDependency,
+        settings: AppSettingsDependency,
+    ):
+        self.scraped_product_data_repository = scraped_product_data_repository
+        self.platform_selectors_repository = platform_selectors_repository
+        self.snapshot_store = snapshot_store
+        self.process_pool = process_pool
+        self.settings = settings
+
+    async def backfill(
+        self,
+        request: BackfillSchema,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> BackfillResultSchema:
+        selectors = request.selectors
+        if selectors is None:
+            cached = await self.platform_selectors_repository.get_by_platform_id(
+                request.platform_id
+            )
+            if cached is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail="Для платформи немає збережених селекторів",
+                )
+            selectors = cached.selectors
+
+        started_at = time.perf_counter()
+        result = BackfillResultSchema()
+        # Рядки, додані цим же запуском у режимі insert, мають більші id і
+        # ті самі знімки, тож межа фіксується до початку.
+        max_id = await self.scraped_product_data_repository.get_max_id() or 0
+        after_id = 0
+        while True:
+            rows = await self.scraped_product_data_repository.get_with_snapshots_after(
+                after_id,
+                max_id,
+                self.settings.BACKFILL_BATCH_SIZE,
+                request.platform_id,
+                request.product_id,
+                request.since,
+                request.until,
+            )
+            if not rows:
+                break
+            after_id = rows[-1].id
+            result.scanned += len(rows)
+
+            values = await self._reparse(rows, selectors, result)
+            result.changed += len(values)
+            if not request.dry_run:
+                result.written += await self._write(values, request.mode)
+
+            logger.info(
+                "Backfill platform %s: scanned %d, changed %d, failed %d",
+                request.platform_id,
+                result.scanned,
+                result.changed,
+                result.failed,
+            )
+            if on_progress is not None:
+                on_progress(
+                    {
+                        "event": "batch_processed",
+                        **result.model_dump(exclude={"errors", "seconds"}),
+                    }
+                )
+
+        result.seconds = time.perf_counter() - started_at
+        return result
+
+    async def _reparse(
+        self,
+        rows: List[ScrapedProductData],
+        selectors: dict,
+        result: BackfillResultSchema,
+    ) -> List[Dict[str, Any]]:
+        root = str(self.snapshot_store.root)
+        items = [(row.id, row.snapshot_hash) for row in rows]
+        task_size = self.settings.BACKFILL_TASK_SIZE
+        batches = await asyncio.gather(
+            *[
+                self.process_pool.run(
+                    parse_snapshot_batch,
+                    root,
+                    items[i : i + task_size],
+                    selectors,
+                    self.settings.PARSER_BACKEND,
+                )
+                for i in range(0, len(items), task_size)
+            ]
+        )
+
+        rows_by_id = {row.id: row for row in rows}
+        values = []
+        for row_id, parsed, error in (item for batch in batches for item in batch):
+            if parsed is None:
+                result.failed += 1
+                if len(result.errors) < MAX_REPORTED_ERRORS:
+                    result.errors.append(
+                        BackfillErrorSchema(id=row_id, detail=error or "")
+                    )
+                continue
+            result.parsed += 1
+            row = rows_by_id[row_id]
+            if any(getattr(row, field) != value for field, value in parsed.items()):
+                values.append({**self._row_values(row), **parsed})
+        return values
+
+    async def _write(self, values: List[Dict[str, Any]], mode: str) -> int:
+        if mode == "insert":
+            return await self.scraped_product_data_repository.bulk_insert_values(
+                [{k: v for k, v in item.items() if k != "id"} for item in values]
+            )
+        return await self.scraped_product_data_repository.bulk_update_values(values)
+
+    def _row_values(self, row: ScrapedProductData) -> Dict[str, Any]:
+        return {
+            "id": row.id,
+            "product_id": row.product_id,
+            "platform_id": row.platform_id,
+            "url_on_platform": row.url_on_platform,
+            "canonical_url": row.canonical_url,
+            "search_position": row.search_position,
+            "snapshot_hash": row.snapshot_hash,
+            "scraped_at": row.scraped_at,
+        }
+
+
+def create_backfill_service(session: AsyncSession) -> BackfillService:
+    """
+    Створює BackfillService поза обробкою HTTP-запиту (для CLI).
+    """
+    return BackfillService(
+        scraped_product_data_repository=ScrapedProductDataRepository(session),
+        platform_selectors_repository=PlatformSelectorsRepository(session),
+        snapshot_store=snapshot_store,
+        process_pool=process_pool,
+        settings=settings,
+    )
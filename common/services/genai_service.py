@@ -1,56 +1,362 @@
-from typing import Annotated
+import asyncio
+import logging
+from contextlib import aclosing
+from typing import Annotated, AsyncIterator, List, Optional, Type, TypeVar, get_args
 from fastapi import Depends, HTTPException
+from pydantic import BaseModel, ValidationError
 from common.app_settings import AppSettingsDependency
+from common.browser_pool import BrowserPoolDependency
+from common.genai_cache import GenaiCacheDependency
+from common.genai_parse_stats import GenaiParseStatsDependency
+from common.process_pool import ProcessPoolDependency
+from common.rate_limiter import GenaiRateLimiterDependency
+from common.replay_store import ReplayStoreDependency
 from google import genai
-from playwright.async_api import async_playwright
+from google.genai import errors, types
+from utils.bs4.reduce_html import ReducedHtml, estimate_tokens, reduce_html
+from utils.genai.normalize_json import strip_json_fences
+from utils.genai.stream_json import JsonArrayItemParser
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = {429, 500, 503}
+GENAI_MODEL = "gemini-2.0-flash-lite"
+
+REPLAY_STREAM_CHUNK_SIZE = 64
+
+ResponseModel = TypeVar("ResponseModel", bound=BaseModel)
 
 
 class GenaiService:
-    def __init__(self, settings: AppSettingsDependency):
+    def __init__(
+        self,
+        settings: AppSettingsDependency,
+        browser_pool: BrowserPoolDependency,
+        rate_limiter: GenaiRateLimiterDependency,
+        process_pool: ProcessPoolDependency,
+        replay_store: ReplayStoreDependency,
+        genai_cache: GenaiCacheDependency,
+        parse_stats: GenaiParseStatsDependency,
+    ):
         self.client = genai.Client(api_key=settings.GEMINI_API_KEY)
+        self.settings = settings
+        self.browser_pool = browser_pool
+        self.rate_limiter = rate_limiter
+        self.process_pool = process_pool
+        self.replay_store = replay_store
+        self.genai_cache = genai_cache
+        self.parse_stats = parse_stats
 
-    async def analyze_page(self, url: str, return_prompt: str) -> str:
+    async def fetch_html(
+        self, url: str, wait_selectors: Optional[List[str]] = None
+    ) -> str:
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page()
-                await page.goto(url, timeout=60_000)
-                await page.wait_for_load_state("networkidle")
-
-                html_content = await page.content()
-                await browser.close()
+            async with self.browser_pool.page() as page:
+                await self.browser_pool.goto(page, url, wait_selectors)
+
+                return await page.content()
         except Exception as e:
             raise HTTPException(
                 status_code=400,
                 detail=f"Помилка при завантаженні сторінки з Playwright: {str(e)}",
             )
 
-        prompt = f"""
+    async def analyze_page_as(
+        self, url: str, return_prompt: str, response_model: Type[ResponseModel]
+    ) -> ResponseModel:
+        html_content = await self.fetch_html(url)
+        return await self.analyze_html_as(html_content, return_prompt, response_model)
+
+    async def analyze_html_as(
+        self,
+        html_content: str,
+        return_prompt: str,
+        response_model: Type[ResponseModel],
+    ) -> ResponseModel:
+        """
+        Структурована відповідь: Gemini генерує JSON за схемою `response_model`,
+        а результат валідується в цю модель. Якщо відповідь не пройшла
+        валідацію, повторюється лише цей виклик, не більше
+        `GENAI_MAX_PARSE_RETRIES` разів.
+        """
+        reduced = await self._reduce_html(html_content)
+        name = response_model.__name__
+        cache_template = f"{return_prompt}\n{name}"
+
+        use_cache = self._use_cache()
+        if use_cache:
+            cached = await self._get_cached(cache_template, reduced.html)
+            if cached is not None:
+                try:
+                    return response_model.model_validate_json(cached)
+                except ValidationError:
+                    pass
+
+        prompt = self._build_prompt(return_prompt, reduced.html)
+        for attempt in range(self.settings.GENAI_MAX_PARSE_RETRIES + 1):
+            try:
+                response_text = await self._generate_content(prompt, response_model)
+            except Exception as e:
+                raise HTTPException(
+                    status_code=500, detail=f"Помилка при виклику Gemini API: {str(e)}"
+                )
+
+            try:
+                result = response_model.model_validate_json(
+                    strip_json_fences(response_text or "")
+                )
+            except ValidationError as e:
+                self.parse_stats.record_attempt(name, parsed=False)
+                logger.warning(
+                    "Gemini response for %s failed validation (attempt %d): %s",
+                    name,
+                    attempt + 1,
+                    e,
+                )
+                continue
+
+            self.parse_stats.record_attempt(name, parsed=True)
+            self.parse_stats.record_call(name, exhausted=False)
+            if use_cache:
+                await self._put_cached(
+                    cache_template, reduced.html, result.model_dump_json()
+                )
+            return result
+
+        self.parse_stats.record_call(name, exhausted=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Відповідь Gemini не відповідає схемі {name}",
+        )
+
+    async def stream_html_as(
+        self,
+        html_content: str,
+        return_prompt: str,
+        response_model: Type[BaseModel],
+        field: str,
+    ) -> AsyncIterator[BaseModel]:
+        """
+        Потокова версія `analyze_html_as` для відповідей зі списком `field`:
+        кожен елемент списку віддається, щойно Gemini його дописав. Якщо потік
+        не дав жодного елемента, виконується звичайний виклик з повторами.
+        """
+        reduced = await self._reduce_html(html_content)
+        name = response_model.__name__
+        cache_template = f"{return_prompt}\n{name}"
+
+        use_cache = self._use_cache()
+        if use_cache:
+            cached = await self._get_cached(cache_template, reduced.html)
+            if cached is not None:
+                try:
+                    result = response_model.model_validate_json(cached)
+                except ValidationError:
+                    result = None
+                if result is not None:
+                    for item in getattr(result, field):
+                        yield item
+                    return
+
+        item_model = get_args(response_model.model_fields[field].annotation)[0]
+        parser = JsonArrayItemParser(field)
+        yielded = 0
+        stream_error: Optional[Exception] = None
+        try:
+            async with aclosing(
+                self._generate_content_stream(
+                    self._build_prompt(return_prompt, reduced.html), response_model
+                )
+            ) as stream:
+                async for chunk in stream:
+                    for raw_item in parser.feed(chunk):
+                        try:
+                            item = item_model.model_validate(raw_item)
+                        except ValidationError as e:
+                            logger.info(
+                                "Skipping invalid streamed %s item: %s", name, e
+                            )
+                            continue
+                        yielded += 1
+                        yield item
+        except Exception as e:
+            stream_error = e
+
+        try:
+            result = response_model.model_validate_json(strip_json_fences(parser.text))
+        except ValidationError:
+            result = None
+        self.parse_stats.record_attempt(name, parsed=result is not None)
+        if result is not None:
+            self.parse_stats.record_call(name, exhausted=False)
+            if use_cache:
+                await self._put_cached(
+                    cache_template, reduced.html, result.model_dump_json()
+                )
+            return
+
+        if yielded:
+            # Віддані елементи вже в роботі, а повтор запиту дав би дублікати.
+            logger.warning(
+                "Gemini stream for %s ended after %d items: %s",
+                name,
+                yielded,
+                stream_error or "invalid JSON",
+            )
+            self.parse_stats.record_call(name, exhausted=False)
+            return
+
+        logger.warning(
+            "Gemini stream for %s returned no items, retrying without streaming: %s",
+            name,
+            stream_error or "invalid JSON",
+        )
+        result = await self.analyze_html_as(html_content, return_prompt, response_model)
+        for item in getattr(result, field):
+            yield item
+
+    async def _reduce_html(self, html_content: str) -> ReducedHtml:
+        reduced = await self.process_pool.run(
+            reduce_html, html_content, self.settings.GENAI_MAX_PROMPT_TOKENS
+        )
+        logger.info(
+            "Reduced page for Gemini from %d to %d chars%s",
+            reduced.original_size,
+            reduced.reduced_size,
+            " (truncated)" if reduced.truncated else "",
+        )
+        return reduced
+
+    def _build_prompt(self, return_prompt: str, html: str) -> str:
+        return f"""
         Потрібно проаналізувати сторінку та виконати умови нижче.
         
         {return_prompt}
         
         Дані:
-        {html_content}
+        {html}
         """
 
+    async def _get_cached(self, prompt_template: str, html: str) -> Optional[str]:
+        return await asyncio.to_thread(
+            self.genai_cache.get, GENAI_MODEL, prompt_template, html
+        )
+
+    async def _put_cached(self, prompt_template: str, html: str, text: str) -> None:
         try:
-            response = self.client.models.generate_content(
-                model="gemini-2.0-flash-lite",
-                contents=[prompt],
-                # model="gemini-2.0-flash-live-001",
-                # contents=[prompt],
+            await asyncio.to_thread(
+                self.genai_cache.put, GENAI_MODEL, prompt_template, html, text
             )
-            response_text = response.text
-        except Exception as e:
-            raise HTTPException(
-                status_code=500, detail=f"Помилка при виклику Gemini API: {str(e)}"
+        except OSError as e:
+            logger.warning("Failed to cache Gemini response: %s", e)
+
+    def _use_cache(self) -> bool:
+        # Під час запису кеш пропустив би виклики, які треба записати,
+        # а під час відтворення зробив би повторні прогони неоднаковими.
+        return self.settings.GENAI_CACHE_ENABLED and not (
+            self.replay_store.recording or self.replay_store.replaying
+        )
+
+    async def _generate_content(
+        self, prompt: str, response_schema: Optional[type] = None
+    ) -> str | None:
+        config = self._json_config(response_schema) if response_schema else None
+        attempt = 0
+        while True:
+            try:
+                async with self.rate_limiter.slot(estimate_tokens(prompt)):
+                    response = await self.client.aio.models.generate_content(
+                        model=GENAI_MODEL,
+                        contents=[prompt],
+                        config=config,
+                        # model="gemini-2.0-flash-live-001",
+                        # contents=[prompt],
+                    )
+                if self.replay_store.recording and response.text:
+                    await asyncio.to_thread(
+                        self.replay_store.save_genai, GENAI_MODEL, prompt, response.text
+                    )
+                return response.text
+            except errors.APIError as e:
+                attempt += 1
+                if (
+                    e.code not in RETRYABLE_STATUS_CODES
+                    or attempt > self.settings.GENAI_MAX_RETRIES
+                ):
+                    raise
+                delay = 2**attempt
+                logger.warning("Gemini API returned %s, retrying in %ss", e.code, delay)
+                await asyncio.sleep(delay)
+
+    async def _generate_content_stream(
+        self, prompt: str, response_schema: type
+    ) -> AsyncIterator[str]:
+        chunks: List[str] = []
+        async with self.rate_limiter.slot(estimate_tokens(prompt)):
+            async for response in await self.client.aio.models.generate_content_stream(
+                model=GENAI_MODEL,
+                contents=[prompt],
+                config=self._json_config(response_schema),
+            ):
+                if response.text:
+                    chunks.append(response.text)
+                    yield response.text
+        if self.replay_store.recording and chunks:
+            await asyncio.to_thread(
+                self.replay_store.save_genai, GENAI_MODEL, prompt, "".join(chunks)
             )
 
-        if not response_text:
-            raise HTTPException(status_code=400, detail="Помилка при аналізі сторінки")
+    def _json_config(self, response_schema: type) -> types.GenerateContentConfig:
+        return types.GenerateContentConfig(
+            response_mime_type="application/json",
+            response_schema=response_schema,
+        )
+
+
+class ReplayGenaiService(GenaiService):
+    """
+    GenaiService для відтворення записаного скрейпінгу: відповіді Gemini
+    беруться з `ReplayStore` за текстом запиту, без мережі та без лімітів.
+    """
+
+    async def _generate_content(
+        self, prompt: str, response_schema: Optional[type] = None
+    ) -> str | None:
+        text = await asyncio.to_thread(
+            self.replay_store.load_genai, GENAI_MODEL, prompt
+        )
+        if text is None:
+            raise LookupError("Немає записаної відповіді Gemini для цього запиту")
+        return text
+
+    async def _generate_content_stream(
+        self, prompt: str, response_schema: type
+    ) -> AsyncIterator[str]:
+        text = await self._generate_content(prompt, response_schema)
+        for start in range(0, len(text or ""), REPLAY_STREAM_CHUNK_SIZE):
+            yield text[start : start + REPLAY_STREAM_CHUNK_SIZE]  # type: ignore
+            await asyncio.sleep(0)
+
 
-        return response_text.strip()
+def get_genai_service(
+    settings: AppSettingsDependency,
+    browser_pool: BrowserPoolDependency,
+    rate_limiter: GenaiRateLimiterDependency,
+    process_pool: ProcessPoolDependency,
+    replay_store: ReplayStoreDependency,
+    genai_cache: GenaiCacheDependency,
+    parse_stats: GenaiParseStatsDependency,
+) -> GenaiService:
+    service_class = ReplayGenaiService if replay_store.replaying else GenaiService
+    return service_class(
+        settings,
+        browser_pool,
+        rate_limiter,
+        process_pool,
+        replay_store,
+        genai_cache,
+        parse_stats,
+    )
 
 
-GenaiServiceDependency = Annotated[GenaiService, Depends(GenaiService)]
+GenaiServiceDependency = Annotated[GenaiService, Depends(get_genai_service)]
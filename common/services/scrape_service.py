@@ -1,15 +1,173 @@
-from typing import Annotated, List
+import asyncio
+import datetime
+import logging
+from contextlib import aclosing
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlparse
 
-from fastapi import Depends, HTTPException
+from fastapi import HTTPException
+from playwright.async_api import Page
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from common.services.genai_service import GenaiServiceDependency
-from crud.platform_repository import PlatformRepositoryDependency
-from crud.product_repository import ProductRepositoryDependency
-from crud.scraped_product_data_repository import ScrapedProductDataRepositoryDependency
+from common.app_settings import AppSettingsDependency, settings
+from common.browser_pool import BrowserPoolDependency, browser_pool
+from common.genai_cache import genai_cache
+from common.genai_parse_stats import genai_parse_stats
+from common.http_fetcher import HttpFetcherDependency, http_fetcher
+from common.process_pool import ProcessPoolDependency, process_pool
+from common.rate_limiter import genai_rate_limiter
+from common.replay_store import ReplayStoreDependency, replay_store
+from common.services.genai_service import GenaiServiceDependency, get_genai_service
+from common.snapshot_store import SnapshotStoreDependency, snapshot_store
+from crud.page_fingerprint_repository import (
+    PageFingerprintRepository,
+    PageFingerprintRepositoryDependency,
+)
+from crud.page_observation_repository import (
+    PageObservationRepository,
+    PageObservationRepositoryDependency,
+)
+from crud.platform_repository import PlatformRepository, PlatformRepositoryDependency
+from crud.platform_selectors_repository import (
+    PlatformSelectorsRepository,
+    PlatformSelectorsRepositoryDependency,
+)
+from crud.product_characteristics_repository import (
+    ProductCharacteristicsRepository,
+    ProductCharacteristicsRepositoryDependency,
+)
+from crud.product_repository import ProductRepository, ProductRepositoryDependency
+from crud.scraped_product_data_repository import (
+    ScrapedProductDataRepository,
+    ScrapedProductDataRepositoryDependency,
+)
+from models.page_fingerprint import PageFingerprint
+from models.platform import Platform
+from models.platform_selectors import PlatformSelectors
 from models.scraped_product_data import ScrapedProductData
+from schemas.genai_schema import (
+    CharacteristicsSchema,
+    ProductSelectorsSchema,
+    SearchResultsSchema,
+    SearchSelectorsSchema,
+)
+from schemas.scrape_schema import PlatformScrapeErrorSchema
+from utils.bs4.content_hash import content_hash
 from utils.bs4.extract_product_data import extract_product_data
-from utils.genai.normalize_json import normalize_json
-from playwright.async_api import async_playwright
+from utils.bs4.extract_search_links import extract_search_page
+from utils.genai.prompts import (
+    CHARACTERISTICS_PROMPT,
+    PRODUCT_SELECTORS_PROMPT,
+    SEARCH_RESULTS_PROMPT,
+    SEARCH_SELECTORS_PROMPT,
+)
+from utils.scrape.canonical_url import canonical_url
+from utils.scrape.fetch_mode import FetchModeTracker
+from utils.scrape.fill_rate import FillRateCounter, has_required_fields
+from utils.scrape.read_ahead import iterate, prepend, read_ahead
+
+logger = logging.getLogger(__name__)
+
+
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+
+class PageResult(NamedTuple):
+    """
+    Результат обробки сторінки товару. `scraped_data` дорівнює None, якщо
+    сторінка не змінилась з минулого запуску і витягувати дані не треба.
+    `characteristics_html` заповнюється, коли для сторінки треба витягнути
+    характеристики.
+    """
+
+    scraped_data: Optional[ScrapedProductData]
+    content_hash: Optional[str]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    characteristics_html: Optional[str] = None
+
+
+def copy_scraped_data(
+    data: ScrapedProductData, url: str, position: int
+) -> ScrapedProductData:
+    """
+    Копія даних товару для іншої позиції пошуку, де трапився той самий товар.
+    """
+    fields = {
+        column.key: getattr(data, column.key)
+        for column in ScrapedProductData.__table__.columns
+        if column.key not in ("id", "scraped_at")
+    }
+    return ScrapedProductData(
+        **{**fields, "url_on_platform": url, "search_position": position}
+    )
+
+
+class SearchPage(NamedTuple):
+    """
+    Сторінка результатів пошуку: селектори, якими вона розібрана (None, якщо
+    посилання дав Gemini), посилання на товари (список або потік від Gemini)
+    і URL наступної сторінки, знайдений за `next_page_selector`.
+    """
+
+    selectors: Optional[dict]
+    links: Union[List[Dict], AsyncIterator[Dict]]
+    next_url: Optional[str] = None
+
+
+class ScrapeRun:
+    """
+    Стан одного запуску скрейпінгу, спільний для всіх платформ і сторінок.
+    """
+
+    def __init__(
+        self,
+        product_id: int,
+        search: str,
+        page_concurrency: int,
+        platform_concurrency: int,
+        persist_chunk_size: int,
+        max_positions: int,
+        characteristics: bool = False,
+        characteristics_concurrency: int = 1,
+        on_progress: Optional[ProgressCallback] = None,
+    ):
+        self.product_id = product_id
+        self.search = search
+        self.page_semaphore = asyncio.Semaphore(page_concurrency)
+        self.platform_semaphore = asyncio.Semaphore(platform_concurrency)
+        self.persist_chunk_size = persist_chunk_size
+        self.max_positions = max_positions
+        self.characteristics = characteristics
+        self.characteristics_semaphore = asyncio.Semaphore(characteristics_concurrency)
+        self.on_progress = on_progress
+
+        self.db_lock = asyncio.Lock()
+        self.pending: List[ScrapedProductData] = []
+        self.pending_observations: List[Dict[str, Any]] = []
+        self.pending_fingerprints: Dict[str, Dict[str, Any]] = {}
+        self.persisted = 0
+        self.unchanged = 0
+        self.dropped = 0
+
+        self.characteristics_urls: Set[str] = set()
+        self.characteristics_tasks: List[asyncio.Task] = []
+        self.characteristics_extracted = 0
+
+    def report(self, event: str, **data: Any) -> None:
+        if self.on_progress is not None:
+            self.on_progress({"event": event, **data})
 
 
 class ScrapeService:
@@ -17,198 +175,1005 @@ class ScrapeService:
         self,
         platform_repository: PlatformRepositoryDependency,
         product_repository: ProductRepositoryDependency,
+        product_characteristics_repository: ProductCharacteristicsRepositoryDependency,
         scraped_product_data_repository: ScrapedProductDataRepositoryDependency,
+        platform_selectors_repository: PlatformSelectorsRepositoryDependency,
+        page_fingerprint_repository: PageFingerprintRepositoryDependency,
+        page_observation_repository: PageObservationRepositoryDependency,
         genai_service: GenaiServiceDependency,
+        browser_pool: BrowserPoolDependency,
+        http_fetcher: HttpFetcherDependency,
+        snapshot_store: SnapshotStoreDependency,
+        process_pool: ProcessPoolDependency,
+        replay_store: ReplayStoreDependency,
+        settings: AppSettingsDependency,
     ):
         self.platform_repository = platform_repository
         self.product_repository = product_repository
+        self.product_characteristics_repository = product_characteristics_repository
         self.scraped_product_data_repository = scraped_product_data_repository
+        self.platform_selectors_repository = platform_selectors_repository
+        self.page_fingerprint_repository = page_fingerprint_repository
+        self.page_observation_repository = page_observation_repository
         self.genai_service = genai_service
+        self.browser_pool = browser_pool
+        self.http_fetcher = http_fetcher
+        self.snapshot_store = snapshot_store
+        self.process_pool = process_pool
+        self.replay_store = replay_store
+        self.settings = settings
 
-    async def scrape(self, product_id: int, platforms_ids: List[int]):
-        browser = None
-        scraped_products: List[ScrapedProductData] = []
+    async def scrape(
+        self,
+        product_id: int,
+        platforms_ids: List[int],
+        page_concurrency: Optional[int] = None,
+        platform_concurrency: Optional[int] = None,
+        characteristics: Optional[bool] = None,
+        max_positions: Optional[int] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ):
+        """
+        `characteristics` вмикає або вимикає етап витягування характеристик
+        для цього запуску; None означає налаштування за замовчуванням.
+        `max_positions` — скільки позицій пошуку збирати з кожної платформи.
+        """
+        platform_errors: List[PlatformScrapeErrorSchema] = []
+        run: Optional[ScrapeRun] = None
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=[
-                        "--disable-extensions",
-                        "--proxy-server='direct://'",
-                        "--proxy-bypass-list=*",
-                        "--disable-gpu",
-                        "--disable-dev-shm-usage",
-                        "--no-sandbox",
-                        "--disable-setuid-sandbox",
-                        "--disable-web-security",
-                    ],
+            product = await self.product_repository.get_by_id(product_id)
+            if product is None:
+                raise ValueError(f"Product with id {product_id} not found")
+            run = ScrapeRun(
+                product_id=product_id,
+                search=product.global_query_name,
+                page_concurrency=page_concurrency
+                or self.settings.SCRAPE_PAGE_CONCURRENCY,
+                platform_concurrency=platform_concurrency
+                or self.settings.SCRAPE_PLATFORM_CONCURRENCY,
+                persist_chunk_size=self.settings.SCRAPE_PERSIST_CHUNK_SIZE,
+                max_positions=max_positions or self.settings.SEARCH_MAX_POSITIONS,
+                characteristics=(
+                    self.settings.SCRAPE_CHARACTERISTICS_ENABLED
+                    if characteristics is None
+                    else characteristics
+                ),
+                characteristics_concurrency=self.settings.SCRAPE_CHARACTERISTICS_CONCURRENCY,
+                on_progress=on_progress,
+            )
+            if len(platforms_ids) == 0:
+                platforms_ids = await self.platform_repository.get_all_platforms_ids()
+            platforms = await self.platform_repository.get_platforms_by_ids(
+                platforms_ids
+            )
+            if len(platforms) == 0:
+                raise HTTPException(status_code=404, detail="No products found")
+            cached_selectors = (
+                await self.platform_selectors_repository.get_by_platform_ids(
+                    [platform.id for platform in platforms]
                 )
-                page = await browser.new_page()
-                product = await self.product_repository.get_by_id(product_id)
-                if product is None:
-                    raise ValueError(f"Product with id {product_id} not found")
-                search = product.global_query_name
-                if len(platforms_ids) == 0:
-                    platforms_ids = (
-                        await self.platform_repository.get_all_platforms_ids()
+                if self._use_db_cache()
+                else {}
+            )
+
+            results = await asyncio.gather(
+                *(
+                    self._scrape_platform(
+                        run=run,
+                        platform=platform,
+                        cached_selectors=cached_selectors.get(platform.id),
+                    )
+                    for platform in platforms
+                ),
+                return_exceptions=True,
+            )
+            for platform, result in zip(platforms, results):
+                if isinstance(result, BaseException):
+                    logger.warning("Platform %s failed: %s", platform.id, result)
+                    run.report(
+                        "platform_failed", platform_id=platform.id, detail=str(result)
+                    )
+                    platform_errors.append(
+                        PlatformScrapeErrorSchema(
+                            platform_id=platform.id, detail=str(result)
+                        )
                     )
-                platforms = await self.platform_repository.get_platforms_by_ids(
-                    platforms_ids
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Помилка при завантаженні сторінки з Playwright: {str(e)}",
+            )
+        finally:
+            if run is not None:
+                await asyncio.gather(*run.characteristics_tasks, return_exceptions=True)
+                await self._flush(run)
+
+        return {
+            "persisted": run.persisted,
+            "unchanged": run.unchanged,
+            "dropped": run.dropped,
+            "characteristics": run.characteristics_extracted,
+            "platform_errors": platform_errors,
+        }
+
+    async def _scrape_platform(
+        self,
+        run: ScrapeRun,
+        platform: Platform,
+        cached_selectors: Optional[PlatformSelectors],
+    ) -> None:
+        async with run.platform_semaphore:
+            first_page = await self._find_search_links(
+                platform,
+                self._search_url(platform, run.search, 1),
+                cached_selectors.search_selectors if cached_selectors else None,
+            )
+            search_selectors = first_page.selectors
+            batches = self._search_batches(run, platform, first_page)
+            try:
+                # Для вивчення селекторів достатньо першого посилання, решта
+                # сторінок пошуку тим часом завантажується.
+                first_batch = await anext(batches, None)
+                if first_batch is None:
+                    raise ValueError(f"No products found on platform {platform.name}")
+
+                if self._selectors_are_healthy(cached_selectors):
+                    selectors = cached_selectors.selectors  # type: ignore
+                    fetch_mode = self._fetch_mode_tracker(cached_selectors)
+                    # Відбитки мають сенс лише для тих самих селекторів.
+                    use_fingerprints = True
+                else:
+                    learned_selectors = await self.genai_service.analyze_page_as(
+                        first_batch[0]["link"],
+                        PRODUCT_SELECTORS_PROMPT,
+                        ProductSelectorsSchema,
+                    )
+                    selectors = learned_selectors.to_selectors()
+                    fetch_mode = self._fetch_mode_tracker(None)
+                    use_fingerprints = False
+            except BaseException:
+                await batches.aclose()
+                raise
+
+        rules = platform.canonical_url_rules
+        fill_rates = FillRateCounter()
+        fingerprints: Dict[str, PageFingerprint] = {}
+
+        # Товар, що трапляється на кількох позиціях, завантажується один раз:
+        # решта позицій чекають на першу і отримують копію її даних.
+        pages: Dict[str, asyncio.Task] = {}
+        tasks: List[asyncio.Task] = []
+        try:
+            async for batch in prepend(first_batch, batches):
+                run.report(
+                    "links_found", platform_id=platform.id, products_total=len(batch)
                 )
-                parsed = []
-                for platform in platforms:
-                    response = await self.genai_service.analyze_page(
-                        platform.search_url_template.replace("{search}", search),  # type: ignore
-                        """
-                        Проаналізуй HTML-сторінку результатів пошуку та побудуй JSON-об’єкт у такому форматі:
+                if use_fingerprints:
+                    new_urls = {
+                        canonical_url(item["link"], rules) for item in batch
+                    } - pages.keys()
+                    if new_urls:
+                        fingerprints.update(
+                            await self._load_fingerprints(run, list(new_urls))
+                        )
+                for item in batch:
+                    url = canonical_url(item["link"], rules)
+                    position = int(item["search_position"])
+                    if url in pages:
+                        page_task = self._share_product_page(
+                            run=run,
+                            page_task=pages[url],
+                            url=item["link"],
+                            canonical=url,
+                            platform_id=platform.id,
+                            position=position,
+                            fingerprint=fingerprints.get(url),
+                        )
+                        tasks.append(asyncio.create_task(page_task))
+                        continue
+                    pages[url] = asyncio.create_task(
+                        self._scrape_product_page(
+                            run=run,
+                            url=item["link"],
+                            canonical=url,
+                            selectors=selectors,
+                            platform_id=platform.id,
+                            position=position,
+                            fill_rates=fill_rates,
+                            fetch_mode=fetch_mode,
+                            fingerprint=fingerprints.get(url),
+                        )
+                    )
+                    tasks.append(pages[url])
+        finally:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self.replay_store.replaying:
+            return
+        async with run.db_lock:
+            await self._save_selectors(
+                platform.id, selectors, search_selectors, fill_rates, fetch_mode
+            )
+
+    async def _load_fingerprints(
+        self, run: ScrapeRun, urls: List[str]
+    ) -> Dict[str, PageFingerprint]:
+        async with run.db_lock:
+            return await self.page_fingerprint_repository.get_by_urls_product_id(
+                urls, run.product_id
+            )
+
+    async def _find_search_links(
+        self,
+        platform: Platform,
+        search_url: str,
+        search_selectors: Optional[dict],
+    ) -> SearchPage:
+        """
+        Повертає першу сторінку пошуку з селекторами і посиланнями на товари.
+        Якщо посилання доводиться питати в Gemini, а потокові відповіді
+        ввімкнені, замість списку повертається потік, що вже читається у фоні.
+        """
+        html = await self.genai_service.fetch_html(
+            search_url,
+            [search_selectors["item_selector"]] if search_selectors else None,
+        )
+        snapshot_hash = await self._store_snapshot(html)
+        logger.info(
+            "Search page snapshot for platform %s: %s", platform.id, snapshot_hash
+        )
+
+        if search_selectors:
+            links, next_url = await self._extract_search_page(
+                html, search_url, search_selectors
+            )
+            if self._search_links_look_valid(platform, links):
+                return SearchPage(search_selectors, links, next_url)
+            logger.info(
+                "Cached search selectors failed for platform %s, relearning",
+                platform.id,
+            )
+
+        try:
+            learned = await self.genai_service.analyze_html_as(
+                html, SEARCH_SELECTORS_PROMPT, SearchSelectorsSchema
+            )
+            search_selectors = learned.model_dump()
+            links, next_url = await self._extract_search_page(
+                html, search_url, search_selectors
+            )
+            if self._search_links_look_valid(platform, links):
+                return SearchPage(search_selectors, links, next_url)
+        except HTTPException as e:
+            # Без селекторів пошуку посилання ще можна отримати напряму.
+            logger.warning(
+                "Failed to learn search selectors for platform %s: %s",
+                platform.id,
+                e.detail,
+            )
+
+        logger.info(
+            "Learned search selectors failed for platform %s, asking for links",
+            platform.id,
+        )
+        if self.settings.GENAI_STREAM_SEARCH_RESULTS:
+            return SearchPage(None, read_ahead(self._stream_search_links(html)))
+        response = await self.genai_service.analyze_html_as(
+            html, SEARCH_RESULTS_PROMPT, SearchResultsSchema
+        )
+        return SearchPage(None, [item.model_dump() for item in response.products])
+
+    async def _fetch_search_page(
+        self, url: str, search_selectors: Optional[dict]
+    ) -> SearchPage:
+        """
+        Наступна сторінка пошуку розбирається тими самими селекторами, що й
+        перша, без перевірки кількості посилань: остання сторінка може бути
+        короткою.
+        """
+        html = await self.genai_service.fetch_html(
+            url, [search_selectors["item_selector"]] if search_selectors else None
+        )
+        if search_selectors:
+            links, next_url = await self._extract_search_page(
+                html, url, search_selectors
+            )
+            return SearchPage(search_selectors, links, next_url)
+        response = await self.genai_service.analyze_html_as(
+            html, SEARCH_RESULTS_PROMPT, SearchResultsSchema
+        )
+        return SearchPage(None, [item.model_dump() for item in response.products])
+
+    async def _search_batches(
+        self, run: ScrapeRun, platform: Platform, first_page: SearchPage
+    ) -> AsyncIterator[List[Dict]]:
+        """
+        Посилання на товари з усіх сторінок пошуку з наскрізними позиціями:
+        розібрана сторінка видається однією пачкою, потік від Gemini — по
+        одному посиланню. Наступна сторінка завантажується заздалегідь, поки
+        обробляються товари поточної. Обхід зупиняється, щойно зібрано
+        `run.max_positions` позицій, досягнуто `SEARCH_MAX_PAGES` або сторінка
+        повторює вже бачені.
+        """
+        page, number, positions = first_page, 1, 0
+        seen_links: Set[str] = set()
+        visited = {self._search_url(platform, run.search, 1)}
+        next_page: Optional[asyncio.Task] = None
+        try:
+            while True:
+                next_url = self._next_search_url(platform, run.search, page, number)
+                if (
+                    next_url is not None
+                    and next_url not in visited
+                    and number < self.settings.SEARCH_MAX_PAGES
+                    and (
+                        not isinstance(page.links, list)
+                        or positions + len(page.links) < run.max_positions
+                    )
+                ):
+                    visited.add(next_url)
+                    next_page = asyncio.create_task(
+                        self._fetch_search_page(next_url, page.selectors)
+                    )
+
+                offset = positions
+                if isinstance(page.links, list):
+                    batches = iterate([page.links])
+                else:
+                    batches = ([item] async for item in page.links)
+                async for batch in batches:
+                    batch = [
                         {
-                        "products": [
-                            {
-                            "link": "absolute URL to product page",
-                            "search_position": 1
-                            },
-                            {
-                            "link": "absolute URL to product page",
-                            "search_position": 2
-                            },
-                            ...
-                        ]
+                            **item,
+                            "search_position": offset + int(item["search_position"]),
                         }
-                        🔹 **link** — повне (абсолютне) посилання на сторінку продукту  
-                        🔹 **search_position** — позиція продукту у результатах пошуку, починаючи з 1
-                        ---
-                        🎯 **Вимоги до вибірки**:
-                        - Обробляй **лише головний блок із результатами пошуку** (наприклад, каталог товарів, грід або список товарів).
-                        - Ігноруй банери, рекламу, рекомендовані товари, каруселі та інші другорядні блоки.
-                        - Витягуй **тільки активні (видимі) продукти** — пропущені/приховані не враховувати.
-                        - Не повинно бути `null` у полях (`link`, `search_position` мають бути присутні й валідні).
-                        - Посилання повинні бути абсолютними (додавай `base_url`, якщо воно відсутнє у `href`).
-                        ---
-                        📌 Поверни **лише об'єкт JSON** без пояснень, коментарів або додаткового тексту.
-                        """,
+                        for item in batch
+                    ]
+                    in_range = [
+                        item
+                        for item in batch
+                        if item["search_position"] <= run.max_positions
+                    ]
+                    if in_range:
+                        positions = max(
+                            positions, *(item["search_position"] for item in in_range)
+                        )
+                        seen_links.update(item["link"] for item in in_range)
+                        yield in_range
+                    if len(in_range) < len(batch):
+                        break
+
+                if next_page is None or positions >= run.max_positions:
+                    return
+                try:
+                    page = await next_page
+                except Exception as e:
+                    logger.warning(
+                        "Failed to load search page %d of platform %s: %s",
+                        number + 1,
+                        platform.id,
+                        e,
+                    )
+                    return
+                finally:
+                    next_page = None
+                number += 1
+
+                links = page.links if isinstance(page.links, list) else []
+                if all(item["link"] in seen_links for item in links):
+                    logger.info(
+                        "Search page %d of platform %s repeats, stopping",
+                        number,
+                        platform.id,
+                    )
+                    return
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+                await asyncio.gather(next_page, return_exceptions=True)
+            if not isinstance(first_page.links, list):
+                await first_page.links.aclose()  # type: ignore
+
+    def _search_url(self, platform: Platform, search: str, number: int) -> str:
+        return platform.search_url_template.replace("{search}", search).replace(
+            "{page}", str(number)
+        )
+
+    def _next_search_url(
+        self, platform: Platform, search: str, page: SearchPage, number: int
+    ) -> Optional[str]:
+        """
+        Номер сторінки підставляється в шаблон пошуку, якщо в ньому є `{page}`;
+        інакше використовується посилання на наступну сторінку з самої сторінки.
+        """
+        if "{page}" in platform.search_url_template:
+            return self._search_url(platform, search, number + 1)
+        return page.next_url
+
+    async def _stream_search_links(self, html: str) -> AsyncIterator[Dict]:
+        seen: Set[str] = set()
+        # Закриття потоку споживачем має одразу звільнити відповідь Gemini і
+        # слот лімітера, а не чекати збирача сміття.
+        async with aclosing(
+            self.genai_service.stream_html_as(
+                html, SEARCH_RESULTS_PROMPT, SearchResultsSchema, "products"
+            )
+        ) as items:
+            async for item in items:
+                link = item.model_dump()
+                if link["link"] not in seen:
+                    seen.add(link["link"])
+                    yield link
+
+    async def _extract_search_page(
+        self, html: str, search_url: str, search_selectors: dict
+    ) -> Tuple[List[Dict], Optional[str]]:
+        try:
+            return await self.process_pool.run(
+                extract_search_page, html, search_url, search_selectors
+            )
+        except Exception as e:
+            logger.warning("Local search link extraction failed: %s", e)
+            return [], None
+
+    def _search_links_look_valid(self, platform: Platform, links: List[Dict]) -> bool:
+        if len(links) < self.settings.SEARCH_MIN_LINKS:
+            return False
+        platform_host = (urlparse(platform.base_url).hostname or "").removeprefix(
+            "www."
+        )
+        on_platform = [
+            item
+            for item in links
+            if self._is_platform_host(item["link"], platform_host)
+        ]
+        return len(on_platform) / len(links) >= 0.5
+
+    def _is_platform_host(self, url: str, platform_host: str) -> bool:
+        host = (urlparse(url).hostname or "").removeprefix("www.")
+        return host == platform_host or host.endswith(f".{platform_host}")
+
+    def _selectors_are_healthy(
+        self, cached_selectors: Optional[PlatformSelectors]
+    ) -> bool:
+        if cached_selectors is None:
+            return False
+        if cached_selectors.fill_rate is None:
+            return True
+        return cached_selectors.fill_rate >= self.settings.SELECTOR_MIN_FILL_RATE
+
+    async def _save_selectors(
+        self,
+        platform_id: int,
+        selectors: dict,
+        search_selectors: Optional[dict],
+        fill_rates: FillRateCounter,
+        fetch_mode: FetchModeTracker,
+    ) -> None:
+        fill_rate, field_fill_rates = fill_rates.rates()
+        logger.info(
+            "Platform %s selectors fill rate: %s, HTTP fetches: %d/%d",
+            platform_id,
+            fill_rate,
+            fetch_mode.successes,
+            fetch_mode.attempts,
+        )
+        await self.platform_selectors_repository.save_platform_selectors(
+            platform_id,
+            selectors,
+            search_selectors,
+            fill_rate,
+            field_fill_rates,
+            fetch_mode.decide(),
+        )
+
+    def _fetch_mode_tracker(
+        self, cached_selectors: Optional[PlatformSelectors]
+    ) -> FetchModeTracker:
+        return FetchModeTracker(
+            mode=cached_selectors.fetch_mode if cached_selectors else None,
+            checked_at=(
+                cached_selectors.fetch_mode_checked_at if cached_selectors else None
+            ),
+            recheck_after=datetime.timedelta(hours=self.settings.HTTP_RECHECK_HOURS),
+            min_pages=self.settings.HTTP_MIN_PAGES,
+            min_success_rate=self.settings.HTTP_MIN_SUCCESS_RATE,
+        )
+
+    async def _persist(
+        self,
+        run: ScrapeRun,
+        url: str,
+        platform_id: int,
+        position: int,
+        result: PageResult,
+        fingerprint: Optional[PageFingerprint],
+    ) -> None:
+        run.pending_fingerprints[url] = {
+            "url": url,
+            "product_id": run.product_id,
+            "platform_id": platform_id,
+            "scraped_product_data_id": None,
+            "etag": result.etag,
+            "last_modified": result.last_modified,
+            "content_hash": result.content_hash,
+        }
+        if result.scraped_data is not None:
+            result.scraped_data.canonical_url = url
+            run.pending.append(result.scraped_data)
+        elif fingerprint is not None:
+            run.pending_fingerprints[url]["scraped_product_data_id"] = (
+                fingerprint.scraped_product_data_id
+            )
+            run.pending_observations.append(
+                {
+                    "scraped_product_data_id": fingerprint.scraped_product_data_id,
+                    "search_position": position,
+                }
+            )
+        if len(run.pending) + len(run.pending_observations) >= run.persist_chunk_size:
+            await self._flush(run)
+
+    async def _flush(self, run: ScrapeRun) -> None:
+        """
+        Записує накопичені рядки, спостереження і відбитки. Якщо запис не
+        вдався, сесія відкочується, щоб наступні пачки могли записатись, а
+        незаписані рядки враховуються в `run.dropped`.
+        """
+        async with run.db_lock:
+            if not run.pending_fingerprints:
+                return
+            chunk, run.pending = run.pending, []
+            observations, run.pending_observations = run.pending_observations, []
+            fingerprints, run.pending_fingerprints = run.pending_fingerprints, {}
+            rows = len(chunk)
+
+            if self.replay_store.replaying:
+                # Відтворення лише рахує рядки, не змінюючи реальних таблиць.
+                run.persisted += len(chunk)
+                run.unchanged += len(observations)
+                run.report(
+                    "rows_persisted",
+                    chunk=rows,
+                    persisted=run.persisted,
+                    unchanged=run.unchanged,
+                )
+                return
+
+            try:
+                if chunk:
+                    created = await self.scraped_product_data_repository.bulk_create_scraped_product_data(
+                        chunk
                     )
-                    parsed_json = normalize_json(response)
-                    parsed_json["platform_id"] = str(platform.id)
-                    parsed.append(parsed_json)
-                if len(parsed) == 0:
-                    raise HTTPException(status_code=404, detail="No products found")
-                for parse in parsed:
-                    url = parse["products"][0]["link"]
-                    raw_selectors = await self.genai_service.analyze_page(
+                    for row in created:
+                        if row.canonical_url in fingerprints:
+                            fingerprints[row.canonical_url][
+                                "scraped_product_data_id"
+                            ] = row.id
+                    run.persisted += len(chunk)
+                    chunk = []
+                await self.page_observation_repository.bulk_create_page_observations(
+                    observations
+                )
+                run.unchanged += len(observations)
+                observations = []
+                await self.page_fingerprint_repository.upsert_page_fingerprints(
+                    [
+                        item
+                        for item in fingerprints.values()
+                        if item["scraped_product_data_id"] is not None
+                    ]
+                )
+            except Exception as e:
+                await self._rollback()
+                run.dropped += len(chunk) + len(observations)
+                logger.warning(
+                    "Failed to persist %d rows and %d observations: %s",
+                    len(chunk),
+                    len(observations),
+                    e,
+                )
+                run.report(
+                    "rows_dropped",
+                    rows=len(chunk),
+                    observations=len(observations),
+                    dropped=run.dropped,
+                    detail=str(e),
+                )
+                return
+
+            run.report(
+                "rows_persisted",
+                chunk=rows,
+                persisted=run.persisted,
+                unchanged=run.unchanged,
+            )
+
+    def _use_db_cache(self) -> bool:
+        # Як і кеш Gemini: під час запису збережені селектори та відбитки
+        # пропустили б сторінки й виклики, які треба записати, а під час
+        # відтворення зробили б результат залежним від стану БД.
+        return not (self.replay_store.recording or self.replay_store.replaying)
+
+    async def _rollback(self) -> None:
+        try:
+            await self.scraped_product_data_repository.session.rollback()
+        except Exception as e:
+            logger.warning("Failed to roll back the session: %s", e)
+
+    async def _store_snapshot(self, html: str) -> Optional[str]:
+        if not self.settings.SNAPSHOT_ENABLED:
+            return None
+        try:
+            return await asyncio.to_thread(self.snapshot_store.put, html)
+        except Exception as e:
+            logger.warning("Failed to store HTML snapshot: %s", e)
+            return None
+
+    def _wait_selectors(self, selectors: dict) -> List[str]:
+        return [
+            selector
+            for selector in (
+                selectors.get("title_selector"),
+                selectors.get("price_selector"),
+            )
+            if isinstance(selector, str) and selector
+        ]
+
+    async def _scrape_product_page(
+        self,
+        run: ScrapeRun,
+        url: str,
+        canonical: str,
+        selectors: dict,
+        platform_id: int,
+        position: int,
+        fill_rates: FillRateCounter,
+        fetch_mode: FetchModeTracker,
+        fingerprint: Optional[PageFingerprint],
+    ) -> Optional[PageResult]:
+        """
+        Повертає результат сторінки для позицій з тим самим канонічним URL
+        або None, якщо сторінку обробити чи записати не вдалося.
+        """
+        try:
+            async with run.page_semaphore:
+                # Рішення приймається до перевірки відбитка: незмінена
+                # сторінка теж може не мати збережених характеристик.
+                characteristics_due = await self._characteristics_due(run, canonical)
+                result = None
+                if self.settings.HTTP_FAST_PATH_ENABLED and fetch_mode.try_http:
+                    result = await self._scrape_product_over_http(
+                        run,
                         url,
-                        """
-                        Надай стабільні CSS-селектори (класи, ID або вкладені атрибути) для використання з Playwright. Очікується об'єкт такого формату:
-                        {
-                        "title_selector": "CSS selector for product name",
-                        "price_selector": "CSS selector for product price",
-                        "currency_selector": "CSS selector for currency symbol",
-                        "rating_selector": "Either a CSS selector for numeric rating OR an object { \"selector\": \"...\", \"percent_attribute\": \"...\" }",
-                        "reviews_count_selector": "CSS selector for number of feedbacks/feedbacks and questions",
-                        "availability_selector": "CSS selector for availability status"
-                        "charecteristics": "CSS selector for button/link of expand characteristics"
-                        }
-                        🔹 **title_selector** — назва продукту
-                        🔹 **price_selector** — ціна продукту
-                        🔹 **currency_selector** — валюта (наприклад, "$", "₴", "€")
-                        🔹 **rating_selector**:
-                        - Якщо рейтинг вказано числом — поверни CSS селектор до цього числа.
-                        - Якщо рейтинг реалізовано як відсоток (наприклад, через `style="width:80%"`) — поверни об'єкт:
-                            {
-                            "selector": "CSS селектор елемента",
-                            "percent_attribute": "назва атрибута (наприклад, style)"
-                            }
-                        🔹 **reviews_count_selector** — кількість відгуків
-                        🔹 **availability_selector** — текст про наявність (наприклад, "В наявності", "Очікується", "Немає")
-                        🔹 **charecteristics** — CSS селектор кнопки/посилання відкриття характеристик
-                        ---
-                        🎯 **Вимоги**:
-                        - Перевага надається **стабільним класам** або ID (без модифікаторів стану чи кольору).
-                        - ❌ Не використовуй селектори з модифікаторами стану (наприклад, `green`, `red`, `disabled`)
-                        - ❌ Не використовуй теги специфічних компонентів (наприклад, `<rz-stars-rating-progress>`) — лише класи або атрибути дочірніх HTML-елементів.
-                        - 🔍 Селектори повинні бути **мінімальними, точними і придатними для Playwright**.
-                        - Уникай занадто загальних або динамічних класів (типу `.ng-star-inserted`, `.active`, `.selected`).
-                        Поверни **лише об’єкт JSON** без пояснень чи коментарів.
-                        """,
+                        selectors,
+                        platform_id,
+                        position,
+                        fingerprint,
+                        characteristics_due,
                     )
-                    selectors = normalize_json(raw_selectors)
-                    for product in parse["products"]:
-                        url = product["link"]
-                        await page.goto(url, timeout=60_000)
-                        await page.wait_for_load_state("networkidle")
-                        scraped_data = await extract_product_data(
-                            html=await page.content(),
-                            url=url,
-                            selectors=selectors,
-                            product_id=product_id,
-                            platform_id=int(parse["platform_id"]),
-                            position=int(product["search_position"]),
+                    fetch_mode.add(result is not None)
+                if result is None:
+                    result = await self._scrape_product_in_browser(
+                        run,
+                        url,
+                        selectors,
+                        platform_id,
+                        position,
+                        fingerprint,
+                        characteristics_due,
+                    )
+
+            if result.scraped_data is not None:
+                fill_rates.add(result.scraped_data)
+            if result.characteristics_html is not None:
+                run.characteristics_tasks.append(
+                    asyncio.create_task(
+                        self._extract_characteristics(
+                            run, canonical, platform_id, result.characteristics_html
                         )
-                        # characteristics_data = {}
-                        # try:
-                        #     if (
-                        #         "characteristics" in selectors
-                        #         and selectors["characteristics"]
-                        #     ):
-                        #         await page.click(
-                        #             selectors["characteristics"], timeout=1000
-                        #         )
-                        #         await page.wait_for_load_state("networkidle")
-                        #         raw_characteristics_json = (
-                        #             await self.genai_service.analyze_page(
-                        #                 page.url,
-                        #                 """
-                        #             Проаналізуй HTML-сторінку та витягни всі доступні характеристики продукту, які представлені у форматі 'назва: значення'. Сформуй JSON-об’єкт у такому вигляді:
-                        #             {
-                        #             "characteristics": [
-                        #                 {
-                        #                 "name": "Назва характеристики 1",
-                        #                 "value": "Значення характеристики 1"
-                        #                 },
-                        #                 {
-                        #                 "name": "Назва характеристики 2",
-                        #                 "value": "Значення характеристики 2"
-                        #                 },
-                        #                 ...
-                        #             ]
-                        #             }
-                        #             🔹 **name** — це назва або етикетка характеристики (наприклад, 'Колір', 'Об'єм пам'яті', 'Тип матриці').
-                        #             🔹 **value** — це відповідне значення характеристики (наприклад, 'Чорний', '256 ГБ', 'IPS').
-                        #             ---
-                        #             🎯 **Вимоги до вибірки**:
-                        #             - Зосередься виключно на блоках, що містять перелік технічних характеристик, специфікацій або детальних параметрів продукту.
-                        #             - Ігноруй будь-яку іншу інформацію: загальні описи продукту, рекламні блоки, відгуки, умови доставки, рекомендації тощо.
-                        #             - Вибирай тільки **активні та видимі** характеристики.
-                        #             - Переконайся, що кожна характеристика має як **назву**, так і **значення**, і що вони точно відповідають одна одній.
-                        #             ---
-                        #             📌 Поверни **ЛИШЕ ОБ'ЄКТ JSON** без будь-яких додаткових пояснень, коментарів чи іншого тексту. Збережи формат JSON валідним.
-                        #             """,
-                        #             )
-                        #         )
-                        #         characteristics_data = raw_characteristics_json
-                        #         return characteristics_data
-                        # except Exception as e:
-                        #     print(
-                        #         f"Не вдалося клікнути на характеристики або проаналізувати їх: {e}"
-                        #     )
-                        #     pass
-                        # scraped_data.characteristics = characteristics_data.get(
-                        #     "characteristics", []
-                        # )
-                        scraped_products.append(scraped_data)
+                    )
+                )
+            await self._persist(
+                run, canonical, platform_id, position, result, fingerprint
+            )
         except Exception as e:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Помилка при завантаженні сторінки з Playwright: {str(e)}",
+            self._report_page_failed(run, url, platform_id, position, e)
+            return None
+
+        self._report_page(run, url, platform_id, position, result.scraped_data)
+        return result
+
+    async def _share_product_page(
+        self,
+        run: ScrapeRun,
+        page_task: "asyncio.Task[Optional[PageResult]]",
+        url: str,
+        canonical: str,
+        platform_id: int,
+        position: int,
+        fingerprint: Optional[PageFingerprint],
+    ) -> None:
+        """
+        Позиція пошуку з товаром, який уже відкривається на іншій позиції:
+        дані беруться з її результату замість повторного завантаження.
+        """
+        result = await page_task
+        if result is None:
+            run.report(
+                "product_failed",
+                platform_id=platform_id,
+                search_position=position,
+                url=url,
+                detail=f"Failed to scrape {canonical}",
             )
-        finally:
-            if browser is not None:
-                await browser.close()
+            return
+
+        scraped_data = None
+        if result.scraped_data is not None:
+            scraped_data = copy_scraped_data(result.scraped_data, url, position)
+        try:
+            await self._persist(
+                run,
+                canonical,
+                platform_id,
+                position,
+                result._replace(scraped_data=scraped_data, characteristics_html=None),
+                fingerprint,
+            )
+        except Exception as e:
+            self._report_page_failed(run, url, platform_id, position, e)
+            return
+        self._report_page(run, url, platform_id, position, scraped_data)
+
+    def _report_page(
+        self,
+        run: ScrapeRun,
+        url: str,
+        platform_id: int,
+        position: int,
+        scraped_data: Optional[ScrapedProductData],
+    ) -> None:
+        if scraped_data is None:
+            run.report(
+                "product_unchanged",
+                platform_id=platform_id,
+                search_position=position,
+                url=url,
+            )
+        else:
+            run.report(
+                "product_scraped",
+                platform_id=platform_id,
+                search_position=position,
+                url=url,
+                name=scraped_data.name_on_platform,
+                price=str(scraped_data.price),
+            )
+
+    def _report_page_failed(
+        self,
+        run: ScrapeRun,
+        url: str,
+        platform_id: int,
+        position: int,
+        error: Exception,
+    ) -> None:
+        logger.warning(
+            "Failed to scrape %s (platform %s, position %s): %s",
+            url,
+            platform_id,
+            position,
+            error,
+        )
+        run.report(
+            "product_failed",
+            platform_id=platform_id,
+            search_position=position,
+            url=url,
+            detail=str(error),
+        )
 
-        return (
-            await self.scraped_product_data_repository.bulk_create_scraped_product_data(
-                scraped_products
+    async def _scrape_product_over_http(
+        self,
+        run: ScrapeRun,
+        url: str,
+        selectors: dict,
+        platform_id: int,
+        position: int,
+        fingerprint: Optional[PageFingerprint],
+        characteristics_due: bool,
+    ) -> Optional[PageResult]:
+        """
+        Повертає None, якщо сторінку треба відкривати в браузері: запит не
+        вдався або в HTML без JavaScript немає назви чи ціни. Коли потрібні
+        характеристики, запит іде без валідаторів кешу, щоб отримати HTML.
+        """
+        use_validators = fingerprint is not None and not characteristics_due
+        page = await self.http_fetcher.fetch(
+            url,
+            fingerprint.etag if use_validators else None,  # type: ignore
+            fingerprint.last_modified if use_validators else None,  # type: ignore
+        )
+        if page is None:
+            return None
+        if page.not_modified:
+            return PageResult(
+                None,
+                fingerprint.content_hash,  # type: ignore
+                page.etag,
+                page.last_modified,
             )
+
+        characteristics_html = page.html if characteristics_due else None
+        page_hash = await self.process_pool.run(content_hash, page.html)
+        if fingerprint is not None and fingerprint.content_hash == page_hash:
+            return PageResult(
+                None, page_hash, page.etag, page.last_modified, characteristics_html
+            )
+
+        scraped_data = await extract_product_data(
+            html=page.html,
+            url=url,
+            selectors=selectors,
+            product_id=run.product_id,
+            platform_id=platform_id,
+            position=position,
+            backend=self.settings.PARSER_BACKEND,
+            runner=self.process_pool.run,
+        )
+        if not has_required_fields(scraped_data):
+            return None
+        scraped_data.snapshot_hash = await self._store_snapshot(page.html)  # type: ignore
+        return PageResult(
+            scraped_data, page_hash, page.etag, page.last_modified, characteristics_html
+        )
+
+    async def _scrape_product_in_browser(
+        self,
+        run: ScrapeRun,
+        url: str,
+        selectors: dict,
+        platform_id: int,
+        position: int,
+        fingerprint: Optional[PageFingerprint],
+        characteristics_due: bool,
+    ) -> PageResult:
+        async with self.browser_pool.page() as page:
+            await self.browser_pool.goto(page, url, self._wait_selectors(selectors))
+            html = await page.content()
+            page_hash = await self.process_pool.run(content_hash, html)
+            if fingerprint is not None and fingerprint.content_hash == page_hash:
+                characteristics_html = None
+                if characteristics_due:
+                    characteristics_html = await self._open_characteristics(
+                        page, selectors
+                    )
+                return PageResult(
+                    None, page_hash, characteristics_html=characteristics_html
+                )
+
+            scraped_data = await extract_product_data(
+                html=html,
+                url=url,
+                selectors=selectors,
+                product_id=run.product_id,
+                platform_id=platform_id,
+                position=position,
+                backend=self.settings.PARSER_BACKEND,
+                runner=self.process_pool.run,
+            )
+            scraped_data.snapshot_hash = await self._store_snapshot(html)
+            characteristics_html = None
+            if characteristics_due:
+                characteristics_html = await self._open_characteristics(page, selectors)
+            return PageResult(
+                scraped_data, page_hash, characteristics_html=characteristics_html
+            )
+
+    async def _characteristics_due(self, run: ScrapeRun, url: str) -> bool:
+        """
+        Характеристики витягуються раз на канонічний URL `url`: повторно —
+        лише коли збережені старші за `CHARACTERISTICS_MAX_AGE_DAYS`.
+        """
+        if not run.characteristics:
+            return False
+        if url in run.characteristics_urls:
+            return False
+        run.characteristics_urls.add(url)
+        if not self._use_db_cache():
+            return True
+
+        async with run.db_lock:
+            cached = await self.product_characteristics_repository.get_by_url(url)
+        return cached is None or datetime.datetime.now(
+            datetime.timezone.utc
+        ) - cached.extracted_at > datetime.timedelta(
+            days=self.settings.CHARACTERISTICS_MAX_AGE_DAYS
+        )
+
+    async def _open_characteristics(self, page: Page, selectors: dict) -> str:
+        """
+        Відкриває блок характеристик на вже завантаженій сторінці (якщо для
+        платформи відомий селектор кнопки) і повертає її HTML.
+        """
+        selector = selectors.get("charecteristics")
+        if selector:
+            try:
+                await page.click(selector, timeout=1000)
+                await page.wait_for_load_state(
+                    "networkidle",
+                    timeout=self.settings.BROWSER_SELECTOR_WAIT_TIMEOUT_MS,
+                )
+            except Exception as e:
+                logger.info("Failed to open characteristics on %s: %s", page.url, e)
+        return await page.content()
+
+    async def _extract_characteristics(
+        self, run: ScrapeRun, url: str, platform_id: int, html: str
+    ) -> None:
+        async with run.characteristics_semaphore:
+            try:
+                result = await self.genai_service.analyze_html_as(
+                    html, CHARACTERISTICS_PROMPT, CharacteristicsSchema
+                )
+                characteristics = [item.model_dump() for item in result.characteristics]
+                if not self.replay_store.replaying:
+                    async with run.db_lock:
+                        await self.product_characteristics_repository.upsert_product_characteristics(
+                            {
+                                "url": url,
+                                "product_id": run.product_id,
+                                "platform_id": platform_id,
+                                "characteristics": characteristics,
+                            }
+                        )
+            except Exception as e:
+                logger.warning("Failed to extract characteristics from %s: %s", url, e)
+                run.report(
+                    "characteristics_failed",
+                    platform_id=platform_id,
+                    url=url,
+                    detail=str(e),
+                )
+                return
+
+        run.characteristics_extracted += 1
+        run.report(
+            "characteristics_extracted",
+            platform_id=platform_id,
+            url=url,
+            count=len(characteristics),
         )
 
 
-ScrapeServiceDependency = Annotated[ScrapeService, Depends(ScrapeService)]
+def create_scrape_service(session: AsyncSession) -> ScrapeService:
+    """
+    Створює ScrapeService поза обробкою HTTP-запиту (для фонових задач).
+    """
+    return ScrapeService(
+        platform_repository=PlatformRepository(session),
+        product_repository=ProductRepository(session),
+        product_characteristics_repository=ProductCharacteristicsRepository(session),
+        scraped_product_data_repository=ScrapedProductDataRepository(session),
+        platform_selectors_repository=PlatformSelectorsRepository(session),
+        page_fingerprint_repository=PageFingerprintRepository(session),
+        page_observation_repository=PageObservationRepository(session),
+        genai_service=get_genai_service(
+            settings,
+            browser_pool,
+            genai_rate_limiter,
+            process_pool,
+            replay_store,
+            genai_cache,
+            genai_parse_stats,
+        ),
+        browser_pool=browser_pool,
+        http_fetcher=http_fetcher,
+        snapshot_store=snapshot_store,
+        process_pool=process_pool,
+        replay_store=replay_store,
+        settings=settings,
+    )
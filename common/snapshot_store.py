@@ -0,0 +1,168 @@
+import asyncio
+import gzip
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Annotated, Iterator, List, Optional, Tuple
+
+from fastapi import Depends
+
+from common.app_settings import settings
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_SUFFIX = ".html.gz"
+SNAPSHOT_KEY_RE = re.compile(r"[0-9a-f]{64}")
+
+
+def snapshot_path(root: Path, key: str) -> Path:
+    if not SNAPSHOT_KEY_RE.fullmatch(key):
+        raise ValueError(f"Invalid snapshot key {key}")
+    return root / key[:2] / f"{key}{SNAPSHOT_SUFFIX}"
+
+
+def read_snapshot(root: Path, key: str) -> Optional[str]:
+    path = snapshot_path(root, key)
+    if not path.exists():
+        return None
+    return gzip.decompress(path.read_bytes()).decode("utf-8")
+
+
+class SnapshotStore:
+    """
+    Сховище знімків HTML-сторінок на диску, адресоване хешем вмісту.
+    Однакові сторінки зберігаються один раз; старі знімки видаляються за віком
+    і коли загальний розмір перевищує ліміт.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        max_bytes: int,
+        max_age_days: int,
+        prune_interval_minutes: int,
+    ):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_days * 24 * 60 * 60
+        self.prune_interval_seconds = prune_interval_minutes * 60
+
+        self._task: Optional[asyncio.Task] = None
+        self._writes_total = 0
+        self._dedup_hits_total = 0
+        self._bytes_written_total = 0
+        self._pruned_total = 0
+
+    @staticmethod
+    def hash_content(html: str) -> str:
+        return hashlib.sha256(html.encode("utf-8")).hexdigest()
+
+    def put(self, html: str) -> str:
+        key = self.hash_content(html)
+        path = self._path(key)
+        if path.exists():
+            self._dedup_hits_total += 1
+            os.utime(path)
+            return key
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = gzip.compress(html.encode("utf-8"), compresslevel=6)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+        self._writes_total += 1
+        self._bytes_written_total += len(data)
+        return key
+
+    def get(self, key: str) -> Optional[str]:
+        return read_snapshot(self.root, key)
+
+    def exists(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    def prune(self) -> int:
+        now = time.time()
+        snapshots: List[Tuple[float, int, Path]] = []
+        removed = 0
+        for path, stat in self._iter_snapshots():
+            if now - stat.st_mtime > self.max_age_seconds:
+                path.unlink(missing_ok=True)
+                removed += 1
+            else:
+                snapshots.append((stat.st_mtime, stat.st_size, path))
+
+        total_bytes = sum(size for _, size, _ in snapshots)
+        for _, size, path in sorted(snapshots):
+            if total_bytes <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_bytes -= size
+            removed += 1
+
+        self._pruned_total += removed
+        return removed
+
+    def stats(self) -> dict:
+        count = 0
+        total_bytes = 0
+        for _, stat in self._iter_snapshots():
+            count += 1
+            total_bytes += stat.st_size
+        return {
+            "root": str(self.root),
+            "snapshots": count,
+            "bytes": total_bytes,
+            "max_bytes": self.max_bytes,
+            "writes_total": self._writes_total,
+            "dedup_hits_total": self._dedup_hits_total,
+            "bytes_written_total": self._bytes_written_total,
+            "pruned_total": self._pruned_total,
+        }
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._prune_periodically())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _prune_periodically(self) -> None:
+        while True:
+            try:
+                removed = await asyncio.to_thread(self.prune)
+                if removed:
+                    logger.info("Pruned %d HTML snapshots", removed)
+            except Exception as e:
+                logger.warning("Failed to prune HTML snapshots: %s", e)
+            await asyncio.sleep(self.prune_interval_seconds)
+
+    def _path(self, key: str) -> Path:
+        return snapshot_path(self.root, key)
+
+    def _iter_snapshots(self) -> Iterator[Tuple[Path, os.stat_result]]:
+        if not self.root.exists():
+            return
+        for path in self.root.glob(f"*/*{SNAPSHOT_SUFFIX}"):
+            try:
+                yield path, path.stat()
+            except FileNotFoundError:
+                continue
+
+
+snapshot_store = SnapshotStore(
+    root=settings.SNAPSHOT_DIR,
+    max_bytes=settings.SNAPSHOT_MAX_BYTES,
+    max_age_days=settings.SNAPSHOT_MAX_AGE_DAYS,
+    prune_interval_minutes=settings.SNAPSHOT_PRUNE_INTERVAL_MINUTES,
+)
+
+
+SnapshotStoreDependency = Annotated[SnapshotStore, Depends(lambda: snapshot_store)]
@@ -0,0 +1,44 @@
+from typing import Annotated, Any, Dict, List
+from fastapi import Depends
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
+from db import SessionContext
+from models.page_fingerprint import PageFingerprint
+
+
+class PageFingerprintRepository:
+    def __init__(self, session: SessionContext):
+        self.session = session
+
+    async def get_by_urls_product_id(
+        self, urls: List[str], product_id: int
+    ) -> Dict[str, PageFingerprint]:
+        query = select(PageFingerprint).where(
+            PageFingerprint.url.in_(urls),
+            PageFingerprint.product_id == product_id,
+        )
+        result = await self.session.execute(query)
+        return {item.url: item for item in result.scalars().all()}
+
+    async def upsert_page_fingerprints(self, values: List[Dict[str, Any]]) -> None:
+        if not values:
+            return
+        query = insert(PageFingerprint).values(values)
+        query = query.on_conflict_do_update(
+            index_elements=[PageFingerprint.url, PageFingerprint.product_id],
+            set_={
+                "platform_id": query.excluded.platform_id,
+                "scraped_product_data_id": query.excluded.scraped_product_data_id,
+                "etag": query.excluded.etag,
+                "last_modified": query.excluded.last_modified,
+                "content_hash": query.excluded.content_hash,
+                "checked_at": func.now(),
+            },
+        )
+        await self.session.execute(query)
+        await self.session.commit()
+
+
+PageFingerprintRepositoryDependency = Annotated[
+    PageFingerprintRepository, Depends(PageFingerprintRepository)
+]
@@ -0,0 +1,33 @@
+from typing import Annotated, Any, Dict, List
+from fastapi import Depends
+from sqlalchemy import select, insert
+from db import SessionContext
+from models.page_observation import PageObservation
+
+
+class PageObservationRepository:
+    def __init__(self, session: SessionContext):
+        self.session = session
+
+    async def get_by_scraped_product_data_id(
+        self, scraped_product_data_id: int
+    ) -> List[PageObservation]:
+        query = (
+            select(PageObservation)
+            .where(PageObservation.scraped_product_data_id == scraped_product_data_id)
+            .order_by(PageObservation.observed_at)
+        )
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def bulk_create_page_observations(self, values: List[Dict[str, Any]]) -> int:
+        if not values:
+            return 0
+        await self.session.execute(insert(PageObservation), values)
+        await self.session.commit()
+        return len(values)
+
+
+PageObservationRepositoryDependency = Annotated[
+    PageObservationRepository, Depends(PageObservationRepository)
+]
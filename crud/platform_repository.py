@@ -35,7 +35,11 @@ class PlatformRepository:
         return [x[0] for x in result.all()]
 
     async def create_platform(
-        self, name: str, base_url: str, search_url_template: Optional[str] = None
+        self,
+        name: str,
+        base_url: str,
+        search_url_template: Optional[str] = None,
+        canonical_url_rules: Optional[dict] = None,
     ) -> Platform:
         if await self.get_by_name(name):
             raise ValueError(f"Platform with name {name} already exists")
@@ -43,7 +47,10 @@ class PlatformRepository:
         query = (
             insert(Platform)
             .values(
-                name=name, base_url=base_url, search_url_template=search_url_template
+                name=name,
+                base_url=base_url,
+                search_url_template=search_url_template,
+                canonical_url_rules=canonical_url_rules,
             )
             .returning(Platform)
         )
@@ -59,6 +66,7 @@ class PlatformRepository:
         name: str,
         base_url: str,
         search_url_template: Optional[str] = None,
+        canonical_url_rules: Optional[dict] = None,
     ) -> Platform:
         platform = await self.get_by_name(name)
         if platform and platform.id != id:
@@ -72,7 +80,10 @@ class PlatformRepository:
             update(Platform)
             .where(Platform.id == id)
             .values(
-                name=name, base_url=base_url, search_url_template=search_url_template
+                name=name,
+                base_url=base_url,
+                search_url_template=search_url_template,
+                canonical_url_rules=canonical_url_rules,
             )
             .returning(Platform)
         )
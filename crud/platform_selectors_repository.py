@@ -0,0 +1,103 @@
+from typing import Annotated, Any, Dict, List, Optional
+from fastapi import Depends
+from sqlalchemy import select, insert, update, delete, func
+from db import SessionContext
+from models.platform_selectors import PlatformSelectors
+
+
+class PlatformSelectorsRepository:
+    def __init__(self, session: SessionContext):
+        self.session = session
+
+    async def get_platform_selectors(self) -> List[PlatformSelectors]:
+        query = select(PlatformSelectors)
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def get_by_platform_id(self, platform_id: int) -> Optional[PlatformSelectors]:
+        query = select(PlatformSelectors).where(
+            PlatformSelectors.platform_id == platform_id
+        )
+        result = await self.session.execute(query)
+        return result.scalar()
+
+    async def get_by_platform_ids(
+        self, platform_ids: List[int]
+    ) -> Dict[int, PlatformSelectors]:
+        query = select(PlatformSelectors).where(
+            PlatformSelectors.platform_id.in_(platform_ids)
+        )
+        result = await self.session.execute(query)
+        return {item.platform_id: item for item in result.scalars().all()}
+
+    async def save_platform_selectors(
+        self,
+        platform_id: int,
+        selectors: Dict[str, Any],
+        search_selectors: Optional[Dict[str, Any]] = None,
+        fill_rate: Optional[float] = None,
+        field_fill_rates: Optional[Dict[str, float]] = None,
+        fetch_mode: Optional[str] = None,
+    ) -> PlatformSelectors:
+        platform_selectors = await self.get_by_platform_id(platform_id)
+        fetch_mode_values: Dict[str, Any] = (
+            {"fetch_mode": fetch_mode, "fetch_mode_checked_at": func.now()}
+            if fetch_mode is not None
+            else {}
+        )
+        if platform_selectors is None:
+            query = (
+                insert(PlatformSelectors)
+                .values(
+                    platform_id=platform_id,
+                    selectors=selectors,
+                    search_selectors=search_selectors,
+                    fill_rate=fill_rate,
+                    field_fill_rates=field_fill_rates,
+                    runs_count=1,
+                    **fetch_mode_values,
+                )
+                .returning(PlatformSelectors)
+            )
+        else:
+            values: Dict[str, Any] = {
+                "search_selectors": search_selectors,
+                "fill_rate": fill_rate,
+                "field_fill_rates": field_fill_rates,
+                "runs_count": PlatformSelectors.runs_count + 1,
+                **fetch_mode_values,
+            }
+            if platform_selectors.selectors != selectors:
+                values["selectors"] = selectors
+                values["runs_count"] = 1
+                values["discovered_at"] = func.now()
+            query = (
+                update(PlatformSelectors)
+                .where(PlatformSelectors.platform_id == platform_id)
+                .values(**values)
+                .returning(PlatformSelectors)
+            )
+        result = await self.session.execute(query)
+        platform_selectors = result.scalar()
+        await self.session.commit()
+        await self.session.refresh(platform_selectors)
+        return platform_selectors
+
+    async def delete_platform_selectors(self, platform_id: int) -> PlatformSelectors:
+        platform_selectors = await self.get_by_platform_id(platform_id)
+        if not platform_selectors:
+            raise ValueError(f"Selectors for platform with id {platform_id} not found")
+
+        query = (
+            delete(PlatformSelectors)
+            .where(PlatformSelectors.platform_id == platform_id)
+            .returning(PlatformSelectors)
+        )
+        await self.session.execute(query)
+        await self.session.commit()
+        return platform_selectors
+
+
+PlatformSelectorsRepositoryDependency = Annotated[
+    PlatformSelectorsRepository, Depends(PlatformSelectorsRepository)
+]
@@ -0,0 +1,44 @@
+from typing import Annotated, Any, Dict, List, Optional
+from fastapi import Depends
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
+from db import SessionContext
+from models.product_characteristics import ProductCharacteristics
+
+
+class ProductCharacteristicsRepository:
+    def __init__(self, session: SessionContext):
+        self.session = session
+
+    async def get_by_url(self, url: str) -> Optional[ProductCharacteristics]:
+        query = select(ProductCharacteristics).where(ProductCharacteristics.url == url)
+        result = await self.session.execute(query)
+        return result.scalars().first()
+
+    async def get_by_product_id(self, product_id: int) -> List[ProductCharacteristics]:
+        query = (
+            select(ProductCharacteristics)
+            .where(ProductCharacteristics.product_id == product_id)
+            .order_by(ProductCharacteristics.platform_id, ProductCharacteristics.id)
+        )
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def upsert_product_characteristics(self, values: Dict[str, Any]) -> None:
+        query = insert(ProductCharacteristics).values(values)
+        query = query.on_conflict_do_update(
+            index_elements=[ProductCharacteristics.url],
+            set_={
+                "product_id": query.excluded.product_id,
+                "platform_id": query.excluded.platform_id,
+                "characteristics": query.excluded.characteristics,
+                "extracted_at": func.now(),
+            },
+        )
+        await self.session.execute(query)
+        await self.session.commit()
+
+
+ProductCharacteristicsRepositoryDependency = Annotated[
+    ProductCharacteristicsRepository, Depends(ProductCharacteristicsRepository)
+]
@@ -0,0 +1,154 @@
+import datetime
+from typing import Annotated, Any, Dict, List, Optional
+from fastapi import Depends
+from sqlalchemy import select, insert, update, delete, func
+from db import SessionContext
+from models.scrape_schedule import ScrapeSchedule
+
+
+class ScrapeScheduleRepository:
+    def __init__(self, session: SessionContext):
+        self.session = session
+
+    async def get_scrape_schedules(self) -> List[ScrapeSchedule]:
+        query = select(ScrapeSchedule).order_by(ScrapeSchedule.id)
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def get_by_id(self, id: int) -> Optional[ScrapeSchedule]:
+        query = select(ScrapeSchedule).where(ScrapeSchedule.id == id)
+        result = await self.session.execute(query)
+        return result.scalar()
+
+    async def get_by_product_id_platform_id(
+        self, product_id: int, platform_id: int
+    ) -> Optional[ScrapeSchedule]:
+        query = select(ScrapeSchedule).where(
+            ScrapeSchedule.product_id == product_id,
+            ScrapeSchedule.platform_id == platform_id,
+        )
+        result = await self.session.execute(query)
+        return result.scalar()
+
+    async def get_due(
+        self, now: datetime.datetime, limit: Optional[int] = None
+    ) -> List[ScrapeSchedule]:
+        query = (
+            select(ScrapeSchedule)
+            .where(ScrapeSchedule.enabled, ScrapeSchedule.next_run_at <= now)
+            .order_by(ScrapeSchedule.next_run_at)
+            .limit(limit)
+        )
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def create_scrape_schedule(
+        self,
+        product_id: int,
+        platform_id: int,
+        interval_minutes: int,
+        next_run_at: datetime.datetime,
+        enabled: bool = True,
+    ) -> ScrapeSchedule:
+        if await self.get_by_product_id_platform_id(product_id, platform_id):
+            raise ValueError(
+                f"ScrapeSchedule for product {product_id} and platform {platform_id} already exists"
+            )
+
+        query = (
+            insert(ScrapeSchedule)
+            .values(
+                product_id=product_id,
+                platform_id=platform_id,
+                interval_minutes=interval_minutes,
+                enabled=enabled,
+                next_run_at=next_run_at,
+            )
+            .returning(ScrapeSchedule)
+        )
+        result = await self.session.execute(query)
+        scrape_schedule = result.scalar()
+        await self.session.commit()
+        return scrape_schedule
+
+    async def update_scrape_schedule(
+        self,
+        id: int,
+        interval_minutes: int,
+        enabled: bool,
+        next_run_at: Optional[datetime.datetime] = None,
+    ) -> ScrapeSchedule:
+        scrape_schedule = await self.get_by_id(id)
+        if not scrape_schedule:
+            raise ValueError(f"ScrapeSchedule with id {id} not found")
+
+        values: Dict[str, Any] = {
+            "interval_minutes": interval_minutes,
+            "enabled": enabled,
+        }
+        if next_run_at is not None:
+            values["next_run_at"] = next_run_at
+        query = (
+            update(ScrapeSchedule)
+            .where(ScrapeSchedule.id == id)
+            .values(**values)
+            .returning(ScrapeSchedule)
+        )
+        result = await self.session.execute(query)
+        scrape_schedule = result.scalar()
+        await self.session.commit()
+        await self.session.refresh(scrape_schedule)
+        return scrape_schedule
+
+    async def set_next_run_at(self, id: int, next_run_at: datetime.datetime) -> None:
+        query = (
+            update(ScrapeSchedule)
+            .where(ScrapeSchedule.id == id)
+            .values(next_run_at=next_run_at)
+        )
+        await self.session.execute(query)
+        await self.session.commit()
+
+    async def mark_started(
+        self, id: int, job_id: str, next_run_at: datetime.datetime
+    ) -> None:
+        query = (
+            update(ScrapeSchedule)
+            .where(ScrapeSchedule.id == id)
+            .values(
+                last_run_at=func.now(),
+                last_job_id=job_id,
+                last_status="queued",
+                next_run_at=next_run_at,
+            )
+        )
+        await self.session.execute(query)
+        await self.session.commit()
+
+    async def mark_finished(self, id: int, job_id: str, status: str) -> None:
+        query = (
+            update(ScrapeSchedule)
+            .where(ScrapeSchedule.id == id, ScrapeSchedule.last_job_id == job_id)
+            .values(last_status=status)
+        )
+        await self.session.execute(query)
+        await self.session.commit()
+
+    async def delete_scrape_schedule(self, id: int) -> ScrapeSchedule:
+        scrape_schedule = await self.get_by_id(id)
+        if not scrape_schedule:
+            raise ValueError(f"ScrapeSchedule with id {id} not found")
+
+        query = (
+            delete(ScrapeSchedule)
+            .where(ScrapeSchedule.id == id)
+            .returning(ScrapeSchedule)
+        )
+        await self.session.execute(query)
+        await self.session.commit()
+        return scrape_schedule
+
+
+ScrapeScheduleRepositoryDependency = Annotated[
+    ScrapeScheduleRepository, Depends(ScrapeScheduleRepository)
+]
@@ -1,6 +1,7 @@
-from typing import Annotated, List, Optional
+import datetime
+from typing import Annotated, Any, Dict, List, Optional
 from fastapi import Depends
-from sqlalchemy import select, insert, update, delete
+from sqlalchemy import func, select, insert, update, delete
 from db import SessionContext
 from models.scraped_product_data import ScrapedProductData
 from decimal import Decimal
@@ -44,6 +45,41 @@ class ScrapedProductDataRepository:
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def get_max_id(self) -> Optional[int]:
+        query = select(func.max(ScrapedProductData.id))
+        result = await self.session.execute(query)
+        return result.scalar()
+
+    async def get_with_snapshots_after(
+        self,
+        after_id: int,
+        max_id: int,
+        limit: int,
+        platform_id: int,
+        product_id: Optional[int] = None,
+        since: Optional[datetime.datetime] = None,
+        until: Optional[datetime.datetime] = None,
+    ) -> List[ScrapedProductData]:
+        query = (
+            select(ScrapedProductData)
+            .where(
+                ScrapedProductData.id > after_id,
+                ScrapedProductData.id <= max_id,
+                ScrapedProductData.platform_id == platform_id,
+                ScrapedProductData.snapshot_hash.is_not(None),
+            )
+            .order_by(ScrapedProductData.id)
+            .limit(limit)
+        )
+        if product_id is not None:
+            query = query.where(ScrapedProductData.product_id == product_id)
+        if since is not None:
+            query = query.where(ScrapedProductData.scraped_at >= since)
+        if until is not None:
+            query = query.where(ScrapedProductData.scraped_at < until)
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
     async def create_scraped_product_data(
         self,
         product_id: int,
@@ -56,6 +92,8 @@ class ScrapedProductDataRepository:
         reviews_count: Optional[int] = None,
         availability_status: Optional[str] = None,
         search_position: Optional[int] = None,
+        snapshot_hash: Optional[str] = None,
+        canonical_url: Optional[str] = None,
     ) -> ScrapedProductData:
         query = (
             insert(ScrapedProductData)
@@ -70,6 +108,8 @@ class ScrapedProductDataRepository:
                 reviews_count=reviews_count,
                 availability_status=availability_status,
                 search_position=search_position,
+                snapshot_hash=snapshot_hash,
+                canonical_url=canonical_url,
             )
             .returning(ScrapedProductData)
         )
@@ -94,6 +134,8 @@ class ScrapedProductDataRepository:
                 "reviews_count": int(item.reviews_count),
                 "availability_status": item.availability_status,
                 "search_position": int(item.search_position),
+                "snapshot_hash": item.snapshot_hash,
+                "canonical_url": item.canonical_url,
             }
             for item in data
         ]
@@ -102,6 +144,20 @@ class ScrapedProductDataRepository:
         await self.session.commit()
         return list(result.scalars().all())
 
+    async def bulk_insert_values(self, values: List[Dict[str, Any]]) -> int:
+        if not values:
+            return 0
+        await self.session.execute(insert(ScrapedProductData), values)
+        await self.session.commit()
+        return len(values)
+
+    async def bulk_update_values(self, values: List[Dict[str, Any]]) -> int:
+        if not values:
+            return 0
+        await self.session.execute(update(ScrapedProductData), values)
+        await self.session.commit()
+        return len(values)
+
     async def update_scraped_product_data(
         self,
         id: int,
@@ -115,6 +171,8 @@ class ScrapedProductDataRepository:
         reviews_count: Optional[int] = None,
         availability_status: Optional[str] = None,
         search_position: Optional[int] = None,
+        snapshot_hash: Optional[str] = None,
+        canonical_url: Optional[str] = None,
     ) -> ScrapedProductData:
         scraped_data = await self.get_by_id(id)
         if not scraped_data:
@@ -134,6 +192,8 @@ class ScrapedProductDataRepository:
                 reviews_count=reviews_count,
                 availability_status=availability_status,
                 search_position=search_position,
+                snapshot_hash=snapshot_hash,
+                canonical_url=canonical_url,
             )
             .returning(ScrapedProductData)
         )
@@ -7,7 +7,9 @@ from common.app_settings import settings
 
 engine = create_async_engine(settings.DB_CONNECTION_STRING, connect_args={})
 
-SessionLocal = async_sessionmaker(autoflush=False, autocommit=False, bind=engine)
+SessionLocal = async_sessionmaker(
+    autoflush=False, autocommit=False, expire_on_commit=False, bind=engine
+)
 
 
 async def get_db():
@@ -1,16 +1,50 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.responses import RedirectResponse
 from fastapi.middleware.cors import CORSMiddleware
 from scalar_fastapi import get_scalar_api_reference
 from scalar_fastapi.scalar_fastapi import Layout
 
+from api.backfill_controller import backfill_router
+from api.metrics_controller import metrics_router
 from api.scrape_controller import scrape_router
+from api.scrape_schedule_controller import scrape_schedule_router
 from api.platform_controller import platform_router
+from api.platform_selectors_controller import platform_selectors_router
 from api.product_controller import product_router
 from api.regression_model_controller import regression_model_router
 from api.scraped_product_data_controller import scraped_product_data_router
+from api.snapshot_controller import snapshot_router
+from common.browser_pool import browser_pool
+from common.genai_cache import genai_cache
+from common.http_fetcher import http_fetcher
+from common.process_pool import process_pool
+from common.scrape_jobs import scrape_job_manager
+from common.scrape_scheduler import scrape_scheduler
+from common.snapshot_store import snapshot_store
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await browser_pool.start()
+    await scrape_job_manager.start()
+    await snapshot_store.start()
+    await genai_cache.start()
+    await scrape_scheduler.start()
+    try:
+        yield
+    finally:
+        await scrape_scheduler.stop()
+        await genai_cache.stop()
+        await snapshot_store.stop()
+        await scrape_job_manager.stop()
+        await browser_pool.stop()
+        await http_fetcher.stop()
+        process_pool.stop()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -21,10 +55,15 @@ app.add_middleware(
 )
 
 app.include_router(scrape_router)
+app.include_router(scrape_schedule_router)
 app.include_router(platform_router)
+app.include_router(platform_selectors_router)
 app.include_router(product_router)
 app.include_router(regression_model_router)
 app.include_router(scraped_product_data_router)
+app.include_router(snapshot_router)
+app.include_router(backfill_router)
+app.include_router(metrics_router)
 
 
 @app.get("/scalar", include_in_schema=False)
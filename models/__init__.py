@@ -4,5 +4,21 @@ from .platform import Platform
 from .product import Product
 from .scraped_product_data import ScrapedProductData
 from .regression_model import RegressionModel
+from .platform_selectors import PlatformSelectors
+from .scrape_schedule import ScrapeSchedule
+from .page_fingerprint import PageFingerprint
+from .page_observation import PageObservation
+from .product_characteristics import ProductCharacteristics
 
-__all__ = ["Base", "Platform", "Product", "ScrapedProductData", "RegressionModel"]
+__all__ = [
+    "Base",
+    "Platform",
+    "Product",
+    "ScrapedProductData",
+    "RegressionModel",
+    "PlatformSelectors",
+    "ScrapeSchedule",
+    "PageFingerprint",
+    "PageObservation",
+    "ProductCharacteristics",
+]
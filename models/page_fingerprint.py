@@ -0,0 +1,44 @@
+from sqlalchemy import DateTime, ForeignKey, String, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+import datetime
+from typing import Optional
+
+from .base import Base
+
+
+class PageFingerprint(Base):
+    """
+    Модель для зберігання відбитка останньої версії сторінки товару:
+    валідатори HTTP-кешу (ETag, Last-Modified) і хеш нормалізованого HTML.
+    Якщо сторінка не змінилась, замість нового рядка даних записується
+    спостереження (`PageObservation`) для `scraped_product_data_id`.
+    Відбиток окремий для кожного товару, навіть якщо URL спільний.
+    """
+
+    __tablename__ = "page_fingerprints"
+    __table_args__ = (UniqueConstraint("url", "product_id"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    url: Mapped[str] = mapped_column(String(1024), nullable=False, index=True)
+    product_id: Mapped[int] = mapped_column(
+        ForeignKey("products.id"), nullable=False, index=True
+    )
+    platform_id: Mapped[int] = mapped_column(
+        ForeignKey("platforms.id"), nullable=False, index=True
+    )
+    scraped_product_data_id: Mapped[int] = mapped_column(
+        ForeignKey("scraped_product_data.id", ondelete="CASCADE"), nullable=False
+    )
+
+    etag: Mapped[Optional[str]] = mapped_column(String(256))
+    last_modified: Mapped[Optional[str]] = mapped_column(String(64))
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64))
+
+    checked_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+    def __repr__(self) -> str:
+        return f"<PageFingerprint(url='{self.url}', content_hash={self.content_hash})>"
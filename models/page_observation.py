@@ -0,0 +1,32 @@
+from sqlalchemy import DateTime, ForeignKey, Integer, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+import datetime
+
+from .base import Base
+
+
+class PageObservation(Base):
+    """
+    Модель для дешевого запису "сторінка не змінилась": посилається на
+    останній повний рядок `scraped_product_data` і фіксує лише момент
+    спостереження та позицію в пошуку.
+    """
+
+    __tablename__ = "page_observations"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    scraped_product_data_id: Mapped[int] = mapped_column(
+        ForeignKey("scraped_product_data.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    search_position: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    observed_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+    def __repr__(self) -> str:
+        return f"<PageObservation(scraped_product_data_id={self.scraped_product_data_id}, observed_at={self.observed_at})>"
@@ -1,7 +1,7 @@
-from sqlalchemy import String
+from sqlalchemy import JSON, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from typing import List
+from typing import List, Optional
 
 from .base import Base
 
@@ -9,7 +9,8 @@ from .base import Base
 class Platform(Base):
     """
     Модель для опису платформи/маркетплейсу.
-    Зберігає інформацію про назву, базову URL-адресу та шаблон для пошуку.
+    Зберігає інформацію про назву, базову URL-адресу, шаблон для пошуку
+    та правила канонізації URL товарів.
     """
 
     __tablename__ = "platforms"
@@ -20,6 +21,7 @@ class Platform(Base):
     )
     base_url: Mapped[str] = mapped_column(String(255), nullable=False)
     search_url_template: Mapped[str] = mapped_column(String(512), nullable=False)
+    canonical_url_rules: Mapped[Optional[dict]] = mapped_column(JSON)
 
     scraped_data: Mapped[List["ScrapedProductData"]] = relationship(  # noqa: F821 # type: ignore
         back_populates="platform", cascade="all, delete-orphan"
@@ -27,6 +29,9 @@ class Platform(Base):
     regression_models: Mapped[List["RegressionModel"]] = relationship(  # noqa: F821 # type: ignore
         back_populates="platform", cascade="all, delete-orphan"
     )
+    platform_selectors: Mapped[Optional["PlatformSelectors"]] = relationship(  # noqa: F821 # type: ignore
+        back_populates="platform", cascade="all, delete-orphan"
+    )
 
     def __repr__(self) -> str:
         return f"<Platform(id={self.id}, name='{self.name}')>"
@@ -0,0 +1,49 @@
+from sqlalchemy import JSON, DateTime, Float, ForeignKey, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+import datetime
+from typing import Any, Dict, Optional
+
+from .base import Base
+
+
+class PlatformSelectors(Base):
+    """
+    Модель для зберігання CSS-селекторів сторінки товару та сторінки результатів
+    пошуку, знайдених для платформи.
+    Селектори повторно використовуються між запусками, доки частка заповнених
+    полів (fill rate) не впаде нижче порогу.
+    `fetch_mode` запам'ятовує, чи можна брати сторінки товарів без браузера.
+    """
+
+    __tablename__ = "platform_selectors"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    platform_id: Mapped[int] = mapped_column(
+        ForeignKey("platforms.id"), nullable=False, unique=True, index=True
+    )
+
+    selectors: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=False)
+    search_selectors: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON)
+
+    fill_rate: Mapped[Optional[float]] = mapped_column(Float)
+    field_fill_rates: Mapped[Optional[Dict[str, float]]] = mapped_column(JSON)
+    runs_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    fetch_mode: Mapped[Optional[str]] = mapped_column(String(16))
+    fetch_mode_checked_at: Mapped[Optional[datetime.datetime]] = mapped_column(
+        DateTime(timezone=True)
+    )
+
+    discovered_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    platform: Mapped["Platform"] = relationship(back_populates="platform_selectors")  # noqa: F821 # type: ignore
+
+    def __repr__(self) -> str:
+        return f"<PlatformSelectors(platform_id={self.platform_id}, fill_rate={self.fill_rate})>"
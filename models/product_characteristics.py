@@ -0,0 +1,38 @@
+from sqlalchemy import JSON, DateTime, ForeignKey, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+import datetime
+from typing import Any, Dict, List
+
+from .base import Base
+
+
+class ProductCharacteristics(Base):
+    """
+    Модель для зберігання характеристик товару (пари "назва: значення"),
+    витягнутих зі сторінки товару на платформі. Один запис на канонічний URL
+    сторінки, тому характеристики не витягуються повторно в кожному запуску.
+    """
+
+    __tablename__ = "product_characteristics"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    url: Mapped[str] = mapped_column(
+        String(1024), nullable=False, unique=True, index=True
+    )
+    product_id: Mapped[int] = mapped_column(
+        ForeignKey("products.id"), nullable=False, index=True
+    )
+    platform_id: Mapped[int] = mapped_column(
+        ForeignKey("platforms.id"), nullable=False, index=True
+    )
+
+    characteristics: Mapped[List[Dict[str, Any]]] = mapped_column(JSON, nullable=False)
+
+    extracted_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+    def __repr__(self) -> str:
+        return f"<ProductCharacteristics(url='{self.url}', count={len(self.characteristics)})>"
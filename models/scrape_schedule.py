@@ -0,0 +1,60 @@
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+import datetime
+from typing import Optional
+
+from .base import Base
+
+
+class ScrapeSchedule(Base):
+    """
+    Модель для розкладу періодичного скрейпінгу пари товар-платформа.
+    `next_run_at` зберігається в базі, тому після перезапуску сервісу
+    розклад продовжується з того ж місця.
+    """
+
+    __tablename__ = "scrape_schedules"
+    __table_args__ = (UniqueConstraint("product_id", "platform_id"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    product_id: Mapped[int] = mapped_column(
+        ForeignKey("products.id"), nullable=False, index=True
+    )
+    platform_id: Mapped[int] = mapped_column(
+        ForeignKey("platforms.id"), nullable=False, index=True
+    )
+
+    interval_minutes: Mapped[int] = mapped_column(Integer, nullable=False)
+    enabled: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+
+    next_run_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
+    last_run_at: Mapped[Optional[datetime.datetime]] = mapped_column(
+        DateTime(timezone=True)
+    )
+    last_job_id: Mapped[Optional[str]] = mapped_column(String(32))
+    last_status: Mapped[Optional[str]] = mapped_column(String(20))
+
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    product: Mapped["Product"] = relationship()  # noqa: F821 # type: ignore
+    platform: Mapped["Platform"] = relationship()  # noqa: F821 # type: ignore
+
+    def __repr__(self) -> str:
+        return f"<ScrapeSchedule(product_id={self.product_id}, platform_id={self.platform_id}, interval_minutes={self.interval_minutes})>"
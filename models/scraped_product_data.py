@@ -3,6 +3,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 import datetime
 from decimal import Decimal
+from typing import Optional
 
 from .base import Base
 
@@ -25,6 +26,7 @@ class ScrapedProductData(Base):
     )
 
     url_on_platform: Mapped[str] = mapped_column(String(1024), nullable=False)
+    canonical_url: Mapped[Optional[str]] = mapped_column(String(1024), index=True)
     name_on_platform: Mapped[str] = mapped_column(String(512), nullable=False)
 
     price: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
@@ -35,6 +37,8 @@ class ScrapedProductData(Base):
     availability_status: Mapped[str] = mapped_column(String(100), nullable=False)
     search_position: Mapped[int] = mapped_column(Integer, nullable=False)
 
+    snapshot_hash: Mapped[Optional[str]] = mapped_column(String(64), index=True)
+
     scraped_at: Mapped[datetime.datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
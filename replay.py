@@ -0,0 +1,93 @@
+"""
+Скрейпінг товару із записом або відтворенням відповідей сторінок і Gemini.
+
+    python replay.py record 5 --platforms 1 2
+    python replay.py replay 5 --platforms 1 2 --repeat 3
+
+У режимі `replay` мережа не потрібна: сторінки віддаються через маршрутизацію
+Playwright і httpx, а відповіді Gemini — із записів у `--dir`. В обох режимах
+збережені в БД селектори, відбитки сторінок і характеристики не
+використовуються, а відтворення не записує результати в БД.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import Counter
+from typing import Any, Dict
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("mode", choices=("record", "replay"))
+    parser.add_argument("product_id", type=int)
+    parser.add_argument("--platforms", type=int, nargs="*", default=[])
+    parser.add_argument("--dir", default="recordings", help="Recordings directory")
+    parser.add_argument("--page-concurrency", type=int)
+    parser.add_argument("--platform-concurrency", type=int)
+    parser.add_argument("--repeat", type=int, default=1)
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace) -> None:
+    # Налаштування читаються під час імпорту, тому режим задається до нього.
+    from common.browser_pool import browser_pool
+    from common.http_fetcher import http_fetcher
+    from common.process_pool import process_pool
+    from common.replay_store import replay_store
+    from common.services.scrape_service import create_scrape_service
+    from db import SessionLocal
+
+    try:
+        for run in range(1, args.repeat + 1):
+            events: Counter = Counter()
+
+            def on_progress(event: Dict[str, Any]) -> None:
+                events[event["event"]] += 1
+
+            started_at = time.perf_counter()
+            async with SessionLocal() as session:
+                result = await create_scrape_service(session).scrape(
+                    args.product_id,
+                    args.platforms,
+                    args.page_concurrency,
+                    args.platform_concurrency,
+                    on_progress=on_progress,
+                )
+            seconds = time.perf_counter() - started_at
+            pages = (
+                events["product_scraped"]
+                + events["product_unchanged"]
+                + events["product_failed"]
+            )
+            print(
+                json.dumps(
+                    {
+                        "run": run,
+                        "seconds": round(seconds, 3),
+                        "pages": pages,
+                        "pages_per_second": round(pages / seconds, 3),
+                        "persisted": result["persisted"],
+                        "unchanged": result["unchanged"],
+                        "dropped": result["dropped"],
+                        "failed": events["product_failed"],
+                        "platform_errors": len(result["platform_errors"]),
+                    }
+                )
+            )
+        print(json.dumps(replay_store.stats()))
+    finally:
+        await browser_pool.stop()
+        await http_fetcher.stop()
+        process_pool.stop()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    arguments = parse_args()
+    os.environ["REPLAY_MODE"] = arguments.mode
+    os.environ["REPLAY_DIR"] = arguments.dir
+    asyncio.run(main(arguments))
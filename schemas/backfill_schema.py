@@ -0,0 +1,53 @@
+import datetime
+from typing import Any, Dict, List, Literal, Optional
+from pydantic import BaseModel, field_validator
+
+from utils.bs4.extract_product_data import PRODUCT_SELECTOR_KEYS
+
+
+class BackfillSchema(BaseModel):
+    platform_id: int
+    selectors: Optional[Dict[str, Any]] = None
+    product_id: Optional[int] = None
+    since: Optional[datetime.datetime] = None
+    until: Optional[datetime.datetime] = None
+    mode: Literal["update", "insert"] = "update"
+    dry_run: bool = False
+
+    @field_validator("selectors")
+    def validate_selectors(
+        cls, value: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        if value is not None:
+            missing = [key for key in PRODUCT_SELECTOR_KEYS if key not in value]
+            if missing:
+                raise ValueError(f"Missing selectors: {', '.join(missing)}")
+        return value
+
+
+class BackfillErrorSchema(BaseModel):
+    id: int
+    detail: str
+
+
+class BackfillResultSchema(BaseModel):
+    scanned: int = 0
+    parsed: int = 0
+    changed: int = 0
+    written: int = 0
+    failed: int = 0
+    errors: List[BackfillErrorSchema] = []
+    seconds: float = 0.0
+
+
+class BackfillJobSchema(BaseModel):
+    id: str
+    status: Literal["queued", "running", "succeeded", "failed"]
+    platform_id: int
+    product_id: Optional[int] = None
+    dry_run: bool = False
+    created_at: datetime.datetime
+    started_at: Optional[datetime.datetime] = None
+    finished_at: Optional[datetime.datetime] = None
+    result: BackfillResultSchema
+    error: Optional[str] = None
@@ -0,0 +1,52 @@
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+class SearchResultSchema(BaseModel):
+    link: str = Field(min_length=1)
+    search_position: int = Field(ge=1)
+
+
+class SearchResultsSchema(BaseModel):
+    products: List[SearchResultSchema]
+
+
+class SearchSelectorsSchema(BaseModel):
+    item_selector: str = Field(min_length=1)
+    link_selector: str = ""
+    link_attribute: str = "href"
+    next_page_selector: str = ""
+
+
+class RatingSelectorSchema(BaseModel):
+    selector: str = Field(min_length=1)
+    percent_attribute: Optional[str] = None
+
+
+class ProductSelectorsSchema(BaseModel):
+    title_selector: str = Field(min_length=1)
+    price_selector: str = Field(min_length=1)
+    currency_selector: str = Field(min_length=1)
+    rating_selector: RatingSelectorSchema
+    reviews_count_selector: str = Field(min_length=1)
+    availability_selector: str = Field(min_length=1)
+    charecteristics: Optional[str] = None
+
+    def to_selectors(self) -> dict:
+        """
+        Селектори у форматі `extract_product_data`: числовий рейтинг
+        задається рядком, відсотковий — об'єктом з атрибутом.
+        """
+        selectors = self.model_dump()
+        if not self.rating_selector.percent_attribute:
+            selectors["rating_selector"] = self.rating_selector.selector
+        return selectors
+
+
+class CharacteristicSchema(BaseModel):
+    name: str = Field(min_length=1)
+    value: str
+
+
+class CharacteristicsSchema(BaseModel):
+    characteristics: List[CharacteristicSchema]
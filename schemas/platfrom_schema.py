@@ -1,11 +1,29 @@
+import re
 from pydantic import BaseModel, HttpUrl, field_validator
-from typing import Optional
+from typing import List, Optional
+
+
+class CanonicalUrlRulesSchema(BaseModel):
+    keep_params: Optional[List[str]] = None
+    drop_params: List[str] = []
+    strip_www: bool = False
+    path_pattern: Optional[str] = None
+
+    @field_validator("path_pattern")
+    def validate_path_pattern(cls, value: Optional[str]) -> Optional[str]:
+        if value:
+            try:
+                re.compile(value)
+            except re.error as e:
+                raise ValueError(f"Некоректний регулярний вираз шляху: {e}")
+        return value
 
 
 class PlatformSchema(BaseModel):
     name: str
     base_url: HttpUrl
     search_url_template: Optional[HttpUrl] = None
+    canonical_url_rules: Optional[CanonicalUrlRulesSchema] = None
 
     @field_validator("name")
     def validate_name(cls, value: str) -> str:
@@ -0,0 +1,26 @@
+import datetime
+from typing import Optional
+from pydantic import BaseModel, field_validator
+
+
+class ScrapeScheduleSchema(BaseModel):
+    product_id: int
+    platform_id: int
+    interval_minutes: int
+    enabled: bool = True
+    next_run_at: Optional[datetime.datetime] = None
+
+    @field_validator("product_id", "platform_id")
+    def validate_positive_id(cls, value: int) -> int:
+        if value <= 0:
+            raise ValueError("ID повинен бути позитивним")
+        return value
+
+    @field_validator("interval_minutes")
+    def validate_interval_minutes(cls, value: int) -> int:
+        if value < 5 or value > 60 * 24 * 31:
+            raise ValueError("Інтервал повинен бути між 5 хвилинами та 31 днем")
+        return value
+
+    class Config:
+        from_attributes = True
@@ -1,7 +1,49 @@
-from typing import List
-from pydantic import BaseModel
+import datetime
+from typing import List, Literal, Optional
+from pydantic import BaseModel, field_validator
 
 
 class ScrapeSchema(BaseModel):
     product_id: int = 1
     platforms_ids: List[int] = []
+    page_concurrency: Optional[int] = None
+    platform_concurrency: Optional[int] = None
+    characteristics: Optional[bool] = None
+    max_positions: Optional[int] = None
+
+    @field_validator("page_concurrency", "platform_concurrency")
+    def validate_concurrency(cls, value: Optional[int]) -> Optional[int]:
+        if value is not None and (value < 1 or value > 32):
+            raise ValueError("Concurrency must be between 1 and 32")
+        return value
+
+    @field_validator("max_positions")
+    def validate_max_positions(cls, value: Optional[int]) -> Optional[int]:
+        if value is not None and value < 1:
+            raise ValueError("Max positions must be positive")
+        return value
+
+
+class PlatformScrapeErrorSchema(BaseModel):
+    platform_id: int
+    detail: str
+
+
+class ScrapeJobSchema(BaseModel):
+    id: str
+    status: Literal["queued", "running", "succeeded", "failed"]
+    product_id: int
+    platforms_ids: List[int]
+    created_at: datetime.datetime
+    started_at: Optional[datetime.datetime] = None
+    finished_at: Optional[datetime.datetime] = None
+    products_total: int = 0
+    products_scraped: int = 0
+    products_failed: int = 0
+    products_unchanged: int = 0
+    persisted: int = 0
+    unchanged: int = 0
+    dropped: int = 0
+    characteristics_extracted: int = 0
+    platform_errors: List[PlatformScrapeErrorSchema] = []
+    error: Optional[str] = None
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, HttpUrl, field_validator
 from decimal import Decimal
+from typing import Optional
 
 
 class ScrapedProductDataSchema(BaseModel):
@@ -13,6 +14,8 @@ class ScrapedProductDataSchema(BaseModel):
     reviews_count: int
     availability_status: str
     search_position: int
+    snapshot_hash: Optional[str] = None
+    canonical_url: Optional[str] = None
 
     @field_validator("product_id", "platform_id")
     def validate_positive_id(cls, value: int) -> int:
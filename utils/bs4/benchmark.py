@@ -0,0 +1,143 @@
+"""
+Мікробенчмарк бекендів парсингу для `parse_product_data`.
+
+    python -m utils.bs4.benchmark
+    python -m utils.bs4.benchmark --snapshots snapshots --selectors selectors.json
+
+Без `--snapshots` використовується згенерована сторінка товару. Для кожного
+бекенду виводиться кількість сторінок за секунду та кількість сторінок, на яких
+результат відрізняється від еталонного `html.parser`. Окремо кожен селектор
+перевіряється на збіг з soupsieve: ті самі елементи в тому самому порядку і з
+тим самим текстом.
+"""
+
+import argparse
+import gzip
+import json
+import time
+from pathlib import Path
+from typing import List
+
+from utils.bs4.extract_product_data import parse_product_data
+from utils.bs4.parser_backends import BACKENDS, FALLBACK_BACKEND, ParserBackend
+
+SAMPLE_SELECTORS = {
+    "title_selector": "h1.product-title",
+    "price_selector": "div.product-price > span.value",
+    "currency_selector": "div.product-price > span.currency",
+    "rating_selector": {"selector": "div.stars", "percent_attribute": "style"},
+    "reviews_count_selector": "a.reviews-link",
+    "availability_selector": "p.availability",
+}
+
+# Селектори, які cssselect з XML-транслятором розбирав інакше, ніж soupsieve.
+PARITY_SELECTORS = [
+    "H1",
+    "[CLASS=product-title]",
+    "input:disabled",
+    "a:link",
+    "template span.currency",
+    "div.product-price span",
+]
+
+
+def sample_page(noise_blocks: int = 400) -> str:
+    noise = "".join(
+        f'<div class="card"><a href="/p/{i}"><img src="/{i}.jpg">'
+        f"<span>Товар {i}</span></a><p>Опис&nbsp;товару {i}</p></div>"
+        for i in range(noise_blocks)
+    )
+    return (
+        "<html><head><title>Товар</title><script>var data = {};</script></head>"
+        f"<body><nav>{noise}</nav><main>"
+        '<h1 class="product-title"> Apple iPhone 16 Pro 256GB </h1>'
+        '<div class="product-price"><span class="value">56 699</span>'
+        '<span class="currency">₴</span></div>'
+        '<div class="stars" style="width: 89.8%"></div>'
+        '<a class="reviews-link" href="#reviews">107 відгуків</a>'
+        '<p class="availability">Є в наявності</p>'
+        '<input type="number" value="1" disabled>'
+        '<template><div class="product-price"><span class="value">0</span>'
+        '<span class="currency">X</span></div></template>'
+        f"</main><footer>{noise}</footer></body></html>"
+    )
+
+
+def load_pages(snapshots: str, limit: int) -> List[str]:
+    paths = sorted(Path(snapshots).glob("*/*.html.gz"))[:limit]
+    return [gzip.decompress(path.read_bytes()).decode("utf-8") for path in paths]
+
+
+def run(pages: List[str], selectors: dict, repeat: int) -> None:
+    expected = [parse_product_data(html, selectors, FALLBACK_BACKEND) for html in pages]
+
+    print(f"{'backend':<14}{'pages/s':>12}{'speedup':>10}{'mismatches':>12}")
+    baseline = None
+    for name in BACKENDS:
+        started_at = time.perf_counter()
+        for _ in range(repeat):
+            results = [parse_product_data(html, selectors, name) for html in pages]
+        pages_per_second = len(pages) * repeat / (time.perf_counter() - started_at)
+        baseline = baseline or pages_per_second
+        mismatches = sum(result != exp for result, exp in zip(results, expected))
+        print(
+            f"{name:<14}{pages_per_second:>12.1f}"
+            f"{pages_per_second / baseline:>9.1f}x{mismatches:>12}"
+        )
+
+
+def selector_parity(pages: List[str], selectors: List[str]) -> None:
+    reference = BACKENDS[FALLBACK_BACKEND]
+    expected = [reference.parse(html) for html in pages]
+
+    print(f"{'backend':<14}{'selector':<36}{'mismatches':>12}")
+    for name, backend in BACKENDS.items():
+        if name == FALLBACK_BACKEND:
+            continue
+        documents = [backend.parse(html) for html in pages]
+        for selector in selectors:
+            mismatches = sum(
+                _matches(backend, document, selector)
+                != _matches(reference, exp, selector)
+                for document, exp in zip(documents, expected)
+            )
+            print(f"{name:<14}{selector:<36}{mismatches:>12}")
+
+
+def _matches(backend: ParserBackend, document, selector: str) -> List[str]:
+    compiled = backend.compile(selector)
+    return [backend.text(element) for element in backend.select(document, compiled)]
+
+
+def product_selectors(selectors: dict) -> List[str]:
+    return [
+        value["selector"] if isinstance(value, dict) else value
+        for value in selectors.values()
+        if value
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--snapshots", help="HTML snapshot store directory")
+    parser.add_argument("--selectors", help="JSON file with product selectors")
+    parser.add_argument("--limit", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    selectors = SAMPLE_SELECTORS
+    if args.selectors:
+        with open(args.selectors, encoding="utf-8") as file:
+            selectors = json.load(file)
+
+    pages = load_pages(args.snapshots, args.limit) if args.snapshots else []
+    if not pages:
+        pages = [sample_page()]
+
+    run(pages, selectors, args.repeat)
+    print()
+    selector_parity(pages, product_selectors(selectors) + PARITY_SELECTORS)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+import hashlib
+import re
+
+# Вміст цих блоків і атрибутів змінюється між завантаженнями навіть тоді,
+# коли сама сторінка товару не змінилась.
+VOLATILE_BLOCK_RE = re.compile(
+    r"<(script|style|noscript|template)\b[^>]*>.*?</\1\s*>", re.IGNORECASE | re.DOTALL
+)
+COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+VOLATILE_ATTRIBUTE_RE = re.compile(
+    r"\s+(?:nonce|integrity|data-csrf[\w-]*|csrf[\w-]*|data-reactroot|data-timestamp)"
+    r"(?:=(?:\"[^\"]*\"|'[^']*'|[^\s>]*))?",
+    re.IGNORECASE,
+)
+WHITESPACE_RE = re.compile(r"\s+")
+TAG_END_SPACE_RE = re.compile(r"\s+(/?>)")
+BETWEEN_TAGS_SPACE_RE = re.compile(r">\s+<")
+
+
+def normalize_html(html: str) -> str:
+    html = VOLATILE_BLOCK_RE.sub("", html)
+    html = COMMENT_RE.sub("", html)
+    html = VOLATILE_ATTRIBUTE_RE.sub("", html)
+    html = WHITESPACE_RE.sub(" ", html)
+    html = TAG_END_SPACE_RE.sub(r"\1", html)
+    return BETWEEN_TAGS_SPACE_RE.sub("><", html).strip()
+
+
+def content_hash(html: str) -> str:
+    """
+    Хеш нормалізованого HTML: без скриптів, стилів, коментарів, одноразових
+    токенів і різниці в пробілах.
+    """
+    return hashlib.sha256(normalize_html(html).encode("utf-8")).hexdigest()
@@ -1,70 +1,179 @@
-from bs4 import BeautifulSoup
+import json
+import logging
 import re
 from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, NamedTuple, Optional
 
 from models.scraped_product_data import ScrapedProductData
+from utils.bs4.parser_backends import FALLBACK_BACKEND, ParserBackend, get_backend
+
+logger = logging.getLogger(__name__)
+
+INT_RE = re.compile(r"\d+")
+DECIMAL_RE = re.compile(r"\d+(\.\d+)?")
+NON_NUMBER_RE = re.compile(r"[^\d.,]")
+PERCENT_RE = re.compile(r"(\d+(?:\.\d+)?)%")
+
+ParseRunner = Callable[..., Awaitable[dict]]
+
+PRODUCT_SELECTOR_KEYS = (
+    "title_selector",
+    "price_selector",
+    "currency_selector",
+    "rating_selector",
+    "reviews_count_selector",
+    "availability_selector",
+)
+
+
+class CompiledProductSelectors(NamedTuple):
+    backend: ParserBackend
+    title: Any
+    price: Any
+    currency: Any
+    rating: Any
+    rating_percent_attribute: Optional[str]
+    reviews_count: Any
+    availability: Any
 
 
 async def extract_product_data(
-    html, url: str, selectors: dict, product_id: int, platform_id: int, position: int
+    html,
+    url: str,
+    selectors: dict,
+    product_id: int,
+    platform_id: int,
+    position: int,
+    backend: Optional[str] = None,
+    runner: Optional[ParseRunner] = None,
 ) -> ScrapedProductData:
-    soup = BeautifulSoup(html, "html.parser")
+    """
+    `runner` виконує `parse_product_data` поза циклом подій (наприклад,
+    `ProcessPool.run`); без нього парсинг іде в поточному потоці.
+    """
+    if runner is not None:
+        fields = await runner(parse_product_data, html, selectors, backend)
+    else:
+        fields = parse_product_data(html, selectors, backend)
+
+    return ScrapedProductData(
+        product_id=product_id,
+        platform_id=platform_id,
+        url_on_platform=url,
+        search_position=position,
+        **fields,
+    )
+
+
+def parse_product_data(html, selectors: dict, backend: Optional[str] = None) -> dict:
+    """
+    Синхронне ядро `extract_product_data`: повертає лише поля, що беруться
+    зі сторінки, тому його можна виконувати в окремому процесі.
+    """
+    compiled = compile_product_selectors(selectors, backend)
+    parser = compiled.backend
+    document = parser.parse(html)
 
     def get_text(selector):
-        el = soup.select_one(selector)
-        return el.get_text(strip=True) if el else None
+        el = parser.select_one(document, selector)
+        return parser.text(el) if el is not None else None
 
     def get_int(selector):
         text = get_text(selector)
         if not text:
             return 0
-        match = re.search(r"\d+", text.replace(" ", "").replace(" ", ""))
+        match = INT_RE.search(text.replace(" ", "").replace(" ", ""))
         return int(match.group(0)) if match else 0
 
     def get_decimal(selector):
-        el = soup.select_one(selector)
-        if not el:
+        el = parser.select_one(document, selector)
+        if el is None:
             return Decimal("0.00")
 
-        text_parts = list(el.stripped_strings)
-        full_text = "".join(text_parts)
+        full_text = "".join(parser.strings(el))
 
-        cleaned = re.sub(r"[^\d.,]", "", full_text).replace(",", ".")
+        cleaned = NON_NUMBER_RE.sub("", full_text).replace(",", ".")
 
-        match = re.search(r"\d+(\.\d+)?", cleaned)
+        match = DECIMAL_RE.search(cleaned)
         return Decimal(match.group(0)) if match else Decimal("0.00")
 
-    def get_rating(rating_selector):
-        if isinstance(rating_selector, str):
-            el = soup.select_one(rating_selector)
-            if not el:
-                return 0.0
+    def get_rating():
+        if compiled.rating is None:
+            return 0.0
 
-            text = el.get_text(strip=True).replace(",", ".")
-            match = re.search(r"\d+(\.\d+)?", text)
-            return float(match.group(0)) if match else 0.0
+        el = parser.select_one(document, compiled.rating)
+        if el is None:
+            return 0.0
 
-        elif isinstance(rating_selector, dict):
-            el = soup.select_one(rating_selector["selector"])
-            if not el:
-                return 0.0
+        if compiled.rating_percent_attribute is None:
+            text = parser.text(el).replace(",", ".")
+            match = DECIMAL_RE.search(text)
+            return float(match.group(0)) if match else 0.0
 
-            attr_value = el.get(rating_selector["percent_attribute"], "")
-            percent_match = re.search(r"(\d+(?:\.\d+)?)%", attr_value)  # type: ignore
-            if percent_match:
-                percent = float(percent_match.group(1))
-                return round((percent / 100) * 5, 2)
+        attr_value = parser.attribute(el, compiled.rating_percent_attribute) or ""
+        percent_match = PERCENT_RE.search(attr_value)
+        if percent_match:
+            percent = float(percent_match.group(1))
+            return round((percent / 100) * 5, 2)
         return 0.0
 
-    return ScrapedProductData(
-        product_id=product_id,
-        platform_id=platform_id,
-        url_on_platform=url,
-        name_on_platform=get_text(selectors["title_selector"]) or "",
-        price=get_decimal(selectors["price_selector"]),
-        currency=get_text(selectors["currency_selector"]) or "UAH",
-        rating=get_rating(selectors["rating_selector"]),
-        reviews_count=get_int(selectors["reviews_count_selector"]),
-        availability_status=get_text(selectors["availability_selector"]) or "Невідомо",
-        search_position=position,
+    return {
+        "name_on_platform": get_text(compiled.title) or "",
+        "price": get_decimal(compiled.price),
+        "currency": get_text(compiled.currency) or "UAH",
+        "rating": get_rating(),
+        "reviews_count": get_int(compiled.reviews_count),
+        "availability_status": get_text(compiled.availability) or "Невідомо",
+    }
+
+
+def compile_product_selectors(
+    selectors: dict, backend: Optional[str] = None
+) -> CompiledProductSelectors:
+    """
+    Компілює селектори один раз на набір селекторів і процес; наступні виклики
+    з тими самими селекторами беруть результат з кешу.
+    """
+    return _compile_product_selectors(json.dumps(selectors, sort_keys=True), backend)
+
+
+@lru_cache(maxsize=64)
+def _compile_product_selectors(
+    selectors_json: str, backend: Optional[str]
+) -> CompiledProductSelectors:
+    selectors = json.loads(selectors_json)
+    parser = get_backend(backend)
+    try:
+        return _compile_with(parser, selectors)
+    except ValueError as e:
+        if parser.name == FALLBACK_BACKEND:
+            raise
+        logger.warning(
+            "Selectors are not supported by %s, using %s: %s",
+            parser.name,
+            FALLBACK_BACKEND,
+            e,
+        )
+        return _compile_with(get_backend(FALLBACK_BACKEND), selectors)
+
+
+def _compile_with(parser: ParserBackend, selectors: dict) -> CompiledProductSelectors:
+    rating_selector = selectors["rating_selector"]
+    rating, rating_percent_attribute = None, None
+    if isinstance(rating_selector, str):
+        rating = parser.compile(rating_selector)
+    elif isinstance(rating_selector, dict):
+        rating = parser.compile(rating_selector["selector"])
+        rating_percent_attribute = rating_selector["percent_attribute"]
+
+    return CompiledProductSelectors(
+        backend=parser,
+        title=parser.compile(selectors["title_selector"]),
+        price=parser.compile(selectors["price_selector"]),
+        currency=parser.compile(selectors["currency_selector"]),
+        rating=rating,
+        rating_percent_attribute=rating_percent_attribute,
+        reviews_count=parser.compile(selectors["reviews_count_selector"]),
+        availability=parser.compile(selectors["availability_selector"]),
     )
@@ -0,0 +1,43 @@
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+
+def extract_search_page(
+    html: str, base_url: str, search_selectors: Dict[str, str]
+) -> Tuple[List[Dict], Optional[str]]:
+    """
+    Посилання на товари зі сторінки результатів пошуку та URL наступної
+    сторінки (None, якщо `next_page_selector` не заданий або нічого не знайшов).
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    link_selector = search_selectors.get("link_selector") or None
+    link_attribute = search_selectors.get("link_attribute") or "href"
+
+    products: List[Dict] = []
+    seen = set()
+    for item in soup.select(search_selectors["item_selector"]):
+        link_el = item.select_one(link_selector) if link_selector else item
+        if link_el is None:
+            continue
+
+        href = link_el.get(link_attribute)
+        if not href or not isinstance(href, str):
+            continue
+
+        link = urljoin(base_url, href.strip())
+        if link in seen:
+            continue
+        seen.add(link)
+        products.append({"link": link, "search_position": len(products) + 1})
+
+    next_url = None
+    next_page_selector = search_selectors.get("next_page_selector")
+    if next_page_selector:
+        next_el = soup.select_one(next_page_selector)
+        href = next_el.get("href") if next_el is not None else None
+        if href and isinstance(href, str):
+            next_url = urljoin(base_url, href.strip())
+
+    return products, next_url
@@ -0,0 +1,155 @@
+from typing import Any, Dict, Iterator, List, Optional
+
+import soupsieve
+from bs4 import BeautifulSoup
+
+try:
+    import lxml.html
+    from cssselect import SelectorError
+    from lxml.cssselect import CSSSelector
+    from lxml.etree import ParserError
+except ImportError:  # pragma: no cover - без lxml працює html.parser
+    lxml = None  # type: ignore
+
+# Текст цих тегів BeautifulSoup не включає в get_text()/stripped_strings.
+SKIPPED_TEXT_TAGS = frozenset(("script", "style", "template"))
+
+
+class ParserBackend:
+    """
+    Спосіб розбору HTML для `parse_product_data`. Селектори компілюються
+    один раз (`compile`), а потім застосовуються до кожної сторінки.
+    """
+
+    name = ""
+
+    def compile(self, selector: str) -> Any:
+        raise NotImplementedError
+
+    def parse(self, html: str) -> Any:
+        raise NotImplementedError
+
+    def select(self, document: Any, selector: Any) -> List[Any]:
+        raise NotImplementedError
+
+    def select_one(self, document: Any, selector: Any) -> Any:
+        raise NotImplementedError
+
+    def strings(self, element: Any) -> List[str]:
+        """Непорожні рядки тексту елемента, як `stripped_strings` у BS4."""
+        raise NotImplementedError
+
+    def attribute(self, element: Any, name: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def text(self, element: Any) -> str:
+        """Аналог `get_text(strip=True)` у BS4."""
+        return "".join(self.strings(element))
+
+
+class SoupBackend(ParserBackend):
+    def __init__(self, features: str):
+        self.name = features
+        self.features = features
+
+    def compile(self, selector: str) -> Any:
+        return soupsieve.compile(selector)
+
+    def parse(self, html: str) -> Any:
+        return BeautifulSoup(html, self.features)
+
+    def select(self, document: Any, selector: Any) -> List[Any]:
+        return selector.select(document)
+
+    def select_one(self, document: Any, selector: Any) -> Any:
+        return selector.select_one(document)
+
+    def strings(self, element: Any) -> List[str]:
+        return list(element.stripped_strings)
+
+    def attribute(self, element: Any, name: str) -> Optional[str]:
+        return element.get(name)
+
+
+class LxmlBackend(ParserBackend):
+    name = "lxml-native"
+
+    def __init__(self):
+        self._parser = lxml.html.HTMLParser(encoding="utf-8")
+
+    def compile(self, selector: str) -> Any:
+        # HTML-транслятор, як і soupsieve для HTML-документів, не зважає на
+        # регістр імен тегів і атрибутів та підтримує :disabled, :link тощо.
+        try:
+            return CSSSelector(selector, translator="html")
+        except SelectorError as e:
+            raise ValueError(f"Unsupported selector {selector}: {e}")
+
+    def parse(self, html: str) -> Any:
+        try:
+            return lxml.html.document_fromstring(
+                html.encode("utf-8"), parser=self._parser
+            )
+        except ParserError:
+            return None
+
+    def select(self, document: Any, selector: Any) -> List[Any]:
+        return selector(document) if document is not None else []
+
+    def select_one(self, document: Any, selector: Any) -> Any:
+        if document is None:
+            return None
+        for element in selector(document):
+            return element
+        return None
+
+    def strings(self, element: Any) -> List[str]:
+        # BeautifulSoup не повертає текст вмісту <template> навіть для
+        # елемента всередині нього.
+        if (
+            element.tag == "template"
+            or next(element.iterancestors("template"), None) is not None
+        ):
+            return []
+        return [
+            stripped
+            for text in self._iter_text(element, root=True)
+            if (stripped := text.strip())
+        ]
+
+    def attribute(self, element: Any, name: str) -> Optional[str]:
+        return element.get(name)
+
+    def _iter_text(self, element: Any, root: bool = False) -> Iterator[str]:
+        # Коментарі (tag не є рядком) і тексти службових тегів пропускаються,
+        # але їх tail належить батьківському елементу і має залишитись.
+        if isinstance(element.tag, str) and (
+            root or element.tag not in SKIPPED_TEXT_TAGS
+        ):
+            if element.text:
+                yield element.text
+            for child in element:
+                yield from self._iter_text(child)
+                if child.tail:
+                    yield child.tail
+
+
+BACKENDS: Dict[str, ParserBackend] = {
+    "html.parser": SoupBackend("html.parser"),
+}
+if lxml is not None:
+    BACKENDS["lxml"] = SoupBackend("lxml")
+    BACKENDS["lxml-native"] = LxmlBackend()
+
+# lxml інакше виправляє битий HTML (закриває <p> перед вкладеним блоком), тож
+# на частині сторінок дає інші значення полів; його вмикають явно через
+# PARSER_BACKEND після перевірки `python -m utils.bs4.benchmark` на знімках.
+DEFAULT_BACKEND = "html.parser"
+FALLBACK_BACKEND = "html.parser"
+
+
+def get_backend(name: Optional[str] = None) -> ParserBackend:
+    name = name or DEFAULT_BACKEND
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown parser backend {name}")
+    return BACKENDS[name]
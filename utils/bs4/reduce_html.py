@@ -0,0 +1,87 @@
+import re
+from typing import NamedTuple
+
+from bs4 import BeautifulSoup, Comment
+
+REMOVED_TAGS = [
+    "head",
+    "script",
+    "style",
+    "noscript",
+    "template",
+    "svg",
+    "canvas",
+    "iframe",
+    "object",
+    "embed",
+    "video",
+    "audio",
+    "picture",
+    "img",
+    "link",
+    "meta",
+]
+KEPT_ATTRIBUTES = {"class", "id", "href", "style"}
+# Магазини часто тримають id, ціну чи наявність товару в data-* атрибутах,
+# тож вони лишаються для селекторів, але довгі значення (JSON-стан) обрізаються.
+DATA_ATTRIBUTE_PREFIX = "data-"
+MAX_DATA_ATTRIBUTE_LENGTH = 64
+
+CHARS_PER_TOKEN = 4
+
+WHITESPACE_RE = re.compile(r"\s+")
+BETWEEN_TAGS_RE = re.compile(r">\s+<")
+
+
+class ReducedHtml(NamedTuple):
+    html: str
+    original_size: int
+    reduced_size: int
+    truncated: bool
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN
+
+
+def reduce_html(html: str, max_tokens: int) -> ReducedHtml:
+    """
+    Прибирає з HTML вузли, що не містять контенту (скрипти, стилі, SVG, медіа),
+    залишає лише атрибути class/id/href/style і data-* (з обрізаними
+    довгими значеннями), стискає пробіли та обрізає
+    результат до бюджету у `max_tokens` токенів.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+
+    for element in soup(REMOVED_TAGS):
+        element.decompose()
+    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
+        comment.extract()
+    for tag in soup.find_all(True):
+        tag.attrs = {
+            name: _reduce_attribute(name, value)
+            for name, value in tag.attrs.items()
+            if name in KEPT_ATTRIBUTES or name.startswith(DATA_ATTRIBUTE_PREFIX)
+        }
+
+    reduced = str(soup.body or soup)
+    reduced = WHITESPACE_RE.sub(" ", reduced)
+    reduced = BETWEEN_TAGS_RE.sub("><", reduced).strip()
+
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    truncated = len(reduced) > max_chars
+    if truncated:
+        reduced = reduced[:max_chars]
+
+    return ReducedHtml(
+        html=reduced,
+        original_size=len(html),
+        reduced_size=len(reduced),
+        truncated=truncated,
+    )
+
+
+def _reduce_attribute(name: str, value):
+    if name.startswith(DATA_ATTRIBUTE_PREFIX) and isinstance(value, str):
+        return value[:MAX_DATA_ATTRIBUTE_LENGTH]
+    return value
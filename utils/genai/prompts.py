@@ -0,0 +1,109 @@
+SEARCH_RESULTS_PROMPT = """
+    Проаналізуй HTML-сторінку результатів пошуку та побудуй JSON-об’єкт у такому форматі:
+    {
+    "products": [
+        {
+        "link": "absolute URL to product page",
+        "search_position": 1
+        },
+        {
+        "link": "absolute URL to product page",
+        "search_position": 2
+        },
+        ...
+    ]
+    }
+    🔹 **link** — повне (абсолютне) посилання на сторінку продукту  
+    🔹 **search_position** — позиція продукту у результатах пошуку, починаючи з 1
+    ---
+    🎯 **Вимоги до вибірки**:
+    - Обробляй **лише головний блок із результатами пошуку** (наприклад, каталог товарів, грід або список товарів).
+    - Ігноруй банери, рекламу, рекомендовані товари, каруселі та інші другорядні блоки.
+    - Витягуй **тільки активні (видимі) продукти** — пропущені/приховані не враховувати.
+    - Не повинно бути `null` у полях (`link`, `search_position` мають бути присутні й валідні).
+    - Посилання повинні бути абсолютними (додавай `base_url`, якщо воно відсутнє у `href`).
+    ---
+    📌 Поверни **лише об'єкт JSON** без пояснень, коментарів або додаткового тексту.
+    """
+
+PRODUCT_SELECTORS_PROMPT = """
+    Надай стабільні CSS-селектори (класи, ID або вкладені атрибути) для використання з Playwright. Очікується об'єкт такого формату:
+    {
+    "title_selector": "CSS selector for product name",
+    "price_selector": "CSS selector for product price",
+    "currency_selector": "CSS selector for currency symbol",
+    "rating_selector": { "selector": "CSS selector for rating", "percent_attribute": "attribute with percent value or null" },
+    "reviews_count_selector": "CSS selector for number of feedbacks/feedbacks and questions",
+    "availability_selector": "CSS selector for availability status",
+    "charecteristics": "CSS selector for button/link of expand characteristics"
+    }
+    🔹 **title_selector** — назва продукту
+    🔹 **price_selector** — ціна продукту
+    🔹 **currency_selector** — валюта (наприклад, "$", "₴", "€")
+    🔹 **rating_selector** — об'єкт:
+        {
+        "selector": "CSS селектор елемента",
+        "percent_attribute": "назва атрибута (наприклад, style)"
+        }
+    - Якщо рейтинг вказано числом — selector вказує на це число, а percent_attribute дорівнює null.
+    - Якщо рейтинг реалізовано як відсоток (наприклад, через `style="width:80%"`) — вкажи атрибут з відсотком у percent_attribute.
+    🔹 **reviews_count_selector** — кількість відгуків
+    🔹 **availability_selector** — текст про наявність (наприклад, "В наявності", "Очікується", "Немає")
+    🔹 **charecteristics** — CSS селектор кнопки/посилання відкриття характеристик
+    ---
+    🎯 **Вимоги**:
+    - Перевага надається **стабільним класам** або ID (без модифікаторів стану чи кольору).
+    - ❌ Не використовуй селектори з модифікаторами стану (наприклад, `green`, `red`, `disabled`)
+    - ❌ Не використовуй теги специфічних компонентів (наприклад, `<rz-stars-rating-progress>`) — лише класи або атрибути дочірніх HTML-елементів.
+    - 🔍 Селектори повинні бути **мінімальними, точними і придатними для Playwright**.
+    - Уникай занадто загальних або динамічних класів (типу `.ng-star-inserted`, `.active`, `.selected`).
+    Поверни **лише об’єкт JSON** без пояснень чи коментарів.
+    """
+
+SEARCH_SELECTORS_PROMPT = """
+    Проаналізуй HTML-сторінку результатів пошуку та надай CSS-селектори, за якими посилання на товари можна витягувати локально, без повторного аналізу. Очікується об'єкт такого формату:
+    {
+    "item_selector": "CSS selector for a single product card in the main search results",
+    "link_selector": "CSS selector for the product link inside the card (relative to the card)",
+    "link_attribute": "attribute that contains the product URL",
+    "next_page_selector": "CSS selector for the link to the next page of search results"
+    }
+    🔹 **item_selector** — картка одного товару в головному блоці результатів пошуку
+    🔹 **link_selector** — посилання на сторінку товару всередині картки (відносно картки); порожній рядок, якщо посиланням є сама картка
+    🔹 **link_attribute** — атрибут з URL сторінки товару (зазвичай `href`)
+    🔹 **next_page_selector** — посилання `<a>` на наступну сторінку результатів пошуку (з атрибутом `href`); порожній рядок, якщо пагінації немає
+    ---
+    🎯 **Вимоги**:
+    - item_selector повинен знаходити **лише картки головного блоку результатів пошуку** — без банерів, реклами, рекомендованих товарів і каруселей.
+    - Порядок елементів, знайдених за item_selector, повинен збігатися з позиціями товарів у результатах пошуку.
+    - Перевага надається **стабільним класам** або атрибутам (без модифікаторів стану).
+    - Уникай занадто загальних або динамічних класів (типу `.ng-star-inserted`, `.active`, `.selected`).
+    Поверни **лише об’єкт JSON** без пояснень чи коментарів.
+    """
+
+CHARACTERISTICS_PROMPT = """
+    Проаналізуй HTML-сторінку та витягни всі доступні характеристики продукту, які представлені у форматі 'назва: значення'. Сформуй JSON-об’єкт у такому вигляді:
+    {
+    "characteristics": [
+        {
+        "name": "Назва характеристики 1",
+        "value": "Значення характеристики 1"
+        },
+        {
+        "name": "Назва характеристики 2",
+        "value": "Значення характеристики 2"
+        },
+        ...
+    ]
+    }
+    🔹 **name** — це назва або етикетка характеристики (наприклад, 'Колір', 'Об'єм пам'яті', 'Тип матриці').
+    🔹 **value** — це відповідне значення характеристики (наприклад, 'Чорний', '256 ГБ', 'IPS').
+    ---
+    🎯 **Вимоги до вибірки**:
+    - Зосередься виключно на блоках, що містять перелік технічних характеристик, специфікацій або детальних параметрів продукту.
+    - Ігноруй будь-яку іншу інформацію: загальні описи продукту, рекламні блоки, відгуки, умови доставки, рекомендації тощо.
+    - Вибирай тільки **активні та видимі** характеристики.
+    - Переконайся, що кожна характеристика має як **назву**, так і **значення**, і що вони точно відповідають одна одній.
+    ---
+    📌 Поверни **ЛИШЕ ОБ'ЄКТ JSON** без будь-яких додаткових пояснень, коментарів чи іншого тексту. Збережи формат JSON валідним.
+    """
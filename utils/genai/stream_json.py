@@ -0,0 +1,68 @@
+import json
+import logging
+import re
+from typing import Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class JsonArrayItemParser:
+    """
+    Виділяє елементи-об'єкти масиву `field` з JSON, що надходить частинами
+    (потокова відповідь Gemini). Кожен об'єкт повертається з `feed`, щойно
+    з'явилась його закриваюча дужка, не чекаючи кінця всієї відповіді.
+    """
+
+    def __init__(self, field: str):
+        self.field_re = re.compile(rf'"{re.escape(field)}"\s*:\s*\[')
+        self.text = ""
+        self.finished = False
+
+        self._position: Optional[int] = None
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._item_start = 0
+
+    def feed(self, chunk: str) -> List[Any]:
+        self.text += chunk
+        if self._position is None:
+            match = self.field_re.search(self.text)
+            if match is None:
+                return []
+            self._position = match.end()
+
+        items: List[Any] = []
+        text = self.text
+        position = self._position
+        while position < len(text) and not self.finished:
+            char = text[position]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                if self._depth == 0:
+                    self._item_start = position
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._append_item(items, text[self._item_start : position + 1])
+            elif char == "]" and self._depth == 0:
+                self.finished = True
+            position += 1
+
+        self._position = position
+        return items
+
+    def _append_item(self, items: List[Any], raw: str) -> None:
+        try:
+            items.append(json.loads(raw))
+        except ValueError as e:
+            logger.info("Skipping malformed streamed JSON item: %s", e)
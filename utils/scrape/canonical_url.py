@@ -0,0 +1,61 @@
+import re
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+TRACKING_PARAMS = (
+    "utm_*",
+    "gclid",
+    "gbraid",
+    "wbraid",
+    "fbclid",
+    "yclid",
+    "msclkid",
+    "_ga",
+    "_gl",
+    "ref",
+    "ref_",
+)
+
+
+def canonical_url(url: str, rules: Optional[dict] = None) -> str:
+    """
+    Канонічна форма URL сторінки товару: без фрагмента, кінцевого слеша і
+    параметрів відстеження, з рештою параметрів у відсортованому порядку,
+    зі схемою і хостом у нижньому регістрі.
+
+    `rules` — правила платформи (`Platform.canonical_url_rules`):
+    `keep_params` залишає лише перелічені параметри, `drop_params` додає
+    параметри до відкинутих (`*` у кінці — префікс), `strip_www` прибирає
+    `www.` з хоста, а `path_pattern` скорочує шлях до збігу з регулярним
+    виразом (наприклад, `^/p/\\d+` для сторінок, що відрізняються лише slug).
+    """
+    rules = rules or {}
+    parts = urlsplit(url.strip())
+
+    netloc = parts.netloc.lower()
+    if rules.get("strip_www"):
+        netloc = netloc.removeprefix("www.")
+
+    path = parts.path
+    if rules.get("path_pattern"):
+        match = re.search(rules["path_pattern"], path)
+        if match:
+            path = match.group(0)
+    path = path.rstrip("/") or "/"
+
+    keep = rules.get("keep_params")
+    drop = TRACKING_PARAMS + tuple(rules.get("drop_params") or ())
+    params = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if (name in keep if keep is not None else not _matches(name, drop))
+    )
+    return urlunsplit((parts.scheme.lower(), netloc, path, urlencode(params), ""))
+
+
+def _matches(name: str, patterns: tuple) -> bool:
+    name = name.lower()
+    return any(
+        name.startswith(pattern[:-1]) if pattern.endswith("*") else name == pattern
+        for pattern in patterns
+    )
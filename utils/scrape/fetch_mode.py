@@ -0,0 +1,57 @@
+import datetime
+from typing import Optional
+
+FETCH_MODE_HTTP = "http"
+FETCH_MODE_BROWSER = "browser"
+
+
+class FetchModeTracker:
+    """
+    Вирішує для платформи, чи можна брати сторінки товарів простим HTTP-запитом
+    без браузера. Рахує успішні HTTP-спроби за запуск; платформа, позначена як
+    `browser`, повторно перевіряється через `recheck_after`.
+    """
+
+    def __init__(
+        self,
+        mode: Optional[str],
+        checked_at: Optional[datetime.datetime],
+        recheck_after: datetime.timedelta,
+        min_pages: int,
+        min_success_rate: float,
+    ):
+        self.mode = mode
+        self.checked_at = checked_at
+        self.recheck_after = recheck_after
+        self.min_pages = min_pages
+        self.min_success_rate = min_success_rate
+        self.attempts = 0
+        self.successes = 0
+
+    @property
+    def try_http(self) -> bool:
+        if (
+            self.attempts >= self.min_pages
+            and self.successes / self.attempts < self.min_success_rate
+        ):
+            return False
+        if self.mode != FETCH_MODE_BROWSER:
+            return True
+        if self.checked_at is None:
+            return True
+        now = datetime.datetime.now(datetime.timezone.utc)
+        return now - self.checked_at >= self.recheck_after
+
+    def add(self, http_ok: bool) -> None:
+        self.attempts += 1
+        self.successes += int(http_ok)
+
+    def decide(self) -> Optional[str]:
+        """
+        Новий режим для збереження або None, якщо спроб замало для рішення.
+        """
+        if self.attempts < self.min_pages:
+            return None
+        if self.successes / self.attempts >= self.min_success_rate:
+            return FETCH_MODE_HTTP
+        return FETCH_MODE_BROWSER
@@ -0,0 +1,45 @@
+from decimal import Decimal
+from typing import Callable, Dict, Optional, Tuple
+
+from models.scraped_product_data import ScrapedProductData
+
+FIELD_CHECKS: Dict[str, Callable[[ScrapedProductData], bool]] = {
+    "title": lambda row: bool(row.name_on_platform),
+    "price": lambda row: row.price != Decimal("0.00"),
+    "rating": lambda row: row.rating > 0,
+    "reviews_count": lambda row: row.reviews_count > 0,
+    "availability": lambda row: row.availability_status != "Невідомо",
+}
+
+REQUIRED_FIELDS = ("title", "price")
+
+
+def has_required_fields(row: ScrapedProductData) -> bool:
+    return all(FIELD_CHECKS[field](row) for field in REQUIRED_FIELDS)
+
+
+class FillRateCounter:
+    """
+    Накопичує частку заповнення полів по мірі надходження рядків, щоб не
+    тримати всі рядки запуску в пам'яті.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.complete_rows = 0
+        self.filled: Dict[str, int] = {field: 0 for field in FIELD_CHECKS}
+
+    def add(self, row: ScrapedProductData) -> None:
+        self.rows += 1
+        filled = {field: check(row) for field, check in FIELD_CHECKS.items()}
+        for field, is_filled in filled.items():
+            self.filled[field] += int(is_filled)
+        if all(filled[field] for field in REQUIRED_FIELDS):
+            self.complete_rows += 1
+
+    def rates(self) -> Tuple[Optional[float], Optional[Dict[str, float]]]:
+        if not self.rows:
+            return None, None
+        return self.complete_rows / self.rows, {
+            field: count / self.rows for field, count in self.filled.items()
+        }
@@ -0,0 +1,45 @@
+import asyncio
+from typing import AsyncIterator, Iterable, TypeVar
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+async def read_ahead(items: AsyncIterator[T]) -> AsyncIterator[T]:
+    """
+    Читає `items` у фоновій задачі, тож джерело (наприклад, потокова відповідь
+    Gemini) продовжує надходити, поки споживач зайнятий іншим.
+    Помилка джерела піднімається у споживача після вже прочитаних елементів.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def pump() -> None:
+        try:
+            async for item in items:
+                queue.put_nowait(item)
+        except Exception as e:
+            queue.put_nowait(e)
+        finally:
+            queue.put_nowait(_DONE)
+
+    task = asyncio.create_task(pump())
+    try:
+        while (item := await queue.get()) is not _DONE:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+async def iterate(items: Iterable[T]) -> AsyncIterator[T]:
+    for item in items:
+        yield item
+
+
+async def prepend(first: T, items: AsyncIterator[T]) -> AsyncIterator[T]:
+    yield first
+    async for item in items:
+        yield item